@@ -0,0 +1,5 @@
+"""
+Benchmark Suites
+Headless, fixed-seed benchmarks that emit JSON for comparison across commits.
+Run from the repository root, e.g. `python -m benchmarks.simulation`.
+"""
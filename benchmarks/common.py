@@ -0,0 +1,107 @@
+"""
+Benchmark Harness Module for Snake Gen v12.0
+Timing, temporary config overrides and JSON reports shared by the suites.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(fn, min_seconds=0.5, min_calls=3):
+    """Call fn until both minimums are met and summarize the per-call times."""
+    samples = []
+    start = time.perf_counter()
+    while len(samples) < min_calls or time.perf_counter() - start < min_seconds:
+        call_start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - call_start)
+    return summarize(samples)
+
+
+def summarize(samples):
+    """Rate, mean, median and p95 of a list of durations in seconds."""
+    samples = np.asarray(samples)
+    return {
+        "calls": int(samples.size),
+        "seconds": float(samples.sum()),
+        "per_second": float(samples.size / samples.sum()) if samples.sum() else None,
+        "mean_ms": float(samples.mean() * 1000),
+        "median_ms": float(np.median(samples) * 1000),
+        "p95_ms": float(np.percentile(samples, 95) * 1000),
+    }
+
+
+@contextmanager
+def overrides(settings, **values):
+    """Temporarily replace keys of a config dict such as AI_CONFIG."""
+    previous = {key: settings[key] for key in values}
+    settings.update(values)
+    try:
+        yield settings
+    finally:
+        settings.update(previous)
+
+
+def git_commit():
+    """Short hash of HEAD, suffixed with '+dirty' for uncommitted changes."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + "+dirty" if status.strip() else commit
+
+
+def environment():
+    """Where the numbers came from, so reports can be compared fairly."""
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def argument_parser(description):
+    """Parser with the options every suite shares."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Root seed for every random stream in the suite")
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="Minimum seconds spent timing each case")
+    parser.add_argument("--output", metavar="FILE", default=None,
+                        help="Write the JSON report to FILE instead of stdout")
+    return parser
+
+
+def emit_report(suite, args, results):
+    """Write one suite's results as JSON, to args.output or to stdout."""
+    report = {
+        "suite": suite,
+        "environment": environment(),
+        "arguments": vars(args),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as report_file:
+            report_file.write(text + "\n")
+        print(f"Wrote {suite} benchmark report to {args.output}", file=sys.stderr)
+    return report
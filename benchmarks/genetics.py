@@ -0,0 +1,144 @@
+"""
+Genetic Operator Benchmark Module for Snake Gen v12.0
+Cost of each selection, crossover and mutation operator, and what each strategy mix buys in training.
+"""
+
+import time
+
+import numpy as np
+
+from src.game.config import AI_CONFIG
+from src.core.evaluation import evaluate_population
+from src.core.snake_ai import (SnakeAI, SELECTION_METHODS, CROSSOVER_METHODS, tournament_selection,
+                               rank_based_selection, roulette_wheel_selection, uniform_crossover,
+                               multi_point_crossover, single_point_crossover, adaptive_mutation,
+                               calculate_population_diversity, evolve_snakes)
+from src.utils.seeding import create_root_sequence, spawn_generators
+from .common import argument_parser, emit_report, measure, overrides
+
+
+POPULATION_SIZES = (10, 100, 1000, 10000)
+GENOME_SIZES = (9, 15)
+# calculate_population_diversity compares every pair, so larger populations take minutes per call
+MAX_DIVERSITY_POPULATION = 1000
+
+
+def synthetic_population(size, genome_size, seed):
+    """Snakes with random genomes and a spread of finished-episode statistics."""
+    rng = np.random.default_rng(seed)
+    snakes = []
+    for unit_rng in spawn_generators(create_root_sequence(seed), size):
+        snake = SnakeAI(brain=rng.uniform(-1.5, 1.5, genome_size), rng=unit_rng)
+        snake.alive = False
+        snake.length = int(rng.integers(0, 30))
+        snake.moves_made = int(rng.integers(1, 2000))
+        snake.ticks_since_food = int(rng.integers(0, 300))
+        snake.score = snake.length * 50 + snake.moves_made * 0.1
+        snake.fitness_score = snake.fitness_function()
+        snakes.append(snake)
+    return snakes
+
+
+def bench_selection(snakes, min_seconds, rng):
+    """Time one parent pick of each selection method, as evolve_snakes calls them."""
+    tournament_pool = snakes[:max(10, len(snakes) // 2)]
+    return {
+        "tournament": measure(lambda: tournament_selection(tournament_pool, rng=rng), min_seconds),
+        "rank": measure(lambda: rank_based_selection(snakes, rng=rng), min_seconds),
+        "roulette": measure(lambda: roulette_wheel_selection(snakes, rng=rng), min_seconds),
+    }
+
+
+def bench_variation(genome_size, min_seconds, rng):
+    """Time each crossover and the adaptive mutation on one pair of genomes."""
+    parent1, parent2 = rng.uniform(-1.5, 1.5, (2, genome_size))
+    return {
+        "uniform": measure(lambda: uniform_crossover(parent1, parent2, rng=rng), min_seconds),
+        "multi_point": measure(lambda: multi_point_crossover(parent1, parent2, rng=rng), min_seconds),
+        "single_point": measure(lambda: single_point_crossover(parent1, parent2, rng=rng), min_seconds),
+        "adaptive_mutation": measure(lambda: adaptive_mutation(parent1, [1.0, 2.0], 0.8, rng=rng),
+                                     min_seconds),
+    }
+
+
+def strategy_mixes():
+    """Name -> (selection_probs, crossover_methods): the standard mix, then each pure pairing."""
+    mixes = {"standard": (None, CROSSOVER_METHODS)}
+    for selection in SELECTION_METHODS:
+        for crossover in CROSSOVER_METHODS:
+            mixes[f"{selection}+{crossover}"] = ({selection: 1.0}, (crossover,))
+    return mixes
+
+
+def train(selection_probs, crossover_methods, population, generations, seed):
+    """A short headless training run; every mix starts from the same population and episode seeds."""
+    initial_sequence, *generation_sequences = create_root_sequence(seed).spawn(generations)
+    snakes = [SnakeAI(rng=rng) for rng in spawn_generators(initial_sequence, population)]
+    best_fitness = []
+    evaluation_seconds = operator_seconds = 0.0
+    for generation in range(generations):
+        start = time.process_time()
+        evaluate_population(snakes)
+        evaluation_seconds += time.process_time() - start
+        best_fitness.append(max(s.fitness_function() for s in snakes))
+        if generation == generations - 1:
+            break
+
+        start = time.process_time()
+        snakes = evolve_snakes(snakes, best_fitness[-2:], generation_sequences[generation],
+                               selection_probs, crossover_methods)
+        operator_seconds += time.process_time() - start
+    return {
+        "best_fitness": max(best_fitness),
+        "final_best_fitness": best_fitness[-1],
+        "best_fitness_by_generation": best_fitness,
+        "cpu_seconds": evaluation_seconds + operator_seconds,
+        "evaluation_cpu_seconds": evaluation_seconds,
+        "operator_cpu_seconds": operator_seconds,
+    }
+
+
+def main():
+    parser = argument_parser("Genetic operator cost and strategy-mix quality benchmark")
+    parser.add_argument("--populations", type=int, nargs="+", default=list(POPULATION_SIZES),
+                        help="Population sizes for the operator timings")
+    parser.add_argument("--genome-sizes", type=int, nargs="+", default=list(GENOME_SIZES),
+                        help="Genome sizes for the operator timings")
+    parser.add_argument("--max-diversity-population", type=int, default=MAX_DIVERSITY_POPULATION,
+                        help="Largest population for which diversity and evolve_snakes are timed")
+    parser.add_argument("--train-population", type=int, default=12,
+                        help="Snakes per generation in each training run")
+    parser.add_argument("--train-generations", type=int, default=4,
+                        help="Generations in each training run")
+    parser.add_argument("--max-ticks", type=int, default=100,
+                        help="Tick budget per episode in the training runs")
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    populations = []
+    for size in args.populations:
+        for genome_size in args.genome_sizes:
+            snakes = synthetic_population(size, genome_size, args.seed)
+            case = {"population": size, "genome_size": genome_size,
+                    "selection": bench_selection(snakes, args.min_time, rng)}
+            if size <= args.max_diversity_population:
+                case["diversity"] = measure(lambda: calculate_population_diversity(snakes), args.min_time)
+                generation_sequence = create_root_sequence(args.seed)
+                case["evolve_snakes"] = measure(lambda: evolve_snakes(snakes, [1.0, 2.0], generation_sequence),
+                                                args.min_time)
+            populations.append(case)
+
+    variation = [{"genome_size": genome_size, **bench_variation(genome_size, args.min_time, rng)}
+                 for genome_size in args.genome_sizes]
+
+    with overrides(AI_CONFIG, MAX_EPISODE_TICKS=args.max_ticks, MAX_EPISODE_SECONDS=None):
+        training = [{"mix": name, "selection": selection_probs, "crossover": list(crossover_methods),
+                     **train(selection_probs, crossover_methods, args.train_population,
+                             args.train_generations, args.seed)}
+                    for name, (selection_probs, crossover_methods) in strategy_mixes().items()]
+
+    emit_report("genetics", args, {"populations": populations, "variation": variation, "training": training})
+
+
+if __name__ == "__main__":
+    main()
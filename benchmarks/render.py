@@ -0,0 +1,142 @@
+"""
+Render Benchmark Module for Snake Gen v12.0
+Milliseconds per frame of each drawing component, headless through the SDL dummy driver.
+"""
+
+import os
+
+# Must be set before pygame opens a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Keep pygame's import banner out of the JSON report on stdout
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+import main as snake_gen
+from src.app import bootstrap
+from src.core.history import GenerationHistory
+from src.core.snake_ai import SnakeAI
+from src.interfaces import gameplay_interface, manual_gameplay, menu
+from src.interfaces.level_of_detail import effect_quality
+from .common import argument_parser, emit_report, measure
+from .simulation import board_cells
+
+
+POPULATION_SIZES = (1, 20, 100, 500)
+SNAKE_LENGTHS = (1, 20, 100)
+HISTORY_GENERATIONS = 40
+
+
+def synthetic_population(size, length, seed):
+    """Alive snakes of the given length scattered over the board with fixed seeds."""
+    rng = np.random.default_rng(seed)
+    cells = board_cells()
+    snakes = []
+    for unit_seed in rng.integers(2 ** 32, size=size):
+        snake = SnakeAI(rng=np.random.default_rng(unit_seed))
+        start = int(rng.integers(len(cells) - length))
+        trail = cells[start:start + length + 1]
+        snake.snake = trail[::-1]
+        snake.occupied = set(trail)
+        snake.length = length
+        snake.score = 50.0 * length
+        snake.food = snake.spawn_food()
+        snakes.append(snake)
+    return snakes
+
+
+def synthetic_history(root_dir, seed):
+    """A training history with HISTORY_GENERATIONS rows for the generations panel."""
+    rng = np.random.default_rng(seed)
+    history = GenerationHistory(root_dir=root_dir)
+    history.start_run("benchmark")
+    history.extend({"best_length": np.cumsum(rng.integers(0, 4, HISTORY_GENERATIONS)).tolist(),
+                    "best_fitness": rng.uniform(0, 1000, HISTORY_GENERATIONS).tolist()})
+    return history
+
+
+def bench_population(screen, snakes, history, min_seconds):
+    """Per-component ms/frame for one population, plus the full dirty-rect frame."""
+    start_time = time.time()
+    best_score, best_length, avg_length, elapsed = gameplay_interface.calculate_game_stats(snakes, start_time)
+    components = {
+        "draw_monitoring_hud": lambda: gameplay_interface.draw_monitoring_hud(
+            screen, best_score, best_length, avg_length, elapsed, snakes),
+        "draw_neural_monitoring_panel": lambda: gameplay_interface.draw_neural_monitoring_panel(
+            screen, history, snakes),
+        "draw_enhanced_game_area": lambda: gameplay_interface.draw_enhanced_game_area(screen, snakes),
+        "draw_enhanced_ai_units": lambda: gameplay_interface.draw_enhanced_ai_units(screen, snakes),
+        "draw_enhanced_ai_units_flat": lambda: gameplay_interface.draw_enhanced_ai_units(screen, snakes, set()),
+    }
+    results = {name: measure(draw, min_seconds) for name, draw in components.items()}
+
+    # The whole frame as training draws it, with level of detail and quality adapting
+    gameplay_interface.frame_renderer.invalidate()
+    results["draw_game"] = measure(lambda: gameplay_interface.draw_game(
+        screen, snakes, start_time, history, current_generation=len(history)), min_seconds)
+    results["draw_game"]["full_detail_units"] = gameplay_interface.unit_detail.full_detail
+    results["draw_game"]["effect_quality"] = effect_quality.label
+    return results
+
+
+def bench_screens(screen, min_seconds):
+    """Per-frame cost of the full-window screens that do not depend on the population."""
+    snake = synthetic_population(1, 20, 0)[0]
+    snake.termination_reason = "collision"
+    screens = {
+        "draw_monitoring_background": lambda: gameplay_interface.draw_monitoring_background(screen),
+        "draw_menu": menu.draw_menu,
+        "draw_futuristic_game_over": lambda: manual_gameplay.draw_futuristic_game_over(snake, 12.5),
+        "draw_pretrained_game_over": lambda: snake_gen.draw_pretrained_game_over(snake, 12.5),
+    }
+    return {name: measure(draw, min_seconds) for name, draw in screens.items()}
+
+
+def reset_adaptive_detail():
+    """Start every case at full detail and HIGH quality so cases do not leak into each other."""
+    effect_quality.level = 0
+    effect_quality.samples.clear()
+    gameplay_interface.unit_detail.full_detail = gameplay_interface.unit_detail.max_full_detail
+    gameplay_interface.unit_detail.samples.clear()
+
+
+def main():
+    parser = argument_parser("Per-component rendering benchmark on the SDL dummy video driver")
+    parser.add_argument("--populations", type=int, nargs="+", default=list(POPULATION_SIZES),
+                        help="Population sizes to draw")
+    parser.add_argument("--lengths", type=int, nargs="+", default=list(SNAKE_LENGTHS),
+                        help="Snake lengths to draw")
+    args = parser.parse_args()
+
+    screen = snake_gen.screen = bootstrap()
+    history_dir = tempfile.mkdtemp(prefix="snake-render-bench-")
+    try:
+        history = synthetic_history(history_dir, args.seed)
+        reset_adaptive_detail()
+        screens = bench_screens(screen, args.min_time)
+        populations = []
+        for size in args.populations:
+            for length in args.lengths:
+                reset_adaptive_detail()
+                snakes = synthetic_population(size, length, args.seed)
+                populations.append({"population": size, "length": length,
+                                    "components": bench_population(screen, snakes, history, args.min_time)})
+        history.close()
+    finally:
+        shutil.rmtree(history_dir, ignore_errors=True)
+
+    emit_report("render", args, {
+        "video_driver": os.environ["SDL_VIDEODRIVER"],
+        "window_size": list(screen.get_size()),
+        "screens": screens,
+        "populations": populations,
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Simulation Benchmark Module for Snake Gen v12.0
+SnakeAI decisions/sec by lookahead depth, brain size and length, plus episode throughput.
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.game.config import AI_CONFIG, CELL_SIZE, GAME_AREA_X, GAME_AREA_Y, GAME_AREA_WIDTH, GAME_AREA_HEIGHT
+from src.core.snake_ai import SnakeAI
+from src.utils.seeding import create_root_sequence, spawn_generators
+from .common import argument_parser, emit_report, measure, overrides
+
+
+LOOKAHEAD_DEPTHS = (1, 2, 3)
+BRAIN_SIZES = (9, 15)
+SNAKE_LENGTHS = (1, 50, 200)
+
+
+def board_cells():
+    """Every cell of the game area in boustrophedon order, row by row from the top."""
+    columns = GAME_AREA_WIDTH // CELL_SIZE
+    rows = GAME_AREA_HEIGHT // CELL_SIZE
+    cells = []
+    for row in range(rows):
+        order = range(columns) if row % 2 == 0 else reversed(range(columns))
+        cells.extend((GAME_AREA_X + column * CELL_SIZE, GAME_AREA_Y + row * CELL_SIZE)
+                     for column in order)
+    return cells
+
+
+def make_snake(length, brain_size, seed):
+    """A fixed-seed snake whose head sits at the board center with length+1 body cells
+    winding back through the rows above it."""
+    snake = SnakeAI(rng=np.random.default_rng(seed), use_enhanced_network=brain_size == 15)
+    cells = board_cells()
+    head_index = cells.index(snake.snake[0])
+    if length > head_index:
+        raise ValueError(f"length {length} does not fit behind the center cell ({head_index} max)")
+    trail = cells[head_index - length:head_index + 1]  # tail first, head last
+    snake.snake = trail[::-1]
+    snake.occupied = set(trail)
+    snake.previous_positions = list(trail)
+    snake.length = length
+    snake.direction = ((trail[-1][0] - trail[-2][0]) // CELL_SIZE,
+                       (trail[-1][1] - trail[-2][1]) // CELL_SIZE) if length else (1, 0)
+    snake.food = snake.spawn_food()
+    return snake
+
+
+def bench_decisions(depth, brain_size, length, seed, min_seconds):
+    """Time choose_direction with the lookahead pinned to depth."""
+    snake = make_snake(length, brain_size, seed)
+    # A zero threshold makes get_lookahead_depth return the base depth at any length
+    with overrides(AI_CONFIG, LOOKAHEAD_DEPTH_BASE=depth, LOOKAHEAD_DEPTH_THRESHOLD=0):
+        stats = measure(snake.choose_direction, min_seconds)
+    return {"depth": depth, "brain_size": brain_size, "length": length, **stats}
+
+
+def play_episodes(population, seed):
+    """Play fixed-seed episodes to the end; returns (steps, finished snakes)."""
+    steps = 0
+    snakes = [SnakeAI(rng=rng) for rng in spawn_generators(create_root_sequence(seed), population)]
+    for snake in snakes:
+        while snake.alive:
+            snake.move()
+            steps += 1
+    return steps, snakes
+
+
+def bench_episodes(population, max_ticks, seed):
+    """Full-episode steps/sec, then a traced replay of the same episodes for peak memory."""
+    with overrides(AI_CONFIG, MAX_EPISODE_TICKS=max_ticks, MAX_EPISODE_SECONDS=None):
+        start = time.perf_counter()
+        steps, snakes = play_episodes(population, seed)
+        elapsed = time.perf_counter() - start
+
+        # Tracing slows the replay down, so it is kept out of the timed run
+        tracemalloc.start()
+        play_episodes(population, seed)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "population": population,
+        "max_ticks": max_ticks,
+        "steps": steps,
+        "seconds": elapsed,
+        "steps_per_second": steps / elapsed if elapsed else None,
+        "peak_memory_kb": peak_bytes / 1024,
+        # Identical for identical code and seeds; a change flags altered behaviour
+        "fitness_checksum": round(sum(s.fitness_score for s in snakes), 6),
+    }
+
+
+def main():
+    parser = argument_parser("SnakeAI decision and episode throughput benchmark")
+    parser.add_argument("--depths", type=int, nargs="+", default=list(LOOKAHEAD_DEPTHS),
+                        help="Lookahead depths to time")
+    parser.add_argument("--lengths", type=int, nargs="+", default=list(SNAKE_LENGTHS),
+                        help="Snake lengths to time")
+    parser.add_argument("--episodes", type=int, default=10,
+                        help="Episodes played for the throughput and memory run")
+    parser.add_argument("--max-ticks", type=int, default=200,
+                        help="Tick budget per episode in the throughput run")
+    args = parser.parse_args()
+
+    decisions = [bench_decisions(depth, brain_size, length, args.seed, args.min_time)
+                 for depth in args.depths
+                 for brain_size in BRAIN_SIZES
+                 for length in args.lengths]
+    episodes = bench_episodes(args.episodes, args.max_ticks, args.seed)
+    emit_report("simulation", args, {"decisions": decisions, "episodes": episodes})
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,45 @@
+from src.app import bootstrap
 from src.interfaces.menu import menu_screen
 from src.interfaces.manual_gameplay import run_manual_mode
 from src.core.snake_manual import ManualKeysSnake
-from src.core.snake_ai import SnakeAI, evolve_snakes, log_and_print
+from src.core.snake_ai import SnakeAI, evolve_snakes, TRUNCATION_REASONS
+from src.core.evaluation import evaluate_population
+from src.core.history import GenerationHistory, check_convergence
+from src.utils.online_stats import PopulationStats
+from src.utils.phase_timer import phase_timer
+from src.game.timestep import SimulationSpeed, parse_speed
+from src.game.simulation_thread import SimulationThread, render_until_finished
+from src.utils.training_log import format_record
 from src.interfaces.training_interface import get_training_parameters, show_pretrained_models
-from src.interfaces.gameplay_interface import draw_game
+from src.interfaces.gameplay_interface import draw_game, frame_renderer
+from src.interfaces.screen_loop import ScreenLoop
 from src.interfaces.ui_components import *
+from src.interfaces.fonts import load_retro_font
 from src.game.game_modes import (handle_manual_mode, handle_training_mode, 
                                 handle_pretrained_mode, handle_quit_mode)
 import pygame
-import random
 import numpy as np
 import time
 import sys
+import argparse
 from src.game.config import *
 
-sys.stdout.reconfigure(encoding='utf-8')
-# Initialize Pygame
-pygame.init()
-
 # All constants now imported from config.py
 
-# Screen Configurations
-screen = pygame.display.set_mode(
-    (WIDTH + SIDE_BAR_WIDTH, HEIGHT + TOP_BAR_HEIGHT))
-pygame.display.set_caption("Gen Snake")
+# Window surface and frame clock (the window is opened by bootstrap() at startup)
+screen = None
 clock = pygame.time.Clock()
 
-# Font setup
-font = pygame.font.SysFont(None, 30)
-
-background_image = pygame.image.load(BACKGROUND_IMAGE_PATH)
-
-# Set screen reference for training interface
-from src.interfaces import training_interface
-training_interface.screen = screen
-
 # Global Time Tracker for Generations
 generation_start_time = time.time()
-best_score_overall = 0
-best_length_overall = 0
-# Track learning metrics across generations
-generation_fitness = []
-generation_avg_fitness = []
-generation_lengths = []
-generation_avg_lengths = []
+# Session-wide bests and truncation count (saved in training checkpoints)
+training_totals = {"best_score": 0, "best_length": 0, "truncated_episodes": 0}
+# Track learning metrics across generations (columnar, memory-mapped per run)
+training_history = GenerationHistory()
+# Command-line training options (seed for reproducible runs, worker processes)
+training_options = {"seed": None, "workers": 1, "resume": None}
+# Simulation ticks per rendered frame (keys 1-4 / TAB change it live)
+sim_speed = SimulationSpeed()
 
 
 
@@ -66,146 +62,143 @@ def draw_snake_length_visualization():
 # draw_game function moved to gameplay_interface.py
 
 
-def check_convergence(generation_fitness, generation_avg_fitness, window_size=5):
-    """Check if the population has converged based on fitness stability."""
-    if len(generation_fitness) < window_size:
-        return False, 0.0
-    
-    # Check fitness improvement over recent generations
-    recent_best = generation_fitness[-window_size:]
-    recent_avg = generation_avg_fitness[-window_size:]
-    
-    # Calculate variance in recent generations
-    best_variance = np.var(recent_best)
-    avg_variance = np.var(recent_avg)
-    
-    # Calculate improvement rate
-    if len(generation_fitness) > 1:
-        improvement_rate = (generation_fitness[-1] - generation_fitness[-window_size]) / generation_fitness[-window_size]
-    else:
-        improvement_rate = 1.0
-    
-    # Convergence criteria
-    has_converged = (
-        best_variance < 10.0 and  # Low variance in best fitness
-        avg_variance < 20.0 and    # Low variance in average fitness
-        abs(improvement_rate) < 0.05  # Less than 5% improvement
-    )
-    
-    return has_converged, improvement_rate
-
+def calculate_performance_metrics(snakes, population_stats=None):
+    """Calculate comprehensive performance metrics for the current generation.
 
-def calculate_performance_metrics(snakes):
-    """Calculate comprehensive performance metrics for the current generation."""
-    metrics = {}
+    population_stats is the accumulator fed as each snake died; without it
+    the whole population is folded in here.
+    """
+    if population_stats is None:
+        population_stats = PopulationStats()
+        population_stats.extend(snakes)
     
-    # Basic statistics
-    fitnesses = [s.fitness_function() for s in snakes]
-    lengths = [s.length for s in snakes]
-    scores = [s.score for s in snakes]
-    
-    metrics['best_fitness'] = max(fitnesses) if fitnesses else 0
-    metrics['avg_fitness'] = np.mean(fitnesses) if fitnesses else 0
-    metrics['std_fitness'] = np.std(fitnesses) if fitnesses else 0
-    metrics['best_length'] = max(lengths) if lengths else 0
-    metrics['avg_length'] = np.mean(lengths) if lengths else 0
-    metrics['best_score'] = max(scores) if scores else 0
-    metrics['avg_score'] = np.mean(scores) if scores else 0
+    # Fitness, length, score, success rate and termination reasons in one pass
+    metrics = population_stats.summary()
     
     # Population diversity
     from src.core.snake_ai import calculate_population_diversity
     metrics['diversity'] = calculate_population_diversity(snakes)
     
-    # Success rate (snakes that collected at least one food)
-    successful_snakes = sum(1 for s in snakes if s.length > 0)
-    metrics['success_rate'] = successful_snakes / len(snakes) if snakes else 0
+    # Episode termination reasons (budget truncations vs. real deaths)
+    metrics['truncated'] = sum(metrics['termination_reasons'].get(r, 0) for r in TRUNCATION_REASONS)
     
     return metrics
 
 
-def run_generation(snakes, generation_num=1):
-    global generation_start_time, best_score_overall, best_length_overall
-    generation_start_time = time.time()
-    running = True
+def generation_phases(phases):
+    """Add the derived "step" phase: a move's time outside its decision.
 
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                return snakes
+    Only derived when both were timed in this process; headless runs decide
+    in worker processes, whose timings are not collected.
+    """
+    if "move" in phases and "decision" in phases:
+        decision_seconds = phases["decision"]["total_seconds"]
+        phases["step"] = {"count": phases["move"]["count"],
+                          "total_seconds": max(phases["move"]["total_seconds"] - decision_seconds, 0.0)}
+    return phases
 
-        alive_snakes = [s for s in snakes if s.alive]
-        if not alive_snakes:
-            break  # Stop the generation if all snakes are dead
 
+def run_generation(snakes, generation_num=1, seed_sequence=None, executor=None, log_writer=None):
+    global generation_start_time
+    generation_start_time = time.time()
+    running = True
+    population_stats = PopulationStats()
+
+    if executor is not None:
+        # Headless evaluation across worker processes (no live rendering)
+        with phase_timer.phase("events"):
+            pygame.event.pump()
+        # Replace in place so the caller's list holds the played episodes
+        with phase_timer.phase("evaluation"):
+            snakes[:] = evaluate_population(snakes, executor)
+        population_stats.extend(snakes)
+        running = False
+
+    alive_snakes = [s for s in snakes if s.alive]
+    frame_renderer.invalidate()
+
+    def step_population():
+        """Advance every living snake by one tick."""
         for snake in alive_snakes:
-            snake.move()
-
-        draw_game(screen, snakes, generation_start_time, generation_lengths, 
-                  "train_ai", None, clock, generation_num)
+            # Timed as a whole; the decision inside is timed on its own
+            with phase_timer.phase("move"):
+                snake.move()
+            if not snake.alive:
+                population_stats.add(snake)
+        alive_snakes[:] = [s for s in alive_snakes if s.alive]
+
+    tick_timings = {}
+    if running:
+        # Ticks run on the simulation thread; frames draw its latest snapshot
+        simulation = SimulationThread(snakes, step_population, lambda: not alive_snakes, sim_speed)
+        
+        def draw_snapshot(snapshot):
+            with phase_timer.phase("draw_game"):
+                draw_game(screen, snapshot.units, generation_start_time, training_history, 
+                          "train_ai", None, None, generation_num, sim_speed.label)
+            clock.tick(FPS)  # Outside the timed phase, so the frame cap is not counted as drawing
+        
+        if not render_until_finished(simulation, draw_snapshot, sim_speed.handle_event):
+            pygame.quit()
+            return snakes
+        tick_timings = {"tick_interval_seconds": simulation.tick_intervals.mean,
+                        "tick_jitter_seconds": simulation.tick_intervals.std}
+    simulation_seconds = time.time() - generation_start_time
 
     # **Calculate Comprehensive Performance Metrics**
-    metrics = calculate_performance_metrics(snakes)
+    metrics_start = time.time()
+    with phase_timer.phase("metrics"):
+        metrics = calculate_performance_metrics(snakes, population_stats)
+    metrics_seconds = time.time() - metrics_start
     
     # **Update Overall Bests**
-    best_snake = max(snakes, key=lambda s: s.fitness_function(), default=None)
+    best_snake = population_stats.best_snake
     if best_snake is not None:
-        if best_snake.score > best_score_overall:
-            best_score_overall = best_snake.score
-        if best_snake.length > best_length_overall:
-            best_length_overall = best_snake.length
+        training_totals["best_score"] = max(training_totals["best_score"], float(best_snake.score))
+        training_totals["best_length"] = max(training_totals["best_length"], int(best_snake.length))
+    training_totals["truncated_episodes"] += int(metrics['truncated'])
     
     best_weights = best_snake.brain if best_snake else np.zeros(9)
 
-    # **Enhanced Generation Summary with Performance Metrics**
-    log_and_print("=" * 50)
-    log_and_print(f" Generation {generation_num} Summary ")
-    log_and_print("=" * 50)
-    log_and_print(f" Best Fitness Score: {metrics['best_fitness']:.2f}")
-    log_and_print(f" Average Fitness Score: {metrics['avg_fitness']:.2f} (±{metrics['std_fitness']:.2f})")
-    log_and_print(f" Best Length Achieved: {metrics['best_length']}")
-    log_and_print(f" Average Length: {metrics['avg_length']:.2f}")
-    log_and_print(f" Population Diversity: {metrics['diversity']:.3f}")
-    log_and_print(f" Success Rate: {metrics['success_rate']*100:.1f}%")
-    log_and_print("-" * 50)
-    
-    # Handle both 9-parameter and 15-parameter brains
-    if len(best_weights) == 15:
-        log_and_print(" Enhanced Neural Network (15 parameters)")
-        log_and_print(f"  - Hidden Layer Weights: {best_weights[:8]}")
-        log_and_print(f"  - Output Weights: {best_weights[8:12]}")
-        log_and_print(f"  - Biases: {best_weights[12:15]}")
-    else:
-        log_and_print(" Inherited Weights (Brain Parameters)")
-        log_and_print(f"  - Food Bonus Weight: {best_weights[0]:.3f}")
-        log_and_print(f"  - Toward Food Weight: {best_weights[1]:.3f}")
-        log_and_print(f"  - Away Food Penalty: {best_weights[2]:.3f}")
-        log_and_print(f"  - Loop Penalty: {best_weights[3]:.3f}")
-        log_and_print(f"  - Survival Bonus: {best_weights[4]:.3f}")
-        log_and_print(f"  - Wall Penalty: {best_weights[5]:.3f}")
-        log_and_print(f"  - Exploration Bonus: {best_weights[6]:.3f}")
-        log_and_print(f"  - Momentum Bonus: {best_weights[7]:.3f}")
-        log_and_print(f"  - Dead-End Penalty: {best_weights[8]:.3f}")
-    
     # **Check for Convergence**
-    has_converged, improvement_rate = check_convergence(generation_fitness, generation_avg_fitness)
-    if has_converged:
-        log_and_print("-" * 50)
-        log_and_print(f" ⚠ Population appears to have converged (improvement rate: {improvement_rate*100:.1f}%)")
-    
-    log_and_print("=" * 50)
+    has_converged, improvement_rate = check_convergence(training_history)
 
     # **Store Data for Future Analysis**
-    generation_fitness.append(metrics['best_fitness'])
-    generation_avg_fitness.append(metrics['avg_fitness'])
-    generation_lengths.append(metrics['best_length'])
+    training_history.append(metrics)
 
     # **Evolve Snakes for Next Generation**
-    snakes = evolve_snakes(snakes, generation_fitness)
-    return snakes
-
-
-
+    evolve_start = time.time()
+    with phase_timer.phase("evolve"):
+        next_snakes = evolve_snakes(snakes, training_history.last("best_fitness", 2), seed_sequence)
+    evolve_seconds = time.time() - evolve_start
+
+    # **Structured Generation Record (console summary is formatted from it)**
+    record = {
+        "event": "generation",
+        "generation": generation_num,
+        "population": len(snakes),
+        "metrics": metrics,
+        "best_weights": best_weights,
+        "converged": has_converged,
+        "improvement_rate": improvement_rate,
+        "timings": {
+            "simulation_seconds": simulation_seconds,
+            "metrics_seconds": metrics_seconds,
+            "evolve_seconds": evolve_seconds,
+            "generation_seconds": time.time() - generation_start_time,
+            **tick_timings,
+            "phases": generation_phases(phase_timer.take()),
+        },
+    }
+    # Writing this record is timed into the next generation's "logging" phase
+    with phase_timer.phase("logging"):
+        if log_writer is not None:
+            log_writer.write(record)
+        else:
+            for line in format_record(record):
+                print(line)
+
+    return next_snakes
 
 
 # Snake population will be initialized in training mode based on user input
@@ -217,7 +210,7 @@ def show_game_over_screen(snake, mode="manual"):
     font_small = pygame.font.SysFont(None, 30)
 
     # **Game Over Message**
-    game_over_text = font_large.render("Game Over", True, BLACK)
+    game_over_text = render_text(font_large, "Game Over", BLACK)
     screen.blit(game_over_text, (WIDTH // 2 -
                 game_over_text.get_width() // 2, HEIGHT // 3))
 
@@ -231,7 +224,7 @@ def show_game_over_screen(snake, mode="manual"):
 
     stats_start_y = HEIGHT // 2 - 70  # Move stats up
     for i, text in enumerate(stats_text):
-        stat_render = font_small.render(text, True, BLACK)
+        stat_render = render_text(font_small, text, BLACK)
         screen.blit(stat_render, (WIDTH // 2 - stat_render.get_width() // 2, stats_start_y + i * 35))  # Adjust line spacing
 
 
@@ -253,9 +246,9 @@ def show_game_over_screen(snake, mode="manual"):
     pygame.draw.rect(screen, RED, quit_button, border_radius=10)
 
     # **Render Button Text**
-    menu_text = font_small.render("Menu", True, WHITE)
-    replay_text = font_small.render("Replay", True, WHITE)
-    quit_text = font_small.render("Quit", True, WHITE)
+    menu_text = render_text(font_small, "Menu", WHITE)
+    replay_text = render_text(font_small, "Replay", WHITE)
+    quit_text = render_text(font_small, "Quit", WHITE)
 
     screen.blit(menu_text, (menu_button.x + button_width // 2 - menu_text.get_width() // 2,
                             menu_button.y + button_height // 2 - menu_text.get_height() // 2))
@@ -266,9 +259,10 @@ def show_game_over_screen(snake, mode="manual"):
 
     pygame.display.flip()
 
-    # **Wait for User Input**
+    # **Wait for User Input** (nothing animates, so block until there is some)
+    screen_loop = ScreenLoop()
     while True:
-        for event in pygame.event.get():
+        for event in screen_loop.events(animating=False):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -285,92 +279,106 @@ def show_game_over_screen(snake, mode="manual"):
 
 
 
-def show_pretrained_game_over_screen(snake):
-    """Display enhanced pre-trained AI game over screen with futuristic styling."""
-    elapsed_time = round(time.time() - snake.start_time, 2)
+def pretrained_game_over_buttons():
+    """Return the (model select, menu) button rects of the pre-trained game over screen."""
+    total_width = WIDTH + SIDE_BAR_WIDTH
+    total_height = HEIGHT + TOP_BAR_HEIGHT
+    
+    # Enhanced button system with holographic styling
+    model_select_width = 220  # Much wider button for MODEL SELECT text
+    menu_button_width = 140   # Standard width for MENU
+    button_height = 50
+    button_spacing = 30
+    
+    # Calculate button positions centered on total screen with different widths
+    total_button_width = model_select_width + menu_button_width + button_spacing
+    start_x = (total_width - total_button_width) // 2
+    button_y = total_height // 2 + 80
+    
+    # Define button rectangles with different widths
+    model_select_button = pygame.Rect(start_x, button_y, model_select_width, button_height)
+    menu_button = pygame.Rect(start_x + model_select_width + button_spacing, button_y, menu_button_width, button_height)
+    return model_select_button, menu_button
+
+
+def draw_pretrained_game_over(snake, elapsed_time):
+    """Draw one frame of the pre-trained AI game over screen."""
+    model_select_button, menu_button = pretrained_game_over_buttons()
     
     # Enhanced fonts matching training summary
     font_large = load_retro_font(32)
     font_small = load_retro_font(16)
     button_font = load_retro_font(18)
 
-    # Game over screen loop
-    while True:
-        # Draw futuristic background with circuit pattern (danger theme)
-        screen.fill(DARK_BG)
-        draw_circuit_pattern(screen, grid_size=60, line_color=UI_DANGER, 
-                            line_alpha=30, animate=True)
-        
-        # Add grid overlay for consistency
-        draw_grid_overlay(screen, grid_size=40, line_color=UI_DANGER, line_alpha=10)
-        
-        # Account for sidebar in screen dimensions
-        total_width = WIDTH + SIDE_BAR_WIDTH
-        total_height = HEIGHT + TOP_BAR_HEIGHT
-        
-        # Enhanced title with mission terminated theme
-        draw_glow_text(screen, "MISSION TERMINATED", font_large, UI_DANGER, 
-                       total_width // 2, total_height // 2 - 120, glow_radius=1, glow_alpha=30, centered=True)
+    # Draw futuristic background with circuit pattern (danger theme)
+    draw_static_background(screen, DARK_BG,
+                           circuit=dict(grid_size=60, line_color=UI_DANGER, line_alpha=30),
+                           grid=dict(grid_size=40, line_color=UI_DANGER, line_alpha=10))
+    draw_circuit_pulses(screen)
+    
+    # Account for sidebar in screen dimensions
+    total_width = WIDTH + SIDE_BAR_WIDTH
+    total_height = HEIGHT + TOP_BAR_HEIGHT
+    
+    # Enhanced title with mission terminated theme
+    draw_glow_text(screen, "MISSION TERMINATED", font_large, UI_DANGER, 
+                   total_width // 2, total_height // 2 - 120, glow_radius=1, glow_alpha=30, centered=True)
+
+    # Enhanced mission statistics with separate colors for headers and values
+    stats_data = [
+        ("MISSION DURATION", f"{elapsed_time:.1f}s", NEON_ORANGE, NEON_CYAN),
+        ("FINAL SCORE", f"{float(snake.score):.2f}", NEON_ORANGE, NEON_GREEN),
+        ("SNAKE LENGTH", str(snake.length), NEON_ORANGE, NEON_BLUE),
+        ("STATUS", "TRUNCATED" if snake.is_truncated() else "TERMINATED", NEON_ORANGE, UI_DANGER)
+    ]
+    
+    # Draw stats with separate colors for labels and values
+    stats_y = total_height // 2 - 60
+    for i, (label, value, label_color, value_color) in enumerate(stats_data):
+        # Draw label positioned left
+        label_text = f"{label}:"
+        draw_glow_text(screen, label_text, font_small, label_color, 
+                       total_width // 2 - 120, stats_y + i * 22, glow_radius=0, glow_alpha=0, centered=True)
+        # Draw value positioned right
+        draw_glow_text(screen, value, font_small, value_color, 
+                       total_width // 2 + 120, stats_y + i * 22, glow_radius=0, glow_alpha=0, centered=True)
+
+    # Hover detection
+    mouse_pos = pygame.mouse.get_pos()
+    model_select_hovered = model_select_button.collidepoint(mouse_pos)
+    menu_hovered = menu_button.collidepoint(mouse_pos)
+    
+    # Draw holographic buttons with enhanced styling
+    draw_holographic_button(screen, model_select_button, "MODEL SELECT", button_font, 
+                           NEON_BLUE, NEON_CYAN, WHITE, model_select_hovered)
+    draw_holographic_button(screen, menu_button, "MENU", button_font, 
+                           UI_BORDER, UI_HIGHLIGHT, WHITE, menu_hovered)
+    
+    # Add energy nodes in corners for futuristic effect
+    corner_positions = [
+        (50, 50), (total_width - 50, 50),
+        (50, total_height - 50), (total_width - 50, total_height - 50)
+    ]
+    draw_energy_nodes(screen, corner_positions, UI_DANGER, pulse=True)
+    
+    # Add scan lines overlay for retro terminal effect
+    draw_scan_lines(screen, line_spacing=10, line_alpha=12, animate=True)
+    
+    pygame.display.flip()
 
-        # Enhanced mission statistics with separate colors for headers and values
-        stats_data = [
-            ("MISSION DURATION", f"{elapsed_time:.1f}s", NEON_ORANGE, NEON_CYAN),
-            ("FINAL SCORE", f"{float(snake.score):.2f}", NEON_ORANGE, NEON_GREEN),
-            ("SNAKE LENGTH", str(snake.length), NEON_ORANGE, NEON_BLUE),
-            ("STATUS", "TERMINATED", NEON_ORANGE, UI_DANGER)
-        ]
-        
-        # Draw stats with separate colors for labels and values
-        stats_y = total_height // 2 - 60
-        for i, (label, value, label_color, value_color) in enumerate(stats_data):
-            # Draw label positioned left
-            label_text = f"{label}:"
-            draw_glow_text(screen, label_text, font_small, label_color, 
-                           total_width // 2 - 120, stats_y + i * 22, glow_radius=0, glow_alpha=0, centered=True)
-            # Draw value positioned right
-            draw_glow_text(screen, value, font_small, value_color, 
-                           total_width // 2 + 120, stats_y + i * 22, glow_radius=0, glow_alpha=0, centered=True)
 
-        # Enhanced button system with holographic styling
-        model_select_width = 220  # Much wider button for MODEL SELECT text
-        menu_button_width = 140   # Standard width for MENU
-        button_height = 50
-        button_spacing = 30
-        
-        # Calculate button positions centered on total screen with different widths
-        total_button_width = model_select_width + menu_button_width + button_spacing
-        start_x = (total_width - total_button_width) // 2
-        button_y = total_height // 2 + 80
-        
-        # Define button rectangles with different widths
-        model_select_button = pygame.Rect(start_x, button_y, model_select_width, button_height)
-        menu_button = pygame.Rect(start_x + model_select_width + button_spacing, button_y, menu_button_width, button_height)
-        
-        # Hover detection
-        mouse_pos = pygame.mouse.get_pos()
-        model_select_hovered = model_select_button.collidepoint(mouse_pos)
-        menu_hovered = menu_button.collidepoint(mouse_pos)
-        
-        # Draw holographic buttons with enhanced styling
-        draw_holographic_button(screen, model_select_button, "MODEL SELECT", button_font, 
-                               NEON_BLUE, NEON_CYAN, WHITE, model_select_hovered)
-        draw_holographic_button(screen, menu_button, "MENU", button_font, 
-                               UI_BORDER, UI_HIGHLIGHT, WHITE, menu_hovered)
-        
-        # Add energy nodes in corners for futuristic effect
-        corner_positions = [
-            (50, 50), (total_width - 50, 50),
-            (50, total_height - 50), (total_width - 50, total_height - 50)
-        ]
-        draw_energy_nodes(screen, corner_positions, UI_DANGER, pulse=True)
-        
-        # Add scan lines overlay for retro terminal effect
-        draw_scan_lines(screen, line_spacing=10, line_alpha=12, animate=True)
-        
-        pygame.display.flip()
+def show_pretrained_game_over_screen(snake):
+    """Display enhanced pre-trained AI game over screen with futuristic styling."""
+    elapsed_time = round(time.time() - snake.start_time, 2)
+    model_select_button, menu_button = pretrained_game_over_buttons()
+
+    # Game over screen loop
+    screen_loop = ScreenLoop()
+    while True:
+        draw_pretrained_game_over(snake, elapsed_time)
         
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events (frame-capped, idle while unfocused)
+        for event in screen_loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -389,14 +397,13 @@ def show_training_summary(best_score, best_length, training_time):
     button_font = load_retro_font(18)
 
     # Training completion screen loop
+    screen_loop = ScreenLoop()
     while True:
         # Draw futuristic background with circuit pattern
-        screen.fill(DARK_BG)
-        draw_circuit_pattern(screen, grid_size=60, line_color=UI_SUCCESS, 
-                            line_alpha=30, animate=True)
-        
-        # Add grid overlay for consistency
-        draw_grid_overlay(screen, grid_size=40, line_color=NEON_GREEN, line_alpha=10)
+        draw_static_background(screen, DARK_BG,
+                               circuit=dict(grid_size=60, line_color=UI_SUCCESS, line_alpha=30),
+                               grid=dict(grid_size=40, line_color=NEON_GREEN, line_alpha=10))
+        draw_circuit_pulses(screen)
         
         # Account for sidebar in screen dimensions
         total_width = WIDTH + SIDE_BAR_WIDTH
@@ -409,8 +416,9 @@ def show_training_summary(best_score, best_length, training_time):
         # Enhanced training statistics with separate colors for headers and values
         stats_data = [
             ("TRAINING DURATION", f"{training_time:.1f}s", NEON_ORANGE, NEON_CYAN),
-            ("BEST SCORE ACHIEVED", f"{float(best_score_overall):.2f}", NEON_ORANGE, NEON_GREEN),
-            ("LONGEST LENGTH", str(best_length_overall), NEON_ORANGE, NEON_BLUE),
+            ("BEST SCORE ACHIEVED", f"{float(best_score):.2f}", NEON_ORANGE, NEON_GREEN),
+            ("LONGEST LENGTH", str(best_length), NEON_ORANGE, NEON_BLUE),
+            ("TRUNCATED EPISODES", str(training_totals["truncated_episodes"]), NEON_ORANGE, NEON_MAGENTA),
             ("STATUS", "COMPLETE", NEON_ORANGE, UI_SUCCESS)
         ]
         
@@ -470,8 +478,8 @@ def show_training_summary(best_score, best_length, training_time):
         
         pygame.display.flip()
         
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events (frame-capped, idle while unfocused)
+        for event in screen_loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -495,19 +503,19 @@ def run_pretrained_from_training(weights):
 def run_pretrained_ai(model_params):
     global snakes  # Ensure we update the global variable
 
-    snake = SnakeAI(brain=model_params)
+    snake = SnakeAI(brain=model_params, use_enhanced_network=len(model_params) == 15)
     snakes = [snake]  # Only one snake should be in the list
+    frame_renderer.invalidate()
 
-    running = True
-    while running and snake.alive:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        snake.move()  # Ensure move() is executed
-        draw_game(screen, snakes, generation_start_time, generation_lengths,
-                  "pretrained_ai", model_params, clock)
+    simulation = SimulationThread(snakes, snake.move, lambda: not snake.alive, sim_speed)
+    
+    def draw_snapshot(snapshot):
+        draw_game(screen, snapshot.units, generation_start_time, training_history,
+                  "pretrained_ai", model_params, clock, 1, sim_speed.label)
+    
+    if not render_until_finished(simulation, draw_snapshot, sim_speed.handle_event):
+        pygame.quit()
+        sys.exit()
 
     # **Show Enhanced Game Over Screen and Handle Replay**
     action = show_pretrained_game_over_screen(snake)
@@ -530,12 +538,12 @@ def main():
 
         elif selection == "train": 
             result = handle_training_mode(
-                best_score_overall, best_length_overall,
-                generation_fitness, generation_avg_fitness,
-                generation_lengths, generation_avg_lengths,
-                run_generation, show_training_summary,
-                run_pretrained_from_training
+                training_totals, training_history, run_generation, show_training_summary,
+                run_pretrained_from_training,
+                seed=training_options["seed"], workers=training_options["workers"],
+                resume_path=training_options["resume"]
             )
+            training_options["resume"] = None  # Only resume the first session
             if result == "menu":
                 continue  # Return to main menu
 
@@ -546,6 +554,27 @@ def main():
             handle_quit_mode()
 
 
+def parse_arguments():
+    """Parse command-line options for training runs."""
+    parser = argparse.ArgumentParser(description="Snake Gen - AI-driven evolutionary Snake game")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Root seed that makes AI training runs reproducible")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for headless training (1 = live rendering)")
+    parser.add_argument("--resume", metavar="CHECKPOINT", default=None,
+                        help=f"Resume AI training from a checkpoint (e.g. {CHECKPOINT_PATH})")
+    parser.add_argument("--speed", type=parse_speed, default=DEFAULT_SIM_SPEED,
+                        help="Simulation ticks per rendered frame: 1, 4, 16 or max (keys 1-4 / TAB in game)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    args = parse_arguments()
+    training_options["seed"] = args.seed
+    training_options["workers"] = max(1, args.workers)
+    training_options["resume"] = args.resume
+    sim_speed = SimulationSpeed(args.speed)
+    screen = bootstrap()
     main()
 
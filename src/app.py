@@ -0,0 +1,35 @@
+"""
+Application Bootstrap Module for Snake Gen v12.0
+Starts the pygame subsystems the game uses and opens its window.
+
+Nothing here runs at import time: every package can be imported (and
+src.core used headless) without touching the display.
+"""
+
+import pygame
+from .game.config import *
+
+# The game window, created by bootstrap()
+screen = None
+
+
+def bootstrap():
+    """Initialise display and fonts, open the window and hand it to the screens.
+
+    Only the display and font subsystems are started (no audio or
+    joystick). Safe to call more than once; returns the window surface.
+    """
+    global screen
+    if screen is not None:
+        return screen
+    
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode(WINDOW_SIZE)
+    pygame.display.set_caption(WINDOW_CAPTION)
+    
+    # Screens draw to a module-level surface
+    from .interfaces import menu, manual_gameplay, training_interface
+    for module in (menu, manual_gameplay, training_interface):
+        module.screen = screen
+    return screen
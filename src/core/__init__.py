@@ -3,10 +3,25 @@ Core Snake Classes
 Contains the main snake implementations for AI and manual control.
 """
 
-from .snake_ai import SnakeAI, evolve_snakes, log_and_print, tournament_selection
-from .snake_manual import ManualKeysSnake, get_manual_direction_from_key
+from .engine import SnakeEngine
+from .snake_ai import SnakeAI, evolve_snakes, tournament_selection
+from .snake_manual import ManualKeysSnake
+from .evaluation import run_episode, evaluate_population
+from .history import GenerationHistory, list_runs, load_run, compare_runs, check_convergence
 
 __all__ = [
-    'SnakeAI', 'evolve_snakes', 'log_and_print', 'tournament_selection',
-    'ManualKeysSnake', 'get_manual_direction_from_key'
-]
\ No newline at end of file
+    'SnakeEngine',
+    'SnakeAI', 'evolve_snakes', 'tournament_selection',
+    'ManualKeysSnake',
+    'run_episode', 'evaluate_population',
+    'GenerationHistory', 'list_runs', 'load_run', 'compare_runs', 'check_convergence'
+]
+
+
+def __getattr__(name):
+    # get_manual_direction_from_key moved to game.controls, which needs pygame;
+    # it resolves lazily so importing src.core stays pygame-free
+    if name == "get_manual_direction_from_key":
+        from ..game.controls import get_manual_direction_from_key
+        return get_manual_direction_from_key
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
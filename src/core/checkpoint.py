@@ -0,0 +1,106 @@
+"""
+Training Checkpoint Module for Snake Gen v12.0
+Saves and restores complete training state in a single uncompressed .npz file.
+"""
+
+import json
+import os
+import numpy as np
+from ..game.config import *
+from .snake_ai import SnakeAI
+
+CHECKPOINT_VERSION = 1
+_UINT64_MASK = (1 << 64) - 1
+
+
+def _pack_rng_state(rng):
+    """Pack a PCG64 generator state into six uint64 words."""
+    state = rng.bit_generator.state
+    return [state["state"]["state"] >> 64, state["state"]["state"] & _UINT64_MASK,
+            state["state"]["inc"] >> 64, state["state"]["inc"] & _UINT64_MASK,
+            state["has_uint32"], state["uinteger"]]
+
+
+def _unpack_rng_state(words):
+    """Rebuild a PCG64 generator from six packed uint64 words."""
+    words = [int(w) for w in words]
+    rng = np.random.default_rng()
+    rng.bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {"state": (words[0] << 64) | words[1], "inc": (words[2] << 64) | words[3]},
+        "has_uint32": words[4],
+        "uinteger": words[5],
+    }
+    return rng
+
+
+def save_checkpoint(path, snakes, history, root_sequence, generation, state):
+    """Atomically write the pending population and training state to path.
+
+    snakes are the not-yet-played members of the next generation, history maps
+    metric names to per-generation lists and state holds JSON-serialisable
+    session counters (early stopping, best weights, elapsed time, ...). The
+    population's network type is stored with them.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    meta = {
+        "version": CHECKPOINT_VERSION,
+        "generation": generation,
+        "root_entropy": str(root_sequence.entropy),
+        "root_children_spawned": root_sequence.n_children_spawned,
+        "config": dict(AI_CONFIG),
+        "state": dict(state, use_enhanced_network=bool(snakes and snakes[0].use_enhanced_network)),
+    }
+    arrays = {
+        "genomes": np.array([s.brain for s in snakes], dtype=np.float64),
+        "rng_states": np.array([_pack_rng_state(s.rng) for s in snakes], dtype=np.uint64),
+        "directions": np.array([s.direction for s in snakes], dtype=np.int8),
+        "foods": np.array([s.food for s in snakes], dtype=np.int32),
+        "meta": np.array(json.dumps(meta)),
+    }
+    for name, values in history.items():
+        arrays[f"history_{name}"] = np.asarray(values)
+
+    # Write next to the target and swap in, so a crash never leaves a torn file
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as checkpoint_file:
+        np.savez(checkpoint_file, **arrays)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path):
+    """Load a checkpoint and rebuild the pending population exactly as saved."""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["meta"]))
+        if meta["version"] != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {meta['version']} in {path}")
+
+        use_enhanced_network = meta["state"].get("use_enhanced_network", False)
+        snakes = []
+        for genome, rng_words, direction, food in zip(data["genomes"], data["rng_states"],
+                                                      data["directions"], data["foods"]):
+            snake = SnakeAI(brain=genome, use_enhanced_network=use_enhanced_network)
+            # Restore the draws made when the snake was created, then its stream
+            snake.direction = tuple(int(d) for d in direction)
+            snake.food = tuple(int(f) for f in food)
+            snake.rng = _unpack_rng_state(rng_words)
+            snakes.append(snake)
+
+        history = {name[len("history_"):]: data[name].tolist()
+                   for name in data.files if name.startswith("history_")}
+
+    root_sequence = np.random.SeedSequence(int(meta["root_entropy"]),
+                                           n_children_spawned=meta["root_children_spawned"])
+    return {
+        "generation": meta["generation"],
+        "config": meta["config"],
+        "state": meta["state"],
+        "root_sequence": root_sequence,
+        "snakes": snakes,
+        "history": history,
+    }
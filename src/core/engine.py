@@ -0,0 +1,90 @@
+"""
+Snake Engine Module for Snake Gen v12.0
+Board state and step rules shared by the AI and manual snakes.
+"""
+
+from ..game.config import *
+from ..utils.seeding import ensure_generator
+
+
+# Outcomes of a single engine step
+COLLIDED = "collision"
+ATE = "food"
+MOVED = "moved"
+
+
+def _build_border_walls():
+    """Cells of the one-cell ring that surrounds the game area."""
+    walls = set()
+    for x in range(GAME_AREA_X - CELL_SIZE, GAME_AREA_X + GAME_AREA_WIDTH + CELL_SIZE, CELL_SIZE):
+        walls.add((x, GAME_AREA_Y - CELL_SIZE))  # Top border
+        walls.add((x, GAME_AREA_Y + GAME_AREA_HEIGHT))  # Bottom border
+
+    for y in range(GAME_AREA_Y - CELL_SIZE, GAME_AREA_Y + GAME_AREA_HEIGHT + CELL_SIZE, CELL_SIZE):
+        walls.add((GAME_AREA_X - CELL_SIZE, y))  # Left border
+        walls.add((GAME_AREA_X + GAME_AREA_WIDTH, y))  # Right border
+    return frozenset(walls)
+
+
+# The walls never change, so every snake shares one set
+BORDER_WALLS = _build_border_walls()
+
+
+class SnakeEngine:
+    """Body, occupancy, food and movement of one snake on the board.
+
+    The direction of each step comes from a controller: any object with a
+    next_direction(current_direction) method. Without a controller the snake
+    keeps its current direction. Scoring and termination rules are left to
+    the subclasses, which differ between AI training and manual play.
+    """
+
+    border_walls = BORDER_WALLS
+
+    def __init__(self, controller=None, rng=None):
+        self.rng = ensure_generator(rng)
+        self.controller = controller
+
+        # Start at the center; occupied mirrors the body for O(1) lookups
+        self.snake = [(GAME_AREA_X + GAME_AREA_WIDTH // 2,
+                       GAME_AREA_Y + GAME_AREA_HEIGHT // 2)]
+        self.occupied = set(self.snake)
+        self.direction = (1, 0)
+        self.food = None
+        self.moves_made = 0
+
+    def is_blocked(self, cell):
+        """True if moving into cell would hit the body or a wall."""
+        return cell in self.occupied or cell in BORDER_WALLS
+
+    def spawn_food(self):
+        """Pick a random free cell for the next piece of food."""
+        while True:
+            food_x = GAME_AREA_X + CELL_SIZE * int(self.rng.integers(GAME_AREA_WIDTH // CELL_SIZE))
+            food_y = GAME_AREA_Y + CELL_SIZE * int(self.rng.integers(GAME_AREA_HEIGHT // CELL_SIZE))
+            if (food_x, food_y) not in self.occupied:
+                return food_x, food_y
+
+    def step(self):
+        """Move one cell and return COLLIDED, ATE or MOVED.
+
+        On ATE the body grows, but the caller respawns the food once it has
+        applied its own rules, so random draws keep the order those rules need.
+        """
+        if self.controller is not None:
+            self.direction = self.controller.next_direction(self.direction)
+        head_x, head_y = self.snake[0]
+        new_head = (head_x + self.direction[0] * CELL_SIZE,
+                    head_y + self.direction[1] * CELL_SIZE)
+
+        if new_head in self.occupied or new_head in BORDER_WALLS:
+            return COLLIDED
+
+        self.snake.insert(0, new_head)
+        self.occupied.add(new_head)
+        self.moves_made += 1
+        if new_head == self.food:
+            return ATE
+
+        self.occupied.discard(self.snake.pop())
+        return MOVED
@@ -0,0 +1,22 @@
+"""
+Headless Evaluation Module for Snake Gen v12.0
+Runs AI episodes to completion without rendering, serially or in a process pool.
+"""
+
+
+def run_episode(snake):
+    """Play a single AI episode to completion and return the finished snake."""
+    while snake.alive:
+        snake.move()
+    return snake
+
+
+def evaluate_population(snakes, executor=None):
+    """Run every episode of a population to completion.
+
+    Each snake carries its own random stream, so the results are identical
+    whether the episodes run serially or are spread across a process pool.
+    """
+    if executor is None:
+        return [run_episode(snake) for snake in snakes]
+    return list(executor.map(run_episode, snakes))
@@ -0,0 +1,186 @@
+"""
+Generation History Module for Snake Gen v12.0
+Columnar, memory-mapped store of per-generation training metrics.
+"""
+
+import json
+import os
+import time
+import uuid
+import numpy as np
+from numpy.lib.format import open_memmap
+from ..game.config import *
+from ..utils.online_stats import RollingWindow
+
+# Scalar metrics recorded once per generation
+HISTORY_METRICS = (
+    "best_fitness", "avg_fitness", "std_fitness", "best_length", "avg_length",
+    "best_score", "avg_score", "diversity", "success_rate", "truncated",
+)
+RUN_META_FILENAME = "run.json"
+# Metrics with a rolling window kept up to date for convergence checks
+CONVERGENCE_METRICS = ("best_fitness", "avg_fitness")
+
+
+def _column_length(column):
+    """Return the number of filled rows (unused capacity is NaN-padded)."""
+    unused = np.flatnonzero(np.isnan(column))
+    return int(unused[0]) if unused.size else len(column)
+
+
+def list_runs(root_dir=HISTORY_DIR):
+    """List the ids of every recorded run, oldest first."""
+    if not os.path.isdir(root_dir):
+        return []
+    return sorted(name for name in os.listdir(root_dir)
+                  if os.path.exists(os.path.join(root_dir, name, RUN_META_FILENAME)))
+
+
+def load_run(run_id, root_dir=HISTORY_DIR):
+    """Open a recorded run read-only as a dict of metric -> memory-mapped column."""
+    run_dir = os.path.join(root_dir, run_id)
+    with open(os.path.join(run_dir, RUN_META_FILENAME)) as meta_file:
+        metrics = json.load(meta_file)["metrics"]
+    columns = {metric: open_memmap(os.path.join(run_dir, f"{metric}.npy"), mode="r")
+               for metric in metrics}
+    length = min((_column_length(column) for column in columns.values()), default=0)
+    return {metric: column[:length] for metric, column in columns.items()}
+
+
+def compare_runs(metric, run_ids=None, root_dir=HISTORY_DIR):
+    """Return {run_id: column} for one metric across several recorded runs."""
+    run_ids = list_runs(root_dir) if run_ids is None else run_ids
+    return {run_id: load_run(run_id, root_dir)[metric] for run_id in run_ids}
+
+
+class GenerationHistory:
+    """Appendable per-metric arrays for the current run, persisted as .npy memmaps."""
+    
+    def __init__(self, root_dir=HISTORY_DIR, metrics=HISTORY_METRICS, initial_capacity=64,
+                 convergence_window=5):
+        self.root_dir = root_dir
+        self.metrics = tuple(metrics)
+        self.initial_capacity = initial_capacity
+        self.windows = {metric: RollingWindow(convergence_window) for metric in CONVERGENCE_METRICS}
+        self.run_id = None
+        self._columns = {}
+        self._capacity = 0
+        self._length = 0
+
+    def start_run(self, run_id=None):
+        """Begin a fresh run with empty columns in its own directory."""
+        self.close()
+        self.run_id = run_id or f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        run_dir = os.path.join(self.root_dir, self.run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        with open(os.path.join(run_dir, RUN_META_FILENAME), "w") as meta_file:
+            json.dump({"run_id": self.run_id, "metrics": list(self.metrics),
+                       "created": time.strftime("%Y-%m-%d %H:%M:%S")}, meta_file)
+        self._capacity = self.initial_capacity
+        self._length = 0
+        for window in self.windows.values():
+            window.clear()
+        for metric in self.metrics:
+            column = open_memmap(self._column_path(metric), mode="w+",
+                                 dtype=np.float64, shape=(self._capacity,))
+            column[:] = np.nan
+            self._columns[metric] = column
+        return self.run_id
+
+    def _column_path(self, metric):
+        """Return the .npy path backing one metric of the current run."""
+        return os.path.join(self.root_dir, self.run_id, f"{metric}.npy")
+
+    def _grow(self):
+        """Double the capacity of every column, keeping existing rows."""
+        new_capacity = self._capacity * 2
+        for metric in self.metrics:
+            path = self._column_path(metric)
+            old_column = self._columns.pop(metric)
+            grown = open_memmap(path + ".tmp", mode="w+", dtype=np.float64, shape=(new_capacity,))
+            grown[:self._capacity] = old_column
+            grown[self._capacity:] = np.nan
+            grown.flush()
+            # Release both mappings before swapping files (required on Windows)
+            del grown, old_column
+            os.replace(path + ".tmp", path)
+            self._columns[metric] = open_memmap(path, mode="r+")
+        self._capacity = new_capacity
+
+    def append(self, values):
+        """Append one generation row; metrics missing from values are stored as 0."""
+        if self.run_id is None:
+            self.start_run()
+        if self._length == self._capacity:
+            self._grow()
+        for metric in self.metrics:
+            self._columns[metric][self._length] = float(values.get(metric, 0.0))
+        for metric, window in self.windows.items():
+            window.push(values.get(metric, 0.0))
+        self._length += 1
+
+    def extend(self, columns):
+        """Append several rows given as {metric: sequence of values}."""
+        row_count = max((len(values) for values in columns.values()), default=0)
+        for row in range(row_count):
+            self.append({metric: values[row] for metric, values in columns.items()
+                         if row < len(values)})
+
+    def __len__(self):
+        return self._length
+
+    def column(self, metric):
+        """Return every recorded value of a metric (a view, not a copy)."""
+        if metric not in self._columns:
+            return np.empty(0)
+        return self._columns[metric][:self._length]
+
+    def range(self, metric, start=0, stop=None):
+        """Return values of a metric for generations [start, stop)."""
+        return self.column(metric)[start:stop]
+
+    def last(self, metric, n):
+        """Return the most recent n values of a metric."""
+        return self.column(metric)[max(0, self._length - n):]
+
+    def as_dict(self):
+        """Copy every column into plain lists (used for checkpoints)."""
+        return {metric: self.column(metric).tolist() for metric in self.metrics}
+
+    def flush(self):
+        """Flush all columns to disk."""
+        for column in self._columns.values():
+            column.flush()
+
+    def close(self):
+        """Flush and release the current run's memory maps."""
+        self.flush()
+        self._columns = {}
+
+
+def check_convergence(history):
+    """Check if the population has converged based on fitness stability."""
+    # Rolling windows over the recent generations are kept by the history
+    recent_best = history.windows["best_fitness"]
+    recent_avg = history.windows["avg_fitness"]
+    if not recent_best.full:
+        return False, 0.0
+    
+    # Calculate variance in recent generations
+    best_variance = recent_best.variance
+    avg_variance = recent_avg.variance
+    
+    # Calculate improvement rate
+    if len(history) > 1:
+        improvement_rate = (recent_best.last - recent_best.first) / recent_best.first
+    else:
+        improvement_rate = 1.0
+    
+    # Convergence criteria
+    has_converged = (
+        best_variance < 10.0 and  # Low variance in best fitness
+        avg_variance < 20.0 and    # Low variance in average fitness
+        abs(improvement_rate) < 0.05  # Less than 5% improvement
+    )
+    
+    return has_converged, improvement_rate
@@ -0,0 +1,84 @@
+"""
+Model Registry Module for Snake Gen v12.0
+Stores trained brains on disk with an append-only metadata index.
+"""
+
+import json
+import os
+import time
+import uuid
+import numpy as np
+from ..game.config import *
+
+INDEX_FILENAME = "index.jsonl"
+
+
+def _index_path(registry_dir):
+    """Return the path of the registry's metadata index."""
+    return os.path.join(registry_dir, INDEX_FILENAME)
+
+
+def register_model(genome, fitness, seed=None, name=None, registry_dir=MODEL_REGISTRY_DIR):
+    """Save a genome to the registry and append its metadata to the index."""
+    os.makedirs(registry_dir, exist_ok=True)
+    genome = np.asarray(genome, dtype=np.float64)
+    model_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    filename = f"{model_id}.npy"
+    np.save(os.path.join(registry_dir, filename), genome)
+
+    entry = {
+        "id": model_id,
+        "name": name or f"Run {model_id[:13]}",
+        "file": filename,
+        "param_count": int(genome.size),
+        "fitness": float(fitness),
+        "board": f"{GAME_AREA_WIDTH // CELL_SIZE}x{GAME_AREA_HEIGHT // CELL_SIZE}",
+        "seed": seed,
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "mean_abs_weight": float(np.mean(np.abs(genome))),
+        "source": "registry",
+    }
+    # One line per model: saving is an O(1) append, listing never opens genomes
+    with open(_index_path(registry_dir), "a") as index_file:
+        index_file.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def builtin_models():
+    """Return index entries for the models shipped in PRETRAINED_MODELS."""
+    return [{
+        "id": f"builtin-{name}",
+        "name": name,
+        "param_count": len(params),
+        "fitness": None,
+        "board": f"{GAME_AREA_WIDTH // CELL_SIZE}x{GAME_AREA_HEIGHT // CELL_SIZE}",
+        "seed": None,
+        "date": None,
+        "mean_abs_weight": sum(abs(p) for p in params) / len(params),
+        "description": MODEL_DESCRIPTIONS.get(name, ""),
+        "source": "builtin",
+    } for name, params in PRETRAINED_MODELS.items()]
+
+
+def list_models(registry_dir=MODEL_REGISTRY_DIR, include_builtin=True):
+    """List model metadata from the index without loading any genome.
+
+    Built-in models come first, followed by registered models by fitness.
+    """
+    entries = []
+    index_path = _index_path(registry_dir)
+    if os.path.exists(index_path):
+        with open(index_path) as index_file:
+            for line in index_file:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+    entries.sort(key=lambda e: e["fitness"], reverse=True)
+    return (builtin_models() if include_builtin else []) + entries
+
+
+def load_model_genome(entry, registry_dir=MODEL_REGISTRY_DIR):
+    """Load the genome described by an index entry."""
+    if entry["source"] == "builtin":
+        return list(PRETRAINED_MODELS[entry["name"]])
+    return np.load(os.path.join(registry_dir, entry["file"])).tolist()
@@ -3,37 +3,46 @@ AI Snake Module for Snake Gen v11.5
 Contains the SnakeAI class and genetic algorithm functions.
 """
 
-import random
 import numpy as np
 import time
 from ..game.config import *
+from ..utils.seeding import ensure_generator, spawn_generators
+from ..utils.phase_timer import phase_timer
+from .engine import SnakeEngine, COLLIDED, ATE
 
 
-class SnakeAI:
+# Termination reasons that come from an episode budget rather than a real death
+TRUNCATION_REASONS = ("max_ticks", "food_budget", "wall_time")
+
+
+class SnakeAI(SnakeEngine):
     """AI-controlled Snake that uses genetic algorithms for decision making."""
     
-    def __init__(self, brain=None, use_enhanced_network=False):
-        # Initialize snake at center
-        self.snake = [(GAME_AREA_X + GAME_AREA_WIDTH // 2,
-                       GAME_AREA_Y + GAME_AREA_HEIGHT // 2)]
-        self.direction = random.choice(DIRECTIONS)
-        self.moves_made = 0
+    def __init__(self, brain=None, use_enhanced_network=False, rng=None):
+        # Every episode draws from its own random stream for reproducibility;
+        # the snake steers itself through next_direction
+        super().__init__(controller=self, rng=rng)
+        self.direction = DIRECTIONS[self.rng.integers(len(DIRECTIONS))]
         self.score = 0
         self.fitness_score = 0
         self.length = 0
         self.alive = True
+        self.termination_reason = None
         self.start_time = time.time()
         self.last_food_time = time.time()
+        self.ticks_since_food = 0
         self.previous_positions = []
         self.previous_directions = []
         self.use_enhanced_network = use_enhanced_network
+        self.food = self.spawn_food()
 
-        # AI Weights - Enhanced network has more parameters
+        # AI Weights - Enhanced network has more parameters. Drawn last so a snake
+        # rebuilt from a stored brain consumes its random stream identically.
         if self.use_enhanced_network:
             # Enhanced network: 15 parameters with hidden layer weights
             if brain is None:
                 # Initialize with Xavier/He initialization for better training
-                self.brain = np.random.randn(15) * np.sqrt(2.0 / 15)
+                self.brain = self.rng.standard_normal(15) * np.sqrt(2.0 / 15)
             else:
                 self.brain = np.array(brain)
                 # Pad old 9-parameter brains to 15 parameters if needed
@@ -42,33 +51,18 @@ class SnakeAI:
         else:
             # Original 9-parameter network
             if brain is None:
-                self.brain = np.random.uniform(-1.5, 1.5, 9)
+                self.brain = self.rng.uniform(-1.5, 1.5, 9)
                 self.brain /= np.linalg.norm(self.brain)
             else:
                 self.brain = np.array(brain)
 
-        self.border_walls = set()
-        for x in range(GAME_AREA_X - CELL_SIZE, GAME_AREA_X + GAME_AREA_WIDTH + CELL_SIZE, CELL_SIZE):
-            self.border_walls.add((x, GAME_AREA_Y - CELL_SIZE))  # Top border
-            self.border_walls.add(
-                (x, GAME_AREA_Y + GAME_AREA_HEIGHT))  # Bottom border
-
-        for y in range(GAME_AREA_Y - CELL_SIZE, GAME_AREA_Y + GAME_AREA_HEIGHT + CELL_SIZE, CELL_SIZE):
-            self.border_walls.add((GAME_AREA_X - CELL_SIZE, y))  # Left border
-            self.border_walls.add(
-                (GAME_AREA_X + GAME_AREA_WIDTH, y))  # Right border
-
-        self.food = self.spawn_food()
+    def next_direction(self, current_direction):
+        """Controller hook for the engine: the network picks every move."""
+        return self.choose_direction()
 
-    def spawn_food(self):
-        """Spawn food at a random location not occupied by the snake."""
-        while True:
-            food_x = random.randrange(
-                GAME_AREA_X, GAME_AREA_X + GAME_AREA_WIDTH, CELL_SIZE)
-            food_y = random.randrange(
-                GAME_AREA_Y, GAME_AREA_Y + GAME_AREA_HEIGHT, CELL_SIZE)
-            if (food_x, food_y) not in self.snake:
-                return food_x, food_y
+    def sim_seconds(self, ticks):
+        """Convert simulation ticks to seconds on the deterministic episode clock."""
+        return ticks / AI_CONFIG["SIM_TICKS_PER_SECOND"]
 
     def get_lookahead_depth(self):
         """Get adaptive lookahead depth based on snake length."""
@@ -88,10 +82,33 @@ class SnakeAI:
         loop_threshold = 3 if self.length < 10 else 4
         return max(position_counts.values()) >= loop_threshold
 
+    def terminate(self, reason):
+        """End the episode and record why it ended (the first reason wins)."""
+        self.alive = False
+        if self.termination_reason is None:
+            self.termination_reason = reason
+
+    def is_truncated(self):
+        """Return True if the episode was cut short by a budget."""
+        return self.termination_reason in TRUNCATION_REASONS
+
+    def check_episode_budget(self):
+        """Return the name of the exhausted episode budget, or None."""
+        if self.moves_made >= AI_CONFIG["MAX_EPISODE_TICKS"]:
+            return "max_ticks"
+        food_budget = (AI_CONFIG["MAX_TICKS_WITHOUT_FOOD"] +
+                       AI_CONFIG["TICKS_WITHOUT_FOOD_PER_LENGTH"] * self.length)
+        if self.ticks_since_food >= food_budget:
+            return "food_budget"
+        max_seconds = AI_CONFIG["MAX_EPISODE_SECONDS"]
+        if max_seconds is not None and time.time() - self.start_time >= max_seconds:
+            return "wall_time"
+        return None
+
     def fitness_function(self):
         """Calculate the fitness score for this snake using multi-objective optimization."""
         # Survival time component (normalized)
-        survival_time = time.time() - self.start_time
+        survival_time = self.sim_seconds(self.moves_made)
         survival_score = min(survival_time / 60.0, 1.0)  # Normalize to [0,1] over 60 seconds
         
         # Food collection efficiency (normalized)
@@ -111,7 +128,7 @@ class SnakeAI:
             streak_bonus = 0
         
         # Distance-based food seeking (reward for moving toward food when not eating)
-        time_since_food = min((time.time() - self.last_food_time) / 10.0, 1.0)
+        time_since_food = min(self.sim_seconds(self.ticks_since_food) / 10.0, 1.0)
         food_seeking_penalty = max(0, time_since_food - 0.5)  # Penalty after 5 seconds
         
         # Weighted combination of normalized components
@@ -147,6 +164,7 @@ class SnakeAI:
         """ReLU activation function."""
         return np.maximum(0, x)
 
+    @phase_timer.timed("decision")
     def choose_direction(self):
         """Use AI to choose the best direction for the snake to move."""
         def calculate_features(new_x, new_y):
@@ -177,7 +195,7 @@ class SnakeAI:
             
             # Safe moves available
             lookahead_positions = [(new_x + dx * CELL_SIZE, new_y + dy * CELL_SIZE) for dx, dy in DIRECTIONS]
-            safe_moves = sum(1 for pos in lookahead_positions if pos not in self.snake and pos not in self.border_walls)
+            safe_moves = sum(1 for pos in lookahead_positions if pos not in self.occupied and pos not in self.border_walls)
             features.append(safe_moves / 4.0)
             
             # Snake length context
@@ -230,7 +248,7 @@ class SnakeAI:
             new_y = head[1] + direction[1] * CELL_SIZE
 
             # Check for collision with snake or walls
-            if (new_x, new_y) in self.snake or (new_x, new_y) in self.border_walls:
+            if (new_x, new_y) in self.occupied or (new_x, new_y) in self.border_walls:
                 return -1000
 
             # Calculate features and evaluate with neural network
@@ -259,7 +277,7 @@ class SnakeAI:
                 exploration_bonus = self.brain[6] * (unique_positions / (len(self.previous_positions) + 1)) * np.exp(-0.05 * len(self.previous_positions))
                 
                 lookahead_positions = [(new_x + dx * CELL_SIZE, new_y + dy * CELL_SIZE) for dx, dy in DIRECTIONS]
-                lookahead_collisions = sum(1 for pos in lookahead_positions if pos in self.snake)
+                lookahead_collisions = sum(1 for pos in lookahead_positions if pos in self.occupied)
                 dead_end_penalty = self.brain[8] * (-20 if lookahead_collisions >= 2 else 0)
                 
                 base_score = (food_bonus + toward_food_reward + loop_penalty + wall_penalty + exploration_bonus + momentum_bonus + dead_end_penalty)
@@ -280,53 +298,52 @@ class SnakeAI:
             if score > best_score:
                 best_score = score
                 best_move = move
-        return best_move if best_move is not None else random.choice(DIRECTIONS)
+        return best_move if best_move is not None else DIRECTIONS[self.rng.integers(len(DIRECTIONS))]
 
     def move(self):
         """Move the snake based on AI decision."""
         if not self.alive:
             return
 
-        self.direction = self.choose_direction()
-        head_x, head_y = self.snake[0]
-        new_head = (
-            head_x + self.direction[0] * CELL_SIZE, head_y + self.direction[1] * CELL_SIZE)
-
-        # Collision check
-        if new_head in self.snake or new_head in self.border_walls:
-            self.alive = False
+        # The engine asks choose_direction for the move, then advances the body
+        outcome = self.step()
+        if outcome == COLLIDED:
+            self.terminate("collision")
             return
 
-        # Move the snake
-        self.snake.insert(0, new_head)
-        self.previous_positions.append(new_head)
-
-        self.moves_made += 1  # Track the total moves the snake makes
+        self.previous_positions.append(self.snake[0])
+        self.ticks_since_food += 1
 
         # Check loop detection
-        if time.time() - self.last_food_time > 15:  # Extend starvation time
-            self.alive = False
+        if self.sim_seconds(self.ticks_since_food) > 15:  # Extend starvation time
+            self.terminate("starvation")
 
         if self.detect_loop():
             self.fitness_score -= 50  # Penalize fitness score
-            if random.random() > 0.5:  # 50% chance to survive the loop
-                self.alive = False
+            if self.rng.random() > 0.5:  # 50% chance to survive the loop
+                self.terminate("loop")
 
         # Check for food collection
-        if new_head == self.food:
+        if outcome == ATE:
             self.score += 50
             self.length += 1
             self.food = self.spawn_food()
             self.last_food_time = time.time()  # Update time when food is eaten
+            self.ticks_since_food = 0
             # Add bonus for collecting food (scales with length)
             self.score += self.length * 2.5
         else:
-            self.snake.pop()  # Move the snake
             # Small survival bonus (much smaller than before)
             self.score += 0.1
 
-        if time.time() - self.last_food_time > 10 and self.length < 500:
-            self.alive = False  # Kill snake if no food eaten in 10 seconds
+        if self.sim_seconds(self.ticks_since_food) > 10 and self.length < 500:
+            self.terminate("starvation")  # Kill snake if no food eaten in 10 seconds
+
+        # Enforce per-episode budgets so stragglers cannot stall a generation
+        if self.alive:
+            exhausted_budget = self.check_episode_budget()
+            if exhausted_budget:
+                self.terminate(exhausted_budget)
 
         # Update fitness
         self.fitness_score = self.fitness_function()
@@ -334,30 +351,31 @@ class SnakeAI:
 
 # Genetic Algorithm Functions
 
-def log_and_print(*args, **kwargs):
-    """Prints output to the console and also writes it to a log file."""
-    print(*args, **kwargs)  # Print to terminal
-    with open(LOG_FILENAME, "a") as log_file:
-        print(*args, **kwargs, file=log_file)  # Also write to log file
+# Operators evolve_snakes draws from for each offspring
+SELECTION_METHODS = ("tournament", "rank", "roulette")
+CROSSOVER_METHODS = ("uniform", "multi_point", "single_point")
 
 
-def tournament_selection(snakes, tournament_size=AI_CONFIG["TOURNAMENT_SIZE"]):
+def tournament_selection(snakes, tournament_size=AI_CONFIG["TOURNAMENT_SIZE"], rng=None):
     """Selects a snake using tournament selection."""
-    participants = random.sample(snakes, tournament_size)
-    return max(participants, key=lambda s: s.fitness_function())
+    rng = ensure_generator(rng)
+    participant_idx = rng.choice(len(snakes), tournament_size, replace=False)
+    return max((snakes[i] for i in participant_idx), key=lambda s: s.fitness_function())
 
 
-def rank_based_selection(snakes):
+def rank_based_selection(snakes, rng=None):
     """Select a snake using rank-based selection (linear ranking)."""
+    rng = ensure_generator(rng)
     sorted_snakes = sorted(snakes, key=lambda s: s.fitness_function())
     ranks = np.arange(1, len(sorted_snakes) + 1)
     probabilities = ranks / ranks.sum()
-    selected_idx = np.random.choice(len(sorted_snakes), p=probabilities)
+    selected_idx = rng.choice(len(sorted_snakes), p=probabilities)
     return sorted_snakes[selected_idx]
 
 
-def roulette_wheel_selection(snakes):
+def roulette_wheel_selection(snakes, rng=None):
     """Select a snake using fitness-proportionate roulette wheel selection."""
+    rng = ensure_generator(rng)
     fitnesses = np.array([s.fitness_function() for s in snakes])
     # Ensure all fitnesses are positive
     min_fitness = min(fitnesses)
@@ -368,32 +386,29 @@ def roulette_wheel_selection(snakes):
     total_fitness = sum(fitnesses)
     if total_fitness == 0:
         # If all fitnesses are 0, select randomly
-        return random.choice(snakes)
+        return snakes[rng.integers(len(snakes))]
     
     probabilities = fitnesses / total_fitness
-    selected_idx = np.random.choice(len(snakes), p=probabilities)
+    selected_idx = rng.choice(len(snakes), p=probabilities)
     return snakes[selected_idx]
 
 
-def uniform_crossover(parent1_brain, parent2_brain, crossover_rate=0.5):
+def uniform_crossover(parent1_brain, parent2_brain, crossover_rate=0.5, rng=None):
     """Perform uniform crossover between two parent brains."""
-    new_brain = np.zeros_like(parent1_brain)
-    for i in range(len(new_brain)):
-        if random.random() < crossover_rate:
-            new_brain[i] = parent1_brain[i]
-        else:
-            new_brain[i] = parent2_brain[i]
-    return new_brain
+    rng = ensure_generator(rng)
+    from_parent1 = rng.random(len(parent1_brain)) < crossover_rate
+    return np.where(from_parent1, parent1_brain, parent2_brain)
 
 
-def multi_point_crossover(parent1_brain, parent2_brain, num_points=2):
+def multi_point_crossover(parent1_brain, parent2_brain, num_points=2, rng=None):
     """Perform multi-point crossover between two parent brains."""
+    rng = ensure_generator(rng)
     length = len(parent1_brain)
     if num_points >= length - 1:
         num_points = max(1, length - 2)
     
     # Generate random crossover points
-    points = sorted(random.sample(range(1, length), num_points))
+    points = sorted(int(p) for p in rng.choice(np.arange(1, length), num_points, replace=False))
     points = [0] + points + [length]
     
     new_brain = np.zeros_like(parent1_brain)
@@ -406,6 +421,13 @@ def multi_point_crossover(parent1_brain, parent2_brain, num_points=2):
     return new_brain
 
 
+def single_point_crossover(parent1_brain, parent2_brain, rng=None):
+    """Perform single-point crossover between two parent brains."""
+    rng = ensure_generator(rng)
+    cut = rng.integers(0, len(parent1_brain))
+    return np.concatenate((parent1_brain[:cut], parent2_brain[cut:]))
+
+
 def calculate_population_diversity(snakes):
     """Calculate the genetic diversity of the population."""
     if len(snakes) < 2:
@@ -423,8 +445,9 @@ def calculate_population_diversity(snakes):
     return diversity / count if count > 0 else 0.0
 
 
-def adaptive_mutation(brain, generation_fitness, population_diversity):
+def adaptive_mutation(brain, generation_fitness, population_diversity, rng=None):
     """Apply adaptive mutation based on fitness progress and population diversity."""
+    rng = ensure_generator(rng)
     # Base mutation rate
     if len(generation_fitness) > 1 and generation_fitness[-1] > generation_fitness[-2]:
         base_mutation = AI_CONFIG["MUTATION_LOW"]
@@ -442,15 +465,28 @@ def adaptive_mutation(brain, generation_fitness, population_diversity):
     
     # Apply mutation with variable probability per gene
     mutated_brain = brain.copy()
-    for i in range(len(mutated_brain)):
-        if random.random() < 0.3:  # 30% chance to mutate each gene
-            mutated_brain[i] += np.random.randn() * mutation_rate
+    mutate_mask = rng.random(len(mutated_brain)) < 0.3  # 30% chance to mutate each gene
+    mutated_brain[mutate_mask] += rng.standard_normal(mutate_mask.sum()) * mutation_rate
     
     return mutated_brain
 
 
-def evolve_snakes(snakes, generation_fitness):
-    """Enhanced evolution with multiple selection and crossover strategies."""
+def evolve_snakes(snakes, generation_fitness, seed_sequence=None, selection_probs=None,
+                  crossover_methods=CROSSOVER_METHODS):
+    """Enhanced evolution with multiple selection and crossover strategies.
+
+    All randomness is drawn from seed_sequence: one child stream drives the
+    genetic operators and one child per offspring seeds its next episode.
+    selection_probs ({method: probability}) replaces the diversity-based
+    selection mix, and crossover_methods limits the crossovers drawn from;
+    the defaults reproduce the standard mix.
+    """
+    if seed_sequence is None:
+        seed_sequence = np.random.SeedSequence()
+    operator_sequence, episode_sequence = seed_sequence.spawn(2)
+    rng = np.random.default_rng(operator_sequence)
+    episode_rngs = iter(spawn_generators(episode_sequence, len(snakes)))
+
     # Calculate current population diversity
     population_diversity = calculate_population_diversity(snakes)
     
@@ -459,58 +495,59 @@ def evolve_snakes(snakes, generation_fitness):
     
     # Elitism: Keep top performers
     elite_count = min(AI_CONFIG.get("ELITISM_COUNT", 3), len(snakes) // 10)
-    new_snakes = [SnakeAI(brain=snake.brain.copy()) for snake in sorted_snakes[:elite_count]]
+    new_snakes = [SnakeAI(brain=snake.brain.copy(), rng=next(episode_rngs))
+                  for snake in sorted_snakes[:elite_count]]
     
-    # Selection strategy probabilities (dynamic based on diversity)
-    if population_diversity < 0.5:
-        # Low diversity: favor diverse selection methods
-        selection_probs = {'tournament': 0.3, 'rank': 0.4, 'roulette': 0.3}
-    else:
-        # Good diversity: favor fitness-based selection
-        selection_probs = {'tournament': 0.5, 'rank': 0.3, 'roulette': 0.2}
+    # Selection strategy probabilities (dynamic based on diversity unless given)
+    if selection_probs is None:
+        if population_diversity < 0.5:
+            # Low diversity: favor diverse selection methods
+            selection_probs = {'tournament': 0.3, 'rank': 0.4, 'roulette': 0.3}
+        else:
+            # Good diversity: favor fitness-based selection
+            selection_probs = {'tournament': 0.5, 'rank': 0.3, 'roulette': 0.2}
     
     # Generate offspring
     while len(new_snakes) < len(snakes):
         # Choose selection method
-        selection_method = np.random.choice(
+        selection_method = rng.choice(
             list(selection_probs.keys()),
             p=list(selection_probs.values())
         )
         
         # Select parents
         if selection_method == 'tournament':
-            parent1 = tournament_selection(sorted_snakes[:max(10, len(snakes)//2)])
-            parent2 = tournament_selection(sorted_snakes[:max(10, len(snakes)//2)])
+            parent1 = tournament_selection(sorted_snakes[:max(10, len(snakes)//2)], rng=rng)
+            parent2 = tournament_selection(sorted_snakes[:max(10, len(snakes)//2)], rng=rng)
         elif selection_method == 'rank':
-            parent1 = rank_based_selection(snakes)
-            parent2 = rank_based_selection(snakes)
+            parent1 = rank_based_selection(snakes, rng=rng)
+            parent2 = rank_based_selection(snakes, rng=rng)
         else:  # roulette
-            parent1 = roulette_wheel_selection(snakes)
-            parent2 = roulette_wheel_selection(snakes)
+            parent1 = roulette_wheel_selection(snakes, rng=rng)
+            parent2 = roulette_wheel_selection(snakes, rng=rng)
         
         # Choose crossover method
-        crossover_method = random.choice(['uniform', 'multi_point', 'single_point'])
+        crossover_method = rng.choice(list(crossover_methods))
         
         if crossover_method == 'uniform':
-            new_brain = uniform_crossover(parent1.brain, parent2.brain)
+            new_brain = uniform_crossover(parent1.brain, parent2.brain, rng=rng)
         elif crossover_method == 'multi_point':
-            new_brain = multi_point_crossover(parent1.brain, parent2.brain)
+            new_brain = multi_point_crossover(parent1.brain, parent2.brain, rng=rng)
         else:  # single_point (original method)
-            cut = np.random.randint(0, len(parent1.brain))
-            new_brain = np.concatenate((parent1.brain[:cut], parent2.brain[cut:]))
+            new_brain = single_point_crossover(parent1.brain, parent2.brain, rng=rng)
         
         # Apply adaptive mutation
-        new_brain = adaptive_mutation(new_brain, generation_fitness, population_diversity)
+        new_brain = adaptive_mutation(new_brain, generation_fitness, population_diversity, rng=rng)
         
         # Create new snake
-        new_snakes.append(SnakeAI(brain=new_brain))
+        new_snakes.append(SnakeAI(brain=new_brain, rng=next(episode_rngs)))
         
         # Diversity injection with adaptive probability
         diversity_injection_prob = AI_CONFIG["DIVERSITY_INJECTION_PROB"]
         if population_diversity < 0.3:  # Very low diversity
             diversity_injection_prob *= 3
         
-        if random.random() < diversity_injection_prob and len(new_snakes) < len(snakes):
-            new_snakes.append(SnakeAI())  # Add completely random snake
+        if rng.random() < diversity_injection_prob and len(new_snakes) < len(snakes):
+            new_snakes.append(SnakeAI(rng=next(episode_rngs)))  # Add completely random snake
     
-    return new_snakes[:len(snakes)]  # Ensure population size remains the same
\ No newline at end of file
+    return new_snakes[:len(snakes)]  # Ensure population size remains the same
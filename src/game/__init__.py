@@ -4,12 +4,17 @@ Contains game modes, configuration, and core game logic.
 """
 
 from .config import *
-from .game_modes import (
-    handle_manual_mode, handle_training_mode, 
-    handle_pretrained_mode, handle_quit_mode
-)
 
 __all__ = [
     'handle_manual_mode', 'handle_training_mode', 
     'handle_pretrained_mode', 'handle_quit_mode'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Game modes pull in pygame and the interfaces, so they load on first use;
+    # this keeps `from ..game.config import *` cheap for src.core
+    if name in __all__:
+        from . import game_modes
+        return getattr(game_modes, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,8 @@ Configuration file for Snake Gen v11.5
 Contains all constants, colors, and game settings used across the application.
 """
 
+import os
+
 # Game Constants
 WIDTH, HEIGHT = 600, 600
 TOP_BAR_HEIGHT = 50
@@ -12,12 +14,21 @@ CELL_SIZE = 20
 GAP = 2
 FPS = 60
 
+# Window Constants (one window, opened by the app bootstrap, hosts every screen)
+WINDOW_SIZE = (WIDTH + SIDE_BAR_WIDTH, HEIGHT + TOP_BAR_HEIGHT)
+WINDOW_CAPTION = "Gen Snake"
+
 # Menu Constants
 MENU_WIDTH, MENU_HEIGHT = 800, 600
 BUTTON_WIDTH, BUTTON_HEIGHT = 280, 65
 
+# Simulation Speed (ticks advanced per rendered frame; None = as many as fit in a frame)
+SIM_SPEED_STEPS = (1, 4, 16, None)
+DEFAULT_SIM_SPEED = 1
+
 # Manual Gameplay Constants
 MANUAL_FPS = 10
+MANUAL_INPUT_QUEUE_SIZE = 3  # Key presses buffered for manual play; one turn is applied per tick
 
 # 80s Sci-Fi Neon Color Palette
 WHITE = (255, 255, 255)
@@ -73,6 +84,7 @@ GLOW_ALPHA_MIN = 30      # Minimum glow opacity
 
 # Animation Timing Constants
 PULSE_SPEED = 0.02       # Speed of pulsing animations
+PULSE_ALPHA_STEPS = 8    # Distinct pulse levels, so pulsing glows reuse a few cached sprites
 SCAN_LINE_SPEED = 2.0    # Speed of scan line movement
 FADE_DURATION = 30       # Frames for fade in/out effects
 HOVER_TRANSITION = 15    # Frames for hover state transitions
@@ -83,6 +95,33 @@ CIRCUIT_GRID_SIZE = 40   # Grid spacing for circuit patterns
 CIRCUIT_ALPHA = 40       # Transparency of circuit patterns
 ENERGY_PULSE_SPEED = 1.5 # Speed of energy pulses along circuits
 
+# Render Cache Constants
+LAYER_CACHE_SIZE = 64    # Static layers kept (backgrounds, panels, scan-line textures)
+LAYER_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Memory bound for the static layer cache
+GLOW_CACHE_SIZE = 512    # Pre-rendered glow sprites kept (LRU)
+GLOW_CACHE_MAX_BYTES = 16 * 1024 * 1024  # Memory bound for the glow sprite cache
+TEXT_CACHE_SIZE = 1024   # Rendered text surfaces kept (LRU)
+TEXT_CACHE_MAX_BYTES = 16 * 1024 * 1024  # Memory bound for the text surface cache
+DIRTY_RECT_RENDERING = True  # Gameplay screens push only changed regions between full redraws
+
+# Level-of-Detail Constants
+LOD_RENDER_BUDGET = 0.5 / FPS  # Render seconds per frame before full effects are reduced
+LOD_RECOVER_RATIO = 0.6  # Fraction of the budget under which more units get full effects again
+LOD_SAMPLE_FRAMES = 10   # Frames averaged before the detail level is adjusted
+LOD_MIN_FULL_DETAIL = 4  # Units always drawn with full effects
+LOD_MAX_FULL_DETAIL = 256  # Starting (and maximum) number of full-effect units
+
+# Screen Loop Constants
+SCREEN_FPS = 30          # Frame cap for animated menus and result screens
+IDLE_WAIT_MS = 1000      # Longest block on input while a screen has nothing to animate
+
+# Effect Quality Constants
+QUALITY_LEVELS = ("HIGH", "MED", "LOW")  # Effect quality levels, best first
+QUALITY_GLOW_SCALE = (1.0, 0.5, 0.0)  # Glow spread multiplier per quality level
+QUALITY_RENDER_BUDGET = 0.75 / FPS  # Render seconds per frame before effects are degraded
+QUALITY_RECOVER_RATIO = 0.5  # Fraction of the budget under which effects are restored
+QUALITY_SAMPLE_FRAMES = 30  # Frames averaged before the quality level is adjusted
+
 # Typography Enhancement Constants
 FONT_RETRO_LARGE = 48    # Large retro font size
 FONT_RETRO_MEDIUM = 32   # Medium retro font size
@@ -117,7 +156,15 @@ AI_CONFIG = {
     "MUTATION_HIGH": 0.3,               # Mutation factor when improvement stalls
     "ELITISM_COUNT": 3,                 # Number of top snakes carried directly over
     "TOURNAMENT_SIZE": 3,               # Number of participants for tournament selection
-    "DIVERSITY_INJECTION_PROB": 0.05      # Chance to insert a completely random snake
+    "DIVERSITY_INJECTION_PROB": 0.05,     # Chance to insert a completely random snake
+    # Per-episode budgets (stop straggler snakes from holding up a generation)
+    "MAX_EPISODE_TICKS": 5000,          # Hard cap on moves per episode
+    # Base moves allowed between two meals: twice the 10 s starvation rule, so
+    # hungry snakes still starve and only snakes that loop forever are cut off
+    "MAX_TICKS_WITHOUT_FOOD": 20 * FPS,
+    "TICKS_WITHOUT_FOOD_PER_LENGTH": 10,  # Extra moves allowed per body segment
+    "MAX_EPISODE_SECONDS": None,        # Optional wall-clock cap per episode (None disables, not reproducible)
+    "SIM_TICKS_PER_SECOND": FPS         # Ticks per second of the deterministic episode clock
 }
 
 # Pre-trained AI Models
@@ -146,38 +193,29 @@ TRAINING_RECOMMENDATIONS = [
 ]
 
 # File Paths
-LOG_FILENAME = "training_log.txt"
-BACKGROUND_IMAGE_PATH = "assets/background.webp"
-FONT_PATH = "assets/PressStart2P-Regular.ttf"
+TRAINING_LOG_JSONL = "training_log.jsonl"  # One JSON record per training event
+LOG_FLUSH_BYTES = 64 * 1024  # Structured log flushes once this much is buffered...
+LOG_FLUSH_SECONDS = 2.0      # ...or once the oldest buffered record is this old
+LOG_CONSOLE_SUMMARY = True   # Echo the human-readable summary to the console
+PHASE_TIMING = True          # Time each generation phase for the summary and structured log
+PHASE_TIMING_SAMPLES = 10000  # Most recent durations kept per phase for percentiles
+CHECKPOINT_PATH = "checkpoints/training_checkpoint.npz"
+CHECKPOINT_INTERVAL = 1  # Generations between training checkpoints
+HISTORY_DIR = "runs"  # Per-run memory-mapped generation history columns
+MODEL_REGISTRY_DIR = "models"  # Best genome of every training run is saved here
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Assets")
+BACKGROUND_IMAGE_PATH = os.path.join(ASSETS_DIR, "background.webp")
+FONT_PATH = os.path.join(ASSETS_DIR, "PressStart2P-Regular.ttf")
 
 # Font System Configuration
 RETRO_FONTS = [
-    "assets/PressStart2P-Regular.ttf",  # Primary retro font
-    "assets/Orbitron-Regular.ttf",     # Futuristic alternative
+    FONT_PATH,                          # Primary retro font
+    os.path.join(ASSETS_DIR, "Orbitron-Regular.ttf"),  # Futuristic alternative
     "Courier New",                      # Monospace fallback
     "Monaco",                          # macOS monospace
     "Consolas"                         # Windows monospace
 ]
 
-# Font loading function (to be used in other modules)
-def load_retro_font(size):
-    """Load the best available retro font at specified size."""
-    import pygame
-    for font_name in RETRO_FONTS:
-        try:
-            if font_name.endswith('.ttf'):
-                # Try loading from file
-                font = pygame.font.Font(font_name, size)
-                return font
-            else:
-                # Try system font with reduced boldness
-                font = pygame.font.SysFont(font_name, size, bold=False)
-                return font
-        except:
-            continue
-    # Ultimate fallback - clean system font
-    return pygame.font.SysFont('arial', size, bold=False)
-
 # Menu Button Definitions
 MENU_BUTTONS = [
     {"text": "Manual Play", "action": "manual"},
@@ -0,0 +1,68 @@
+"""
+Controls Module for Snake Gen v12.0
+Keyboard bindings and buffered turn input for manual play.
+"""
+
+import threading
+import time
+from collections import deque
+import pygame
+from .config import *
+from ..utils.online_stats import RunningStats
+
+# Manual controls mapping (UP, DOWN, LEFT, RIGHT)
+MANUAL_DIRECTIONS = {
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
+
+
+def is_valid_turn(new_direction, current_direction):
+    """A turn must change direction without reversing onto the body."""
+    return new_direction not in (current_direction, (-current_direction[0], -current_direction[1]))
+
+
+def get_manual_direction_from_key(event_key, current_direction):
+    """Get new direction from keyboard input, preventing reversal."""
+    if event_key in MANUAL_DIRECTIONS and is_valid_turn(MANUAL_DIRECTIONS[event_key], current_direction):
+        return MANUAL_DIRECTIONS[event_key]
+    return current_direction
+
+
+class TurnQueue:
+    """Bounded queue of requested turns, consumed one per simulation tick.
+
+    Key presses are pushed from the event loop as they arrive; each tick takes
+    the first queued turn that is valid against the direction actually in
+    effect, so quick double-taps (up then left) both land on consecutive ticks.
+    """
+    
+    def __init__(self, size=MANUAL_INPUT_QUEUE_SIZE):
+        self.size = size
+        self.turns = deque()
+        self.lock = threading.Lock()
+        self.latency = RunningStats()  # Seconds from key press to the tick that applied it
+        self.dropped = 0
+
+    def push_key(self, event_key):
+        """Queue the turn bound to event_key; returns False when unbound or the queue is full."""
+        if event_key not in MANUAL_DIRECTIONS:
+            return False
+        with self.lock:
+            if len(self.turns) >= self.size:
+                self.dropped += 1
+                return False
+            self.turns.append((MANUAL_DIRECTIONS[event_key], time.perf_counter()))
+        return True
+
+    def next_direction(self, current_direction):
+        """Return the direction for this tick, applying at most one queued turn."""
+        with self.lock:
+            while self.turns:
+                direction, pressed_at = self.turns.popleft()
+                if is_valid_turn(direction, current_direction):
+                    self.latency.add(time.perf_counter() - pressed_at)
+                    return direction
+        return current_direction
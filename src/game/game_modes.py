@@ -5,9 +5,16 @@ Contains handlers for different game modes to simplify main() function.
 
 import time
 import sys
+from contextlib import ExitStack
 import pygame
 from .config import *
-from ..core.snake_ai import SnakeAI, log_and_print
+from ..core.snake_ai import SnakeAI
+from ..core.checkpoint import save_checkpoint, load_checkpoint
+from ..core.history import check_convergence
+from ..core.model_registry import register_model
+from ..utils.seeding import create_root_sequence, spawn_generators
+from ..utils.training_log import TrainingLogWriter
+from ..utils.phase_timer import phase_timer, disable_phase_timing
 from ..interfaces.training_interface import get_training_parameters, show_pretrained_models
 from ..interfaces.manual_gameplay import run_manual_mode
 
@@ -18,99 +25,173 @@ def handle_manual_mode():
     return run_manual_mode()
 
 
-def reset_training_data(generation_fitness, generation_avg_fitness, 
-                       generation_lengths, generation_avg_lengths):
-    """Reset all training history data."""
-    generation_fitness.clear()
-    generation_avg_fitness.clear()
-    generation_lengths.clear()
-    generation_avg_lengths.clear()
+def reset_training_data(training_history):
+    """Start a fresh training history run."""
+    training_history.start_run()
 
 
-def run_training_session(snakes_per_gen, num_generations, generation_fitness,
-                        generation_avg_fitness, generation_lengths, 
-                        generation_avg_lengths, run_generation_func, 
-                        enable_early_stopping=True, patience=10):
-    """Run a complete AI training session with optional early stopping."""
-    # Initialize snake population
-    snakes = [SnakeAI() for _ in range(snakes_per_gen)]
-    print(f"Starting AI Training with {snakes_per_gen} snakes per generation for {num_generations} generations.")
-    print(f"Early stopping: {'Enabled' if enable_early_stopping else 'Disabled'}")
-    print("Population size:", len(snakes))
-    
-    training_start_time = time.time()
+def run_training_session(snakes_per_gen, num_generations, training_history,
+                        run_generation_func, 
+                        enable_early_stopping=True, patience=10, seed=None, workers=1,
+                        resume_path=None, training_totals=None):
+    """Run a complete AI training session with optional early stopping.
+
+    run_generation_func plays the population it is given in place and returns
+    the evolved next generation; the best played genome of the session is
+    saved to the model registry when training ends. training_totals is the
+    caller's dict of overall bests, checkpointed and restored with the session.
+    """
+    if training_totals is None:
+        training_totals = {}
     best_weights = None
     best_fitness_ever = 0
     generations_without_improvement = 0
+    run_best_genome = None
+    run_best_fitness = float("-inf")
+    start_generation = 0
+    elapsed_before_resume = 0.0
     
-    for generation in range(num_generations):
-        # Get current generation stats
-        best_score = max((snake.score for snake in snakes if snake.alive), default=0)
-        best_length = max((snake.length for snake in snakes if snake.alive), default=0)
-        elapsed_time = round(time.time() - training_start_time, 2)
+    if resume_path:
+        # Pick up exactly where the checkpointed session stopped
+        checkpoint = load_checkpoint(resume_path)
+        AI_CONFIG.update(checkpoint["config"])
+        root_sequence = checkpoint["root_sequence"]
+        snakes = checkpoint["snakes"]
+        training_history.extend(checkpoint["history"])
+        state = checkpoint["state"]
+        num_generations = state["num_generations"]
+        best_weights = state["best_weights"]
+        best_fitness_ever = state["best_fitness_ever"]
+        generations_without_improvement = state["generations_without_improvement"]
+        elapsed_before_resume = state["elapsed_time"]
+        # Version-1 checkpoints written before the model registry lack these
+        run_best_genome = state.get("run_best_genome")
+        run_best_fitness = state.get("run_best_fitness", float("-inf"))
+        training_totals.update(state.get("training_totals", {}))
+        start_generation = checkpoint["generation"]
+        snakes_per_gen = len(snakes)
+        print(f"Resuming AI Training from {resume_path} at generation {start_generation + 1}.")
+    else:
+        # Every episode and GA step draws from a stream spawned off one root seed
+        root_sequence = create_root_sequence(seed)
         
-        # Find best snake and save its weights
-        best_snake = max(snakes, key=lambda s: s.fitness_function(), default=None)
-        if best_snake:
-            best_weights = best_snake.brain.tolist()
-            current_best_fitness = best_snake.fitness_function()
-            
-            # Track improvement for early stopping
-            if current_best_fitness > best_fitness_ever:
-                best_fitness_ever = current_best_fitness
-                generations_without_improvement = 0
-            else:
-                generations_without_improvement += 1
-        
-        # Log generation progress
-        log_and_print(f"Generation {generation+1} - Best Score: {best_score}, Length: {best_length}, Time: {elapsed_time}s")
-        
-        # Run the generation with current snake population and generation number
-        snakes = run_generation_func(snakes, generation + 1)
+        # Initialize snake population
+        snakes = [SnakeAI(rng=rng) for rng in spawn_generators(root_sequence.spawn(1)[0], snakes_per_gen)]
+    print(f"Starting AI Training with {snakes_per_gen} snakes per generation for {num_generations} generations.")
+    print(f"Early stopping: {'Enabled' if enable_early_stopping else 'Disabled'}")
+    print("Population size:", len(snakes))
+    print(f"Root seed: {root_sequence.entropy} | Workers: {workers}")
+    
+    # Worker processes are shut down and buffered log records flushed even if
+    # a generation or a checkpoint save raises
+    with ExitStack() as resources:
+        executor = None
+        if workers > 1:
+            # Process pools are only needed for headless multi-worker runs
+            from concurrent.futures import ProcessPoolExecutor
+            executor = resources.enter_context(ProcessPoolExecutor(max_workers=workers,
+                                                                  initializer=disable_phase_timing))
+        log_writer = resources.enter_context(TrainingLogWriter())
         
-        # Check for early stopping
-        if enable_early_stopping and generations_without_improvement >= patience:
-            log_and_print("=" * 50)
-            log_and_print(f" EARLY STOPPING: No improvement in {patience} generations")
-            log_and_print(f" Best fitness achieved: {best_fitness_ever:.2f}")
-            log_and_print("=" * 50)
-            break
+        training_start_time = time.time() - elapsed_before_resume
+        resources.enter_context(phase_timer.active())  # Timing is only on while training
         
-        # Check if population has converged (using function from main.py)
-        if len(generation_fitness) >= 5:
-            from main import check_convergence
-            has_converged, improvement_rate = check_convergence(generation_fitness, generation_avg_fitness)
-            if has_converged and enable_early_stopping:
-                log_and_print("=" * 50)
-                log_and_print(f" EARLY STOPPING: Population converged (improvement rate: {improvement_rate*100:.1f}%)")
-                log_and_print("=" * 50)
+        for generation in range(start_generation, num_generations):
+            # Get current generation stats
+            best_score = max((snake.score for snake in snakes if snake.alive), default=0)
+            best_length = max((snake.length for snake in snakes if snake.alive), default=0)
+            elapsed_time = round(time.time() - training_start_time, 2)
+            
+            # Find best snake and save its weights
+            best_snake = max(snakes, key=lambda s: s.fitness_function(), default=None)
+            if best_snake:
+                best_weights = best_snake.brain.tolist()
+                current_best_fitness = best_snake.fitness_function()
+                
+                # Track improvement for early stopping
+                if current_best_fitness > best_fitness_ever:
+                    best_fitness_ever = current_best_fitness
+                    generations_without_improvement = 0
+                else:
+                    generations_without_improvement += 1
+            
+            # Log generation progress
+            with phase_timer.phase("logging"):
+                log_writer.write({"event": "generation_start", "generation": generation + 1,
+                                  "best_score": best_score, "best_length": best_length,
+                                  "elapsed_time": elapsed_time})
+            
+            # Run the generation with current snake population and generation number
+            played_snakes = snakes
+            snakes = run_generation_func(played_snakes, generation + 1,
+                                         seed_sequence=root_sequence.spawn(1)[0], executor=executor,
+                                         log_writer=log_writer)
+            
+            # Remember the best genome actually played during this session
+            generation_best = max(played_snakes, key=lambda s: s.fitness_function(), default=None)
+            if generation_best and generation_best.fitness_function() > run_best_fitness:
+                run_best_fitness = generation_best.fitness_function()
+                run_best_genome = generation_best.brain.tolist()
+            
+            # Check for early stopping
+            if enable_early_stopping and generations_without_improvement >= patience:
+                log_writer.write({"event": "early_stop", "generation": generation + 1,
+                                  "reason": f"No improvement in {patience} generations "
+                                            f"(best fitness {best_fitness_ever:.2f})"})
                 break
-    
+            
+            # Check if population has converged
+            if len(training_history) >= 5:
+                has_converged, improvement_rate = check_convergence(training_history)
+                if has_converged and enable_early_stopping:
+                    log_writer.write({"event": "early_stop", "generation": generation + 1,
+                                      "reason": f"Population converged (improvement rate: {improvement_rate*100:.1f}%)"})
+                    break
+            
+            # Periodic checkpoint of the pending population and session state
+            if (generation + 1) % CHECKPOINT_INTERVAL == 0:
+                training_history.flush()
+                save_checkpoint(CHECKPOINT_PATH, snakes, training_history.as_dict(), root_sequence, generation + 1, {
+                    "num_generations": num_generations,
+                    "best_weights": best_weights,
+                    "best_fitness_ever": float(best_fitness_ever),
+                    "generations_without_improvement": generations_without_improvement,
+                    "elapsed_time": time.time() - training_start_time,
+                    "run_best_genome": run_best_genome,
+                    "run_best_fitness": float(run_best_fitness),
+                    "training_totals": dict(training_totals),
+                })
+        
+        if run_best_genome is not None:
+            entry = register_model(run_best_genome, run_best_fitness, seed=root_sequence.entropy)
+            log_writer.write({"event": "model_saved", **entry})
     training_time = round(time.time() - training_start_time, 2)
     return best_weights, training_time
 
 
-def handle_training_mode(best_score_overall, best_length_overall, 
-                        generation_fitness, generation_avg_fitness,
-                        generation_lengths, generation_avg_lengths,
-                        run_generation_func, show_training_summary_func,
-                        run_pretrained_from_training_func):
+def handle_training_mode(training_totals, training_history, run_generation_func,
+                        show_training_summary_func, run_pretrained_from_training_func, seed=None, workers=1,
+                        resume_path=None):
     """Handle AI training mode with replay functionality."""
     while True:  # Allow replaying AI training
-        snakes_per_gen, num_generations = get_training_parameters()
+        if resume_path:
+            # Population size and generation count come from the checkpoint
+            snakes_per_gen, num_generations = None, None
+        else:
+            snakes_per_gen, num_generations = get_training_parameters()
         
         # Reset training history
-        reset_training_data(generation_fitness, generation_avg_fitness,
-                           generation_lengths, generation_avg_lengths)
+        reset_training_data(training_history)
         
         # Run training session
         best_weights, training_time = run_training_session(
-            snakes_per_gen, num_generations, generation_fitness,
-            generation_avg_fitness, generation_lengths, generation_avg_lengths,
-            run_generation_func)
+            snakes_per_gen, num_generations, training_history, run_generation_func, seed=seed, workers=workers, resume_path=resume_path,
+            training_totals=training_totals)
+        resume_path = None  # Replays start a fresh session
         
         # Show training summary and handle user choice
-        action = show_training_summary_func(best_score_overall, best_length_overall, training_time)
+        action = show_training_summary_func(training_totals["best_score"],
+                                            training_totals["best_length"], training_time)
         
         if action == "replay":
             continue
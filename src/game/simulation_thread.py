@@ -0,0 +1,137 @@
+"""
+Simulation Thread Module for Snake Gen v12.0
+Runs the simulation on its own schedule and publishes immutable snapshots for rendering.
+"""
+
+import threading
+import time
+from collections import namedtuple
+import pygame
+from .config import *
+from ..utils.online_stats import RunningStats
+from ..utils.phase_timer import phase_timer
+
+# What the renderer needs of one snake; bodies and foods are copied, never shared
+UnitSnapshot = namedtuple("UnitSnapshot", ["snake", "food", "alive", "score", "length",
+                                           "direction", "start_time", "border_walls"])
+# One published state of the whole simulation
+Snapshot = namedtuple("Snapshot", ["tick", "units", "finished"])
+
+
+def snapshot_unit(snake):
+    """Copy the drawable state of a snake into an immutable UnitSnapshot."""
+    return UnitSnapshot(tuple(snake.snake), snake.food, snake.alive, snake.score, snake.length,
+                        getattr(snake, "direction", None), getattr(snake, "start_time", None),
+                        getattr(snake, "border_walls", None))
+
+
+class SnapshotBuffer:
+    """Double buffer of snapshots: the simulation fills the back slot, then swaps."""
+    
+    def __init__(self):
+        self._slots = [None, None]
+        self._front = 0
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def publish(self, snapshot):
+        """Write snapshot into the back slot and make it the front one."""
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        with self._lock:
+            self._front = back
+            self.published += 1
+
+    def latest(self):
+        """Return the most recently published snapshot (None before the first)."""
+        with self._lock:
+            return self._slots[self._front]
+
+
+class SimulationThread(threading.Thread):
+    """Advances a simulation at speed.ticks_per_second independent of rendering.
+
+    step() runs one tick and finished() ends the run; units are the snakes
+    that get snapshotted. The thread owns the units while it runs, so the
+    caller must only read them through buffer.latest() until stop() returns.
+    """
+    
+    def __init__(self, units, step, finished, speed, publish_interval=1.0 / FPS):
+        super().__init__(name="simulation", daemon=True)
+        self.units = units
+        self.step = step
+        self.finished = finished
+        self.speed = speed
+        self.publish_interval = publish_interval
+        self.buffer = SnapshotBuffer()
+        self.stop_event = threading.Event()
+        self.tick_intervals = RunningStats()  # Seconds between consecutive ticks
+        self.ticks = 0
+        self.error = None
+
+    def publish(self, finished=False):
+        self.buffer.publish(Snapshot(self.ticks, tuple(snapshot_unit(unit) for unit in self.units), finished))
+
+    def start(self):
+        # The first snapshot is published before the thread runs, so there is always one to draw
+        self.publish()
+        super().start()
+
+    def run(self):
+        try:
+            next_tick = last_tick = last_publish = time.perf_counter()
+            while not self.stop_event.is_set() and not self.finished():
+                rate = self.speed.ticks_per_second
+                if rate is not None:
+                    # Fixed schedule; after falling a whole tick behind, restart it from now
+                    period = 1.0 / rate
+                    delay = next_tick - time.perf_counter()
+                    if delay > 0 and self.stop_event.wait(delay):
+                        break
+                    next_tick = max(next_tick + period, time.perf_counter() - period)
+                
+                self.step()
+                self.ticks += 1
+                now = time.perf_counter()
+                self.tick_intervals.add(now - last_tick)
+                last_tick = now
+                if now - last_publish >= self.publish_interval:
+                    self.publish()
+                    last_publish = now
+        except Exception as error:
+            self.error = error
+        finally:
+            self.publish(finished=True)
+
+    def stop(self):
+        """Ask the simulation to stop and wait for it; re-raises an error from the thread."""
+        self.stop_event.set()
+        if self.is_alive():
+            self.join()
+        if self.error is not None:
+            raise self.error
+
+
+def render_until_finished(simulation, draw, handle_event=None):
+    """Start simulation and draw its latest snapshot every frame until it finishes.
+
+    draw(snapshot) renders (and paces) one frame; handle_event sees every
+    other event. Returns False when the window was closed, True otherwise;
+    either way the simulation thread has stopped on return.
+    """
+    simulation.start()
+    try:
+        while True:
+            with phase_timer.phase("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return False
+                    if handle_event:
+                        handle_event(event)
+            
+            snapshot = simulation.buffer.latest()
+            draw(snapshot)
+            if snapshot.finished:
+                return True
+    finally:
+        simulation.stop()
@@ -0,0 +1,58 @@
+"""
+Timestep Module for Snake Gen v12.0
+Live-adjustable simulation speed, as a tick rate relative to the frame rate.
+"""
+
+import pygame
+from .config import *
+
+# Number keys select a speed directly, TAB cycles through them
+SPEED_KEYS = {pygame.K_1: 0, pygame.K_2: 1, pygame.K_3: 2, pygame.K_4: 3}
+
+
+def parse_speed(value):
+    """Convert a CLI speed value ('1', '4', '16', 'max') into a ticks-per-frame setting."""
+    if str(value).lower() == "max":
+        return None
+    ticks = int(value)
+    if ticks < 1:
+        raise ValueError("speed must be at least 1 tick per frame")
+    return ticks
+
+
+class SimulationSpeed:
+    """Live-adjustable simulation speed; ticks_per_frame at FPS gives the tick rate."""
+    
+    def __init__(self, ticks_per_frame=DEFAULT_SIM_SPEED, frame_budget=1.0 / FPS):
+        self.steps = list(SIM_SPEED_STEPS)
+        if ticks_per_frame not in self.steps:
+            self.steps.append(ticks_per_frame)
+        self.index = self.steps.index(ticks_per_frame)
+        self.frame_budget = frame_budget  # Wall time the "max" setting may spend per frame
+
+    @property
+    def ticks_per_frame(self):
+        return self.steps[self.index]
+
+    @property
+    def ticks_per_second(self):
+        """Simulation rate when ticks run on their own schedule (None = unthrottled)."""
+        if self.ticks_per_frame is None:
+            return None
+        return self.ticks_per_frame / self.frame_budget
+
+    @property
+    def label(self):
+        return "MAX" if self.ticks_per_frame is None else f"{self.ticks_per_frame}X"
+
+    def handle_event(self, event):
+        """Apply a speed key; returns True when the event was consumed."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key in SPEED_KEYS and SPEED_KEYS[event.key] < len(self.steps):
+            self.index = SPEED_KEYS[event.key]
+            return True
+        if event.key == pygame.K_TAB:
+            self.index = (self.index + 1) % len(self.steps)
+            return True
+        return False
@@ -0,0 +1,52 @@
+"""
+Asset Manager Module for Snake Gen v12.0
+Loads image assets once and hands out display-format, pre-scaled copies.
+"""
+
+import pygame
+from .render_cache import to_display_format
+
+
+class AssetManager:
+    """Cache of loaded images and of their display-ready variants."""
+    
+    def __init__(self):
+        self._images = {}
+        self._surfaces = {}
+
+    def image(self, path):
+        """Return the image at path as loaded from disk, or None when it cannot be loaded."""
+        if path not in self._images:
+            try:
+                self._images[path] = pygame.image.load(path)
+            except (OSError, pygame.error):
+                self._images[path] = None
+        return self._images[path]
+
+    def surface(self, path, size=None, alpha=False, opacity=None):
+        """Return the image scaled to size in the display's pixel format, ready to blit.
+
+        opacity (0-255) is applied as surface alpha. Variants are only cached
+        once the window exists, since conversion needs its pixel format.
+        """
+        key = (path, size, alpha, opacity)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            return surface
+        
+        image = self.image(path)
+        if image is None:
+            return None
+        surface = pygame.transform.scale(image, size) if size and size != image.get_size() else image.copy()
+        surface = to_display_format(surface, alpha)
+        if opacity is not None:
+            surface.set_alpha(opacity)
+        if pygame.display.get_surface() is not None:
+            self._surfaces[key] = surface
+        return surface
+
+    def __len__(self):
+        return len(self._images) + len(self._surfaces)
+
+
+assets = AssetManager()
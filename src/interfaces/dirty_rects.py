@@ -0,0 +1,107 @@
+"""
+Dirty Rectangle Module for Snake Gen v12.0
+Incremental frame presenter that pushes only changed screen regions.
+"""
+
+import pygame
+from ..game.config import *
+
+
+class DirtyRectRenderer:
+    """Redraws a scene fully when it changes, and otherwise only what moved.
+
+    A frame is built in three layers: the static background (captured after
+    a full redraw), named regions such as the HUD that are redrawn when their
+    state changes, and sprites (hashable draw ops) that are cleared and
+    redrawn every frame but only pushed to the display when they changed.
+    """
+    
+    def __init__(self, enabled=DIRTY_RECT_RENDERING, bounds=None):
+        self.enabled = enabled
+        self.bounds = bounds  # op -> Rect the op can touch
+        self.scene_key = None
+        self.size = None
+        self.static_frame = None
+        self.region_states = {}
+        self.previous_ops = []
+        self.cleared = []
+        self.full_frame = True
+        self.dirty = []
+        self.full_redraws = 0
+        self.partial_frames = 0
+
+    def begin(self, surface, scene_key):
+        """Start a frame; returns True when everything must be redrawn."""
+        self.full_frame = (not self.enabled or self.static_frame is None or
+                           surface.get_size() != self.size or scene_key != self.scene_key)
+        if self.full_frame:
+            self.scene_key = scene_key
+            self.size = surface.get_size()
+            self.region_states = {}
+            self.previous_ops = []
+            self.cleared = []
+        else:
+            # Clear every sprite of the previous frame before regions are drawn,
+            # so regions and sprites stack in the same order as a full redraw
+            self.cleared = [self.bounds(op) for op in self.previous_ops]
+            for rect in self.cleared:
+                self.restore(surface, rect)
+        self.dirty = []
+        return self.full_frame
+
+    def invalidate(self):
+        """Force a full redraw on the next frame (e.g. after another screen was shown)."""
+        self.static_frame = None
+
+    def capture_background(self, surface):
+        """Remember the freshly drawn static layers of a full frame."""
+        if self.enabled:
+            self.static_frame = surface.copy()
+
+    def restore(self, surface, rect):
+        """Paint the static background back over rect."""
+        surface.blit(self.static_frame, rect, rect)
+
+    def region(self, surface, name, rect, state, draw, clip=False):
+        """Redraw a region with draw() when its state differs from the last frame
+        (or when clearing last frame's sprites painted over part of it).
+
+        With clip=True a partial redraw only touches rect, so draw() may paint
+        a larger area (e.g. one cell of a bar drawn in full).
+        """
+        rect = pygame.Rect(rect)
+        if (self.full_frame or self.region_states.get(name) != state or
+                rect.collidelist(self.cleared) != -1):
+            if not self.full_frame:
+                self.restore(surface, rect)
+            if clip and not self.full_frame:
+                previous_clip = surface.get_clip()
+                surface.set_clip(rect)
+                draw()
+                surface.set_clip(previous_clip)
+            else:
+                draw()
+            self.dirty.append(rect)
+        self.region_states[name] = state
+
+    def sprites(self, surface, ops, draw_ops):
+        """Draw sprite ops; only ops that appeared or disappeared are marked dirty.
+
+        All sprites are redrawn (they were cleared in begin), so overlapping
+        glows blend exactly as in a full redraw.
+        """
+        if not self.full_frame:
+            previous, current = set(self.previous_ops), set(ops)
+            self.dirty.extend(self.bounds(op) for op in previous.symmetric_difference(current))
+        draw_ops(surface, ops)
+        self.previous_ops = ops
+
+    def present(self):
+        """Push the frame: a flip after a full redraw, otherwise only dirty rects."""
+        if self.full_frame:
+            self.full_redraws += 1
+            pygame.display.flip()
+        else:
+            self.partial_frames += 1
+            if self.dirty:
+                pygame.display.update(self.dirty)
@@ -0,0 +1,95 @@
+"""
+Font Manager Module for Snake Gen v12.0
+Loads each font face and size once and caches rendered text surfaces.
+"""
+
+import pygame
+from ..game.config import RETRO_FONTS, TEXT_CACHE_SIZE, TEXT_CACHE_MAX_BYTES
+from .render_cache import SurfaceCache, to_display_format
+
+FALLBACK_FONT = "arial"
+
+
+class FontManager:
+    """Cache of pygame fonts keyed on (face, size)."""
+    
+    def __init__(self, retro_faces=RETRO_FONTS):
+        self.retro_faces = list(retro_faces)
+        self.retro_face = None  # First face of retro_faces that loaded successfully
+        self._fonts = {}
+
+    def get(self, face, size):
+        """Return the font for a .ttf path or system font name (None = pygame default)."""
+        key = (face, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if face is not None and face.endswith(".ttf"):
+                font = pygame.font.Font(face, size)
+            else:
+                font = pygame.font.SysFont(face, size, bold=False)
+            self._fonts[key] = font
+        return font
+
+    def retro(self, size):
+        """Return the best available retro font at the given size."""
+        if self.retro_face is not None:
+            return self.get(self.retro_face, size)
+        for face in self.retro_faces:
+            try:
+                font = self.get(face, size)
+            except (OSError, pygame.error):
+                continue
+            self.retro_face = face
+            return font
+        # Ultimate fallback - clean system font
+        self.retro_face = FALLBACK_FONT
+        return self.get(FALLBACK_FONT, size)
+
+    def __len__(self):
+        return len(self._fonts)
+
+
+font_manager = FontManager()
+text_cache = SurfaceCache(max_entries=TEXT_CACHE_SIZE, max_bytes=TEXT_CACHE_MAX_BYTES)
+
+
+def load_retro_font(size):
+    """Load the best available retro font at specified size (cached)."""
+    return font_manager.retro(size)
+
+
+def render_text(font, text, color, antialias=True, cached=True):
+    """Return the rendered surface for text, reusing it while text, font and colour match.
+
+    Pass cached=False for text that changes every frame (timers), which
+    would otherwise push reusable entries out of the cache.
+    """
+    if not cached:
+        return font.render(text, antialias, color)
+    key = ("text", font, text, tuple(color), antialias)
+    return text_cache.get(key, lambda: to_display_format(font.render(text, antialias, color)))
+
+
+def render_glow_text(font, text, color, glow_radius, glow_alpha, antialias=True):
+    """Return a sprite of text with its glow passes pre-composited.
+
+    The sprite is padded by glow_radius on every side.
+    """
+    key = ("glow_text", font, text, tuple(color), glow_radius, glow_alpha, antialias)
+    
+    def render():
+        text_surface = font.render(text, antialias, color)
+        width, height = text_surface.get_size()
+        sprite = pygame.Surface((width + glow_radius * 2, height + glow_radius * 2), pygame.SRCALPHA)
+        # Transparent pixels carry the text colour so blending does not darken the glow
+        sprite.fill((*color[:3], 0))
+        if glow_radius > 0:
+            glow_color = (*color[:3], glow_alpha // 2)  # Reduced glow intensity
+            glow_surface = font.render(text, antialias, glow_color)
+            for offset_x in range(-glow_radius, glow_radius + 1, 2):  # Skip every other pixel for lighter effect
+                for offset_y in range(-glow_radius, glow_radius + 1, 2):
+                    if offset_x != 0 or offset_y != 0:  # Skip center position
+                        sprite.blit(glow_surface, (glow_radius + offset_x, glow_radius + offset_y))
+        sprite.blit(text_surface, (glow_radius, glow_radius))
+        return to_display_format(sprite)
+    return text_cache.get(key, render)
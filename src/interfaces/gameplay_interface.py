@@ -8,6 +8,14 @@ import numpy as np
 import time
 from ..game.config import *
 from .ui_components import *
+from .fonts import load_retro_font
+from .dirty_rects import DirtyRectRenderer
+from .level_of_detail import LevelOfDetail, effect_quality
+
+# Tracks what changed between frames of the monitoring screens
+frame_renderer = DirtyRectRenderer(bounds=sprite_op_bounds)
+# Decides how many units keep full effects at the current frame time
+unit_detail = LevelOfDetail()
 
 
 def calculate_game_stats(snakes, generation_start_time):
@@ -20,8 +28,8 @@ def calculate_game_stats(snakes, generation_start_time):
     return best_score, best_length, avg_length, elapsed_time
 
 
-def draw_monitoring_hud(surface, best_score, best_length, avg_length, elapsed_time, snakes, current_generation=1):
-    """Draw the futuristic monitoring HUD with real-time data."""
+def monitoring_hud_sections(snakes, best_length, elapsed_time, current_generation=1, speed_label=None):
+    """Return the (label, value) sections shown in the monitoring HUD."""
     # Calculate additional monitoring metrics
     units_active = len([s for s in snakes if s.alive])
     total_units = len(snakes)
@@ -33,38 +41,51 @@ def draw_monitoring_hud(surface, best_score, best_length, avg_length, elapsed_ti
         ("UNITS", f"{units_active}/{total_units}"),
         ("LENGTH", str(best_length))
     ]
+    if speed_label:
+        sections.append(("SPEED", speed_label))
+    sections.append(("FX", effect_quality.label))
+    return sections
+
+
+def draw_monitoring_hud(surface, best_score, best_length, avg_length, elapsed_time, snakes, current_generation=1,
+                        speed_label=None):
+    """Draw the futuristic monitoring HUD with real-time data."""
+    sections = monitoring_hud_sections(snakes, best_length, elapsed_time, current_generation, speed_label)
     
     font_hud = load_retro_font(12)  # Smaller font to fit in grid sections
-    draw_top_bar(surface, sections, font_hud, TOP_BAR_HEIGHT, DARK_BG, NEON_CYAN)
+    draw_top_bar(surface, sections, font_hud, TOP_BAR_HEIGHT, DARK_BG, NEON_CYAN, live_labels=("TIME",))
     
-    # Add scan lines for retro monitoring effect
-    hud_surface = pygame.Surface((surface.get_width(), TOP_BAR_HEIGHT), pygame.SRCALPHA)
-    draw_scan_lines(hud_surface, line_spacing=3, line_alpha=25, animate=True)
-    surface.blit(hud_surface, (0, 0))
+    # Add scan lines for retro monitoring effect (a subsurface ignores the
+    # clip, so it is limited to the clipped part of the bar by hand)
+    bar_rect = pygame.Rect(0, 0, surface.get_width(), TOP_BAR_HEIGHT).clip(surface.get_clip())
+    draw_scan_lines(surface.subsurface(bar_rect), line_spacing=3, line_alpha=25, animate=True)
 
 
-def draw_neural_monitoring_panel(surface, generation_lengths, snakes):
-    """Draw enhanced neural network monitoring panel."""
+def neural_panel_rect():
+    """Return the rect of the generations monitoring panel."""
     panel_x = WIDTH + 10  # Move closer to game area
     panel_y = GAME_AREA_Y  # Align with game area top border
     panel_width = SIDE_BAR_WIDTH - 20  # Slightly wider by reducing margins
     panel_height = GAME_AREA_HEIGHT  # Match game area height for consistent borders
+    return pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+
+
+def draw_neural_monitoring_panel(surface, training_history, snakes):
+    """Draw enhanced neural network monitoring panel."""
+    panel_rect = neural_panel_rect()
+    panel_x, panel_y, panel_width, panel_height = panel_rect
     
     # Draw panel background with glow
-    panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
     draw_glow_rect(surface, panel_rect, ELECTRIC_PURPLE, glow_radius=4, 
                    glow_alpha=60, border_radius=8)
     
     # Panel interior
     inner_rect = pygame.Rect(panel_x + 3, panel_y + 3, panel_width - 6, panel_height - 6)
-    inner_surface = pygame.Surface((inner_rect.width, inner_rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(inner_surface, (*DARK_BG, 200), (0, 0, inner_rect.width, inner_rect.height), 
-                    border_radius=5)
-    surface.blit(inner_surface, inner_rect.topleft)
+    draw_translucent_panel(surface, inner_rect, DARK_BG, 200, border_radius=5)
     
     # Title
     font_title = load_retro_font(14)
-    title_surface = font_title.render("GENERATIONS", True, NEON_CYAN)
+    title_surface = render_text(font_title, "GENERATIONS", NEON_CYAN)
     title_x = panel_x + panel_width // 2 - title_surface.get_width() // 2
     surface.blit(title_surface, (title_x, panel_y + 10))
     
@@ -74,52 +95,51 @@ def draw_neural_monitoring_panel(surface, generation_lengths, snakes):
     
     # Show recent generations (more due to matching game area height)
     max_generations = (panel_height - 60) // 16  # Calculate based on available space
-    recent_gens = generation_lengths[-max_generations:] if len(generation_lengths) > max_generations else generation_lengths
+    recent_gens = training_history.last("best_length", max_generations)
     for i, length in enumerate(recent_gens):
-        gen_num = len(generation_lengths) - len(recent_gens) + i + 1
-        text = f"GEN {gen_num:02d}: {length:03d}"
+        gen_num = len(training_history) - len(recent_gens) + i + 1
+        text = f"GEN {gen_num:02d}: {int(length):03d}"
         color = NEON_GREEN if i == len(recent_gens) - 1 else NEON_BLUE
         
-        text_surface = font_data.render(text, True, color)
+        text_surface = render_text(font_data, text, color)
         surface.blit(text_surface, (panel_x + 10, current_y))
         current_y += 16
     
     # Add circuit pattern overlay
-    circuit_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-    draw_circuit_pattern(circuit_surface, grid_size=20, line_color=NEON_CYAN, 
+    draw_circuit_pattern(surface.subsurface(panel_rect), grid_size=20, line_color=NEON_CYAN, 
                         line_alpha=15, animate=True)
-    surface.blit(circuit_surface, (panel_x, panel_y))
 
 
-def draw_ai_unit_diagnostics(surface, model_params, snake=None):
-    """Draw enhanced AI unit diagnostic panel with improved layout."""
-    if model_params is None:
-        return
-        
+def diagnostics_panel_rect():
+    """Return the rect of the AI unit diagnostics panel."""
     # Center the panel both horizontally and vertically in the right side
-    total_width = WIDTH + SIDE_BAR_WIDTH
-    total_height = HEIGHT + TOP_BAR_HEIGHT
     panel_width = SIDE_BAR_WIDTH - 10  # Make wider to fit title properly
     panel_height = 280  # Reduced height since removing ACTIVE status
     panel_x = WIDTH + (SIDE_BAR_WIDTH - panel_width) // 2  # Center in sidebar area
     # Center vertically on the page
     panel_y = TOP_BAR_HEIGHT + (HEIGHT - panel_height) // 2
+    return pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+
+
+def draw_ai_unit_diagnostics(surface, model_params, snake=None):
+    """Draw enhanced AI unit diagnostic panel with improved layout."""
+    if model_params is None:
+        return
+        
+    panel_rect = diagnostics_panel_rect()
+    panel_x, panel_y, panel_width, panel_height = panel_rect
     
     # Draw diagnostic panel background
-    panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
     draw_glow_rect(surface, panel_rect, NEON_MAGENTA, glow_radius=4, 
                    glow_alpha=60, border_radius=8)
     
     # Panel interior
     inner_rect = pygame.Rect(panel_x + 3, panel_y + 3, panel_width - 6, panel_height - 6)
-    inner_surface = pygame.Surface((inner_rect.width, inner_rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(inner_surface, (*DARK_BG, 200), (0, 0, inner_rect.width, inner_rect.height), 
-                    border_radius=5)
-    surface.blit(inner_surface, inner_rect.topleft)
+    draw_translucent_panel(surface, inner_rect, DARK_BG, 200, border_radius=5)
     
     # Updated title to 'HYPERPARAMETERS'
     font_title = load_retro_font(12)
-    title_surface = font_title.render("HYPERPARAMETERS", True, NEON_MAGENTA)
+    title_surface = render_text(font_title, "HYPERPARAMETERS", NEON_MAGENTA)
     title_x = panel_x + panel_width // 2 - title_surface.get_width() // 2
     surface.blit(title_surface, (title_x, panel_y + 8))
     
@@ -135,13 +155,13 @@ def draw_ai_unit_diagnostics(surface, model_params, snake=None):
     for i, (label, value) in enumerate(zip(param_labels, model_params)):
         # Parameter name
         param_text = f"{label}:"
-        param_surface = font_param.render(param_text, True, NEON_ORANGE)
+        param_surface = render_text(font_param, param_text, NEON_ORANGE)
         surface.blit(param_surface, (panel_x + 5, current_y))
         
         # Parameter value positioned right after parameter text
         value_color = NEON_GREEN if value > 0 else UI_DANGER if value < -1 else NEON_CYAN
         value_text = f"{value:+.2f}"
-        value_surface = font_param.render(value_text, True, value_color)
+        value_surface = render_text(font_param, value_text, value_color)
         # Position value right after the parameter text
         param_text_width = param_surface.get_width()
         value_x = panel_x + 5 + param_text_width + 5  # 5px gap after parameter text
@@ -162,108 +182,156 @@ def draw_enhanced_game_area(surface, snakes):
     
     # Interior game area
     game_rect = pygame.Rect(GAME_AREA_X, GAME_AREA_Y, GAME_AREA_WIDTH, GAME_AREA_HEIGHT)
-    game_surface = pygame.Surface((GAME_AREA_WIDTH, GAME_AREA_HEIGHT), pygame.SRCALPHA)
-    pygame.draw.rect(game_surface, (*DARK_BG, 180), (0, 0, GAME_AREA_WIDTH, GAME_AREA_HEIGHT))
-    surface.blit(game_surface, game_rect.topleft)
+    draw_translucent_panel(surface, game_rect, DARK_BG, 180)
     
     # Add subtle scan lines to game area
-    scan_surface = pygame.Surface((GAME_AREA_WIDTH, GAME_AREA_HEIGHT), pygame.SRCALPHA)
-    draw_scan_lines(scan_surface, line_spacing=8, line_alpha=15, animate=True)
-    surface.blit(scan_surface, game_rect.topleft)
+    draw_scan_lines(surface.subsurface(game_rect), line_spacing=8, line_alpha=15, animate=True)
 
-def draw_enhanced_ai_units(surface, snakes):
-    """Draw AI units with enhanced neon visualization."""
+def ai_unit_sprite_ops(snakes, full_detail=None):
+    """Build the sprite ops for every alive AI unit and its food.
+
+    Units whose index is not in full_detail (None means all) are drawn as
+    flat cells underneath the full-effect units.
+    """
+    flat_ops, ops = [], []
+    pulse_alpha = get_pulse_alpha(100)
     for i, snake in enumerate(snakes):
         if snake.alive:
             # Enhanced snake with unit-specific colors
             unit_color = NEON_GREEN if i == 0 else MATRIX_GREEN  # Lead unit gets special color
-            draw_enhanced_snake(surface, snake.snake, unit_color, snake.alive)
+            if full_detail is not None and i not in full_detail:
+                flat_ops.extend(flat_snake_sprite_ops(snake, unit_color))
+                continue
+            ops.extend(enhanced_snake_sprite_ops(snake.snake, unit_color, snake.alive))
             
             # Enhanced food with pulsing effect
             food_center = (snake.food[0] + CELL_SIZE // 2, snake.food[1] + CELL_SIZE // 2)
             food_radius = CELL_SIZE // 2 - 2
-            pulse_alpha = get_pulse_alpha(100)
-            draw_glow_circle(surface, food_center, food_radius, CYBER_PINK, 
-                           glow_radius=GLOW_RADIUS_INNER, glow_alpha=pulse_alpha)
+            ops.append(("glow_circle", food_center, food_radius, CYBER_PINK,
+                        GLOW_RADIUS_INNER, pulse_alpha))
+    return flat_ops + ops
+
+
+def flat_snake_sprite_ops(snake, unit_color):
+    """Build low-detail sprite ops: one flat cell per segment plus the food."""
+    ops = [("cell", (x + GAP, y + GAP, CELL_SIZE - GAP * 2, CELL_SIZE - GAP * 2), unit_color)
+           for x, y in snake.snake]
+    food_inset = GAP + 2
+    ops.append(("cell", (snake.food[0] + food_inset, snake.food[1] + food_inset,
+                         CELL_SIZE - food_inset * 2, CELL_SIZE - food_inset * 2), CYBER_PINK))
+    return ops
+
+
+def draw_enhanced_ai_units(surface, snakes, full_detail=None):
+    """Draw AI units with enhanced neon visualization."""
+    draw_sprite_ops(surface, ai_unit_sprite_ops(snakes, full_detail))
 
-def draw_enhanced_snake(surface, snake_segments, unit_color, is_alive):
-    """Draw individual AI unit with enhanced visual effects."""
+
+def enhanced_snake_sprite_ops(snake_segments, unit_color, is_alive):
+    """Build the sprite ops of an individual AI unit with enhanced visual effects."""
     alpha_modifier = 1.0 if is_alive else 0.3
+    unit_color = tuple(int(c * alpha_modifier) for c in unit_color)
+    ops = []
     
     for i, segment in enumerate(snake_segments):
-        segment_rect = pygame.Rect(segment[0] + GAP, segment[1] + GAP, 
-                                  CELL_SIZE - GAP * 2, CELL_SIZE - GAP * 2)
+        segment_rect = (segment[0] + GAP, segment[1] + GAP, 
+                        CELL_SIZE - GAP * 2, CELL_SIZE - GAP * 2)
         
         # Head gets special treatment
         if i == 0:
-            head_color = tuple(int(c * alpha_modifier) for c in unit_color)
-            draw_glow_rect(surface, segment_rect, head_color, 
-                          glow_radius=4, glow_alpha=int(120 * alpha_modifier), border_radius=5)
+            ops.append(("glow_rect", segment_rect, unit_color, 4, int(120 * alpha_modifier), 5))
             
             # Add directional indicator on head
-            center_x = segment_rect.centerx
-            center_y = segment_rect.centery
-            pygame.draw.circle(surface, WHITE, (center_x, center_y), 2)
+            center = (segment_rect[0] + segment_rect[2] // 2, segment_rect[1] + segment_rect[3] // 2)
+            ops.append(("dot", center, 2, WHITE))
         else:
             # Body segments with gradient fade
             fade_alpha = max(int((100 - i * 3) * alpha_modifier), int(40 * alpha_modifier))
-            body_color = tuple(int(c * alpha_modifier) for c in unit_color)
-            draw_glow_rect(surface, segment_rect, body_color, 
-                          glow_radius=2, glow_alpha=fade_alpha, border_radius=5)
+            ops.append(("glow_rect", segment_rect, unit_color, 2, fade_alpha, 5))
+    return ops
 
 
 def draw_monitoring_background(surface):
     """Draw the real-time monitoring system background."""
-    surface.fill(DARK_BG)
-    
-    # Draw circuit pattern for monitoring aesthetic
-    draw_circuit_pattern(surface, grid_size=50, line_color=NEON_BLUE, 
-                        line_alpha=20, animate=True)
-    
-    # Add data grid overlay
-    draw_grid_overlay(surface, grid_size=30, line_color=NEON_CYAN, line_alpha=12)
+    # Circuit pattern and data grid overlay for monitoring aesthetic (cached layer)
+    draw_static_background(surface, DARK_BG,
+                           circuit=dict(grid_size=50, line_color=NEON_BLUE, line_alpha=20),
+                           grid=dict(grid_size=30, line_color=NEON_CYAN, line_alpha=12))
+    draw_circuit_pulses(surface)
     
     # Draw animated data streams
     draw_animated_lines(surface, num_lines=2, line_color=MATRIX_GREEN, speed=0.5)
 
-def draw_game(surface, snakes, generation_start_time, generation_lengths, 
-              game_mode="train_ai", model_params=None, fps_clock=None, current_generation=1):
-    """Enhanced real-time monitoring system interface."""
-    # Draw monitoring background
-    draw_monitoring_background(surface)
-    
-    # Calculate game statistics
-    best_score, best_length, avg_length, elapsed_time = calculate_game_stats(snakes, generation_start_time)
-    
-    # Draw HUD
-    draw_monitoring_hud(surface, best_score, best_length, avg_length, elapsed_time, snakes, current_generation)
-    
-    # Draw mode-specific monitoring panels
-    if game_mode == "train_ai":
-        draw_neural_monitoring_panel(surface, generation_lengths, snakes)
-    
-    if game_mode == "pretrained_ai" and model_params:
-        active_snake = next((s for s in snakes if s.alive), snakes[0] if snakes else None)
-        draw_ai_unit_diagnostics(surface, model_params, active_snake)
-    
-    # Draw enhanced game area
-    draw_enhanced_game_area(surface, snakes)
-    
-    # Draw enhanced AI units
-    draw_enhanced_ai_units(surface, snakes)
-    
-    # Add energy nodes for monitoring system aesthetic
-    node_positions = [
-        (30, TOP_BAR_HEIGHT + 30), (30, surface.get_height() - 30),
-        (WIDTH - 30, TOP_BAR_HEIGHT + 30), (WIDTH - 30, surface.get_height() - 30)
-    ]
-    draw_energy_nodes(surface, node_positions, ELECTRIC_PURPLE, pulse=True)
-    
-    # Overall scan lines for retro monitoring effect
-    draw_scan_lines(surface, line_spacing=15, line_alpha=8, animate=True)
-    
-    # Update display
-    pygame.display.flip()
+def draw_game(surface, snakes, generation_start_time, training_history, 
+              game_mode="train_ai", model_params=None, fps_clock=None, current_generation=1,
+              speed_label=None):
+    """Enhanced real-time monitoring system interface.
+
+    The whole window is redrawn when the generation (or window size)
+    changes; in between only the HUD, the units and the food are redrawn
+    and pushed to the display. The background is held still while frames
+    are drawn incrementally.
+    """
+    frame_start = time.perf_counter()
+    scene_key = (game_mode, current_generation, len(training_history))
+    # Incremental frames reuse the captured background, so it must not animate
+    with effect_quality.still(frame_renderer.enabled):
+        if frame_renderer.begin(surface, scene_key):
+            # Draw monitoring background and enhanced game area
+            draw_monitoring_background(surface)
+            draw_enhanced_game_area(surface, snakes)
+        
+            # Add energy nodes for monitoring system aesthetic
+            node_positions = [
+                (30, TOP_BAR_HEIGHT + 30), (30, surface.get_height() - 30),
+                (WIDTH - 30, TOP_BAR_HEIGHT + 30), (WIDTH - 30, surface.get_height() - 30)
+            ]
+            draw_energy_nodes(surface, node_positions, ELECTRIC_PURPLE, pulse=True)
+        
+            # Overall scan lines for retro monitoring effect
+            draw_scan_lines(surface, line_spacing=15, line_alpha=8, animate=True)
+            frame_renderer.capture_background(surface)
+    
+        # Calculate game statistics
+        best_score, best_length, avg_length, elapsed_time = calculate_game_stats(snakes, generation_start_time)
+    
+        # Draw HUD (redrawn only when one of its values changes); the timer ticks
+        # every tenth of a second, so only its own cell is redrawn for it
+        sections = monitoring_hud_sections(snakes, best_length, elapsed_time, current_generation, speed_label)
+        (_, time_text), other_sections = sections[0], tuple(sections[1:])
+    
+        def draw_hud():
+            draw_monitoring_hud(surface, best_score, best_length, avg_length,
+                                elapsed_time, snakes, current_generation, speed_label)
+    
+        # A longer timer text can change the bar's layout, so its length is part of the full HUD state
+        frame_renderer.region(surface, "hud", (0, 0, surface.get_width(), TOP_BAR_HEIGHT),
+                              (other_sections, len(time_text)), draw_hud)
+        frame_renderer.region(surface, "hud_time", (0, 0, surface.get_width() // len(sections), TOP_BAR_HEIGHT),
+                              time_text, draw_hud, clip=True)
+    
+        # Draw mode-specific monitoring panels
+        if game_mode == "train_ai":
+            frame_renderer.region(surface, "generations", neural_panel_rect().inflate(16, 16), len(training_history),
+                                  lambda: draw_neural_monitoring_panel(surface, training_history, snakes))
+    
+        if game_mode == "pretrained_ai" and model_params:
+            active_snake = next((s for s in snakes if s.alive), snakes[0] if snakes else None)
+            frame_renderer.region(surface, "diagnostics", diagnostics_panel_rect().inflate(16, 16), id(model_params),
+                                  lambda: draw_ai_unit_diagnostics(surface, model_params, active_snake))
+    
+        # Draw enhanced AI units, full effects only for as many as the frame time allows
+        sprite_start = time.perf_counter()
+        ops = ai_unit_sprite_ops(snakes, unit_detail.select(snakes))
+        frame_renderer.sprites(surface, ops, draw_sprite_ops)
+    
+        # Update display
+        frame_renderer.present()
+        unit_detail.record(time.perf_counter() - sprite_start)
+    
+    # Degrade or restore effects; a new level needs a full redraw
+    if effect_quality.record(time.perf_counter() - frame_start):
+        frame_renderer.invalidate()
     if fps_clock:
         fps_clock.tick(FPS)
 
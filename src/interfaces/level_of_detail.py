@@ -0,0 +1,116 @@
+"""
+Level-of-Detail Module for Snake Gen v12.0
+Frame-time driven levels of detail for AI units and neon effects.
+"""
+
+from contextlib import contextmanager
+from ..game.config import *
+from ..utils.online_stats import RollingWindow
+
+
+class LevelOfDetail:
+    """Adapts the number of full-effect units to the measured render time.
+
+    The longest units keep their glow heads, fading bodies and pulsing food;
+    the rest are drawn as flat cells. The count is halved while the average
+    render time is over budget and doubled again once it is well under it.
+    """
+    
+    def __init__(self, render_budget=LOD_RENDER_BUDGET, recover_ratio=LOD_RECOVER_RATIO,
+                 sample_frames=LOD_SAMPLE_FRAMES, min_full_detail=LOD_MIN_FULL_DETAIL,
+                 max_full_detail=LOD_MAX_FULL_DETAIL):
+        self.render_budget = render_budget
+        self.recover_ratio = recover_ratio
+        self.min_full_detail = min_full_detail
+        self.max_full_detail = max_full_detail
+        self.full_detail = max_full_detail
+        self.samples = RollingWindow(sample_frames)
+        self.visible_units = 0
+
+    def select(self, snakes):
+        """Return the indices of the alive units to draw with full effects."""
+        alive = [i for i, snake in enumerate(snakes) if snake.alive]
+        self.visible_units = len(alive)
+        if len(alive) <= self.full_detail:
+            return set(alive)
+        alive.sort(key=lambda i: len(snakes[i].snake), reverse=True)
+        return set(alive[:self.full_detail])
+
+    def record(self, render_seconds):
+        """Add one frame's render time and adjust the detail level when due."""
+        self.samples.push(render_seconds)
+        if not self.samples.full:
+            return
+        average = self.samples.mean
+        self.samples.clear()
+        if average > self.render_budget and self.full_detail > self.min_full_detail:
+            shown = min(self.full_detail, max(self.visible_units, 1))
+            self.full_detail = max(self.min_full_detail, shown // 2)
+        elif average < self.render_budget * self.recover_ratio and self.full_detail < self.visible_units:
+            self.full_detail = min(self.max_full_detail, self.full_detail * 2)
+
+
+class QualityGovernor:
+    """Steps the neon effects down and up one level based on frame render time.
+
+    HIGH draws everything; MED halves glow spread and freezes scan lines and
+    energy nodes; LOW drops glows, circuit pulses and animated lines. Inside
+    still() the background holds still at any level (scan lines and nodes
+    freeze, pulses and animated lines are left out), so a captured background
+    can be reused for incremental frames.
+    """
+    
+    def __init__(self, render_budget=QUALITY_RENDER_BUDGET, recover_ratio=QUALITY_RECOVER_RATIO,
+                 sample_frames=QUALITY_SAMPLE_FRAMES):
+        self.render_budget = render_budget
+        self.recover_ratio = recover_ratio
+        self.samples = RollingWindow(sample_frames)
+        self.level = 0
+        self.motion = True
+
+    @property
+    def label(self):
+        return QUALITY_LEVELS[self.level]
+
+    @property
+    def animated(self):
+        """Whether scan lines and energy nodes move."""
+        return self.motion and self.level == 0
+
+    @property
+    def background_motion(self):
+        """Whether circuit pulses and animated lines are drawn."""
+        return self.motion and self.level < len(QUALITY_LEVELS) - 1
+
+    @contextmanager
+    def still(self, frozen=True):
+        """Hold background animation still for a with-block when frozen is true."""
+        previous = self.motion
+        self.motion = previous and not frozen
+        try:
+            yield
+        finally:
+            self.motion = previous
+
+    def glow(self, glow_radius):
+        """Scale a glow spread for the current level."""
+        return int(glow_radius * QUALITY_GLOW_SCALE[self.level])
+
+    def record(self, render_seconds):
+        """Add one frame's render time; returns True when the level changed."""
+        self.samples.push(render_seconds)
+        if not self.samples.full:
+            return False
+        average = self.samples.mean
+        self.samples.clear()
+        if average > self.render_budget and self.level < len(QUALITY_LEVELS) - 1:
+            self.level += 1
+            return True
+        if average < self.render_budget * self.recover_ratio and self.level > 0:
+            self.level -= 1
+            return True
+        return False
+
+
+# Shared by every screen so effects stay consistent between menus and gameplay
+effect_quality = QualityGovernor()
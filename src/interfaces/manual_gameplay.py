@@ -3,36 +3,31 @@ import sys
 import time
 import math
 from ..game.config import *
-from ..core.snake_manual import ManualKeysSnake, get_manual_direction_from_key
+from ..core.snake_manual import ManualKeysSnake
+from ..game.controls import TurnQueue
+from ..game.timestep import SimulationSpeed
+from ..game.simulation_thread import SimulationThread, render_until_finished
 from .ui_components import *
+from .fonts import load_retro_font
+from .dirty_rects import DirtyRectRenderer
+from .level_of_detail import effect_quality
+from .screen_loop import ScreenLoop
 
-# Initialize Pygame
-pygame.init()
-
-# Setup Game Window (Enhanced Mission Control with Sidebar)
-screen = pygame.display.set_mode((WIDTH + SIDE_BAR_WIDTH, HEIGHT + TOP_BAR_HEIGHT))
-pygame.display.set_caption("SNAKE GEN - MISSION CONTROL")
+# Window surface (Enhanced Mission Control with Sidebar), handed over by the app bootstrap
+screen = None
 clock = pygame.time.Clock()
-
-# Enhanced Fonts
-font_hud = load_retro_font(20)
-font_status = load_retro_font(16)
-font_large = load_retro_font(32)
+frame_renderer = DirtyRectRenderer(bounds=sprite_op_bounds)
 
 # ManualKeysSnake class now imported from snake_manual.py
 
 
 def draw_mission_control_background():
     """Draw the mission control background with technical aesthetics."""
-    # Fill with deep space background
-    screen.fill(DARK_BG)
-    
-    # Draw subtle circuit pattern in background
-    draw_circuit_pattern(screen, grid_size=80, line_color=NEON_BLUE, 
-                        line_alpha=20, animate=True)
-    
-    # Add grid overlay for technical look
-    draw_grid_overlay(screen, grid_size=40, line_color=NEON_CYAN, line_alpha=10)
+    # Deep space fill, subtle circuit pattern and technical grid (cached layer)
+    draw_static_background(screen, DARK_BG,
+                           circuit=dict(grid_size=80, line_color=NEON_BLUE, line_alpha=20),
+                           grid=dict(grid_size=40, line_color=NEON_CYAN, line_alpha=10))
+    draw_circuit_pulses(screen)
 
 
 def draw_enhanced_monitoring_hud(snake):
@@ -52,12 +47,12 @@ def draw_enhanced_monitoring_hud(snake):
     
     # Use smaller font matching AI training interface
     font_hud_small = load_retro_font(12)
-    draw_top_bar(screen, hud_sections, font_hud_small, TOP_BAR_HEIGHT, DARK_BG, NEON_CYAN)
+    draw_top_bar(screen, hud_sections, font_hud_small, TOP_BAR_HEIGHT, DARK_BG, NEON_CYAN,
+                 live_labels=("TIME", "EFFICIENCY"))
     
     # Add scan lines to HUD for retro effect
-    hud_surface = pygame.Surface((WIDTH + SIDE_BAR_WIDTH, TOP_BAR_HEIGHT), pygame.SRCALPHA)
-    draw_scan_lines(hud_surface, line_spacing=4, line_alpha=20, animate=True)
-    screen.blit(hud_surface, (0, 0))
+    draw_scan_lines(screen.subsurface((0, 0, WIDTH + SIDE_BAR_WIDTH, TOP_BAR_HEIGHT)),
+                    line_spacing=4, line_alpha=20, animate=True)
 
 
 def draw_enhanced_game_area(snake):
@@ -70,44 +65,47 @@ def draw_enhanced_game_area(snake):
     
     # Interior game area with semi-transparent overlay
     game_rect = pygame.Rect(GAME_AREA_X, GAME_AREA_Y, GAME_AREA_WIDTH, GAME_AREA_HEIGHT)
-    game_surface = pygame.Surface((GAME_AREA_WIDTH, GAME_AREA_HEIGHT), pygame.SRCALPHA)
-    pygame.draw.rect(game_surface, (*DARK_BG, 180), (0, 0, GAME_AREA_WIDTH, GAME_AREA_HEIGHT))
-    screen.blit(game_surface, game_rect.topleft)
+    draw_translucent_panel(screen, game_rect, DARK_BG, 180)
     
     # Add subtle scan lines to game area
-    scan_surface = pygame.Surface((GAME_AREA_WIDTH, GAME_AREA_HEIGHT), pygame.SRCALPHA)
-    draw_scan_lines(scan_surface, line_spacing=8, line_alpha=15, animate=True)
-    screen.blit(scan_surface, game_rect.topleft)
+    draw_scan_lines(screen.subsurface(game_rect), line_spacing=8, line_alpha=15, animate=True)
 
-def draw_enhanced_player_snake(snake):
-    """Draw player snake with enhanced neon visualization matching AI training."""
+def player_snake_sprite_ops(snake):
+    """Build the sprite ops of the player snake and its food."""
+    ops = []
     # Enhanced snake with player-specific colors
     for i, segment in enumerate(snake.snake):
-        segment_rect = pygame.Rect(segment[0] + GAP, segment[1] + GAP, 
-                                  CELL_SIZE - GAP * 2, CELL_SIZE - GAP * 2)
+        segment_rect = (segment[0] + GAP, segment[1] + GAP, 
+                        CELL_SIZE - GAP * 2, CELL_SIZE - GAP * 2)
         
         # Head gets special treatment with directional indicator
         if i == 0:
-            draw_glow_rect(screen, segment_rect, MATRIX_GREEN, 
-                          glow_radius=4, glow_alpha=120, border_radius=5)
+            ops.append(("glow_rect", segment_rect, MATRIX_GREEN, 4, 120, 5))
             
             # Add directional indicator on head
-            center_x = segment_rect.centerx
-            center_y = segment_rect.centery
-            pygame.draw.circle(screen, WHITE, (center_x, center_y), 2)
+            center = (segment_rect[0] + segment_rect[2] // 2, segment_rect[1] + segment_rect[3] // 2)
+            ops.append(("dot", center, 2, WHITE))
         else:
             # Body segments with gradient fade
             fade_alpha = max(100 - i * 3, 40)
-            draw_glow_rect(screen, segment_rect, NEON_GREEN, 
-                          glow_radius=2, glow_alpha=fade_alpha, border_radius=5)
+            ops.append(("glow_rect", segment_rect, NEON_GREEN, 2, fade_alpha, 5))
     
     # Enhanced food with pulsing effect matching AI training
     food_center = (snake.food[0] + CELL_SIZE // 2, snake.food[1] + CELL_SIZE // 2)
     food_radius = CELL_SIZE // 2 - 2
-    pulse_alpha = get_pulse_alpha(100)
-    draw_glow_circle(screen, food_center, food_radius, CYBER_PINK, 
-                    glow_radius=GLOW_RADIUS_INNER, glow_alpha=pulse_alpha)
-    
+    ops.append(("glow_circle", food_center, food_radius, CYBER_PINK,
+                GLOW_RADIUS_INNER, get_pulse_alpha(100)))
+    return ops
+
+
+def draw_enhanced_player_snake(snake):
+    """Draw player snake with enhanced neon visualization matching AI training."""
+    draw_sprite_ops(screen, player_snake_sprite_ops(snake))
+    draw_border_walls(snake)
+
+
+def draw_border_walls(snake):
+    """Draw the static border walls of the manual game."""
     # Enhanced walls with technical borders
     for wall in snake.border_walls:
         wall_rect = pygame.Rect(wall[0], wall[1], CELL_SIZE, CELL_SIZE)
@@ -115,11 +113,14 @@ def draw_enhanced_player_snake(snake):
                       glow_radius=2, glow_alpha=80, border_radius=5)
 
 
+def directional_indicator_position():
+    """Return the centre of the directional arrow (above game area)."""
+    return GAME_AREA_X + GAME_AREA_WIDTH // 2, GAME_AREA_Y - 20
+
+
 def draw_directional_indicator(snake):
     """Draw directional arrow indicator for enhanced feedback."""
-    # Calculate arrow position (above game area)
-    arrow_x = GAME_AREA_X + GAME_AREA_WIDTH // 2
-    arrow_y = GAME_AREA_Y - 20
+    arrow_x, arrow_y = directional_indicator_position()
     
     # Direction mapping
     direction_arrows = {
@@ -130,32 +131,35 @@ def draw_directional_indicator(snake):
     }
     
     arrow_symbol = direction_arrows.get(snake.direction, "●")
-    draw_glow_text(screen, arrow_symbol, font_large, NEON_CYAN, 
+    draw_glow_text(screen, arrow_symbol, load_retro_font(32), NEON_CYAN, 
                    arrow_x, arrow_y, glow_radius=2, centered=True)
 
 
-def draw_player_stats_panel(snake):
-    """Draw enhanced player statistics monitoring panel."""
+def player_stats_panel_rect():
+    """Return the rect of the player statistics panel."""
     panel_x = WIDTH + 10  # Match AI training layout
     panel_y = GAME_AREA_Y  # Align with game area top border
     panel_width = SIDE_BAR_WIDTH - 20  # Match AI training width
     panel_height = GAME_AREA_HEIGHT  # Match game area height for consistency
+    return pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+
+
+def draw_player_stats_panel(snake):
+    """Draw enhanced player statistics monitoring panel."""
+    panel_rect = player_stats_panel_rect()
+    panel_x, panel_y, panel_width, panel_height = panel_rect
     
     # Draw panel background with glow
-    panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
     draw_glow_rect(screen, panel_rect, ELECTRIC_PURPLE, glow_radius=4, 
                    glow_alpha=60, border_radius=8)
     
     # Panel interior
     inner_rect = pygame.Rect(panel_x + 3, panel_y + 3, panel_width - 6, panel_height - 6)
-    inner_surface = pygame.Surface((inner_rect.width, inner_rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(inner_surface, (*DARK_BG, 200), (0, 0, inner_rect.width, inner_rect.height), 
-                    border_radius=5)
-    screen.blit(inner_surface, inner_rect.topleft)
+    draw_translucent_panel(screen, inner_rect, DARK_BG, 200, border_radius=5)
     
     # Title
     font_title = load_retro_font(14)
-    title_surface = font_title.render("PLAYER STATS", True, NEON_CYAN)
+    title_surface = render_text(font_title, "PLAYER STATS", NEON_CYAN)
     title_x = panel_x + panel_width // 2 - title_surface.get_width() // 2
     screen.blit(title_surface, (title_x, panel_y + 10))
     
@@ -183,12 +187,12 @@ def draw_player_stats_panel(snake):
     for i, (label, value, color) in enumerate(stats_data):
         if label:  # Skip empty spacers
             # Label
-            label_surface = font_data.render(f"{label}:", True, NEON_ORANGE)
+            label_surface = render_text(font_data, f"{label}:", NEON_ORANGE)
             screen.blit(label_surface, (panel_x + 8, current_y))
             
             # Value
             if value:
-                value_surface = font_data.render(value, True, color)
+                value_surface = render_text(font_data, value, color)
                 screen.blit(value_surface, (panel_x + 110, current_y))
         
         current_y += 18
@@ -211,39 +215,55 @@ def draw_player_stats_panel(snake):
             pygame.draw.rect(screen, (*bar_color[:3], 30), (bar_x, rating_y, 12, 6))
     
     # Add circuit pattern overlay
-    circuit_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-    draw_circuit_pattern(circuit_surface, grid_size=20, line_color=NEON_CYAN, 
-                        line_alpha=15, animate=True)
-    screen.blit(circuit_surface, (panel_x, panel_y))
+    draw_circuit_pattern(screen.subsurface((panel_x, panel_y, panel_width, panel_height)),
+                        grid_size=20, line_color=NEON_CYAN, line_alpha=15, animate=True)
 
 
 def draw_game(snake):
-    """Enhanced mission control game drawing function."""
-    # Draw all visual layers
-    draw_mission_control_background()
-    draw_enhanced_game_area(snake)
-    draw_enhanced_player_snake(snake)
-    draw_enhanced_monitoring_hud(snake)
-    draw_directional_indicator(snake)
-    draw_player_stats_panel(snake)
-    
-    # Add energy nodes for monitoring system aesthetic (matching AI training)
-    node_positions = [
-        (30, TOP_BAR_HEIGHT + 30), (30, screen.get_height() - 30),
-        (WIDTH - 30, TOP_BAR_HEIGHT + 30), (WIDTH - 30, screen.get_height() - 30)
-    ]
-    draw_energy_nodes(screen, node_positions, ELECTRIC_PURPLE, pulse=True)
+    """Enhanced mission control game drawing function.
+
+    The static layers are drawn once per game; each tick only redraws the
+    snake, the food and the HUD values that changed, with the background
+    held still.
+    """
+    # Incremental frames reuse the captured background, so it must not animate
+    with effect_quality.still(frame_renderer.enabled):
+        if frame_renderer.begin(screen, "manual"):
+            # Draw the static visual layers
+            draw_mission_control_background()
+            draw_enhanced_game_area(snake)
+            draw_border_walls(snake)
+        
+            # Add energy nodes for monitoring system aesthetic (matching AI training)
+            node_positions = [
+                (30, TOP_BAR_HEIGHT + 30), (30, screen.get_height() - 30),
+                (WIDTH - 30, TOP_BAR_HEIGHT + 30), (WIDTH - 30, screen.get_height() - 30)
+            ]
+            draw_energy_nodes(screen, node_positions, ELECTRIC_PURPLE, pulse=True)
+        
+            # Add overall scan lines for retro monitoring effect
+            draw_scan_lines(screen, line_spacing=15, line_alpha=8, animate=True)
+            frame_renderer.capture_background(screen)
     
-    # Add overall scan lines for retro monitoring effect
-    draw_scan_lines(screen, line_spacing=15, line_alpha=8, animate=True)
+        # HUD, direction arrow and stats panel are redrawn when their values change
+        elapsed_tenths = int((time.time() - snake.start_time) * 10)
+        frame_renderer.region(screen, "hud", (0, 0, WIDTH + SIDE_BAR_WIDTH, TOP_BAR_HEIGHT),
+                              (elapsed_tenths, snake.score, snake.length),
+                              lambda: draw_enhanced_monitoring_hud(snake))
+        arrow_rect = pygame.Rect(0, 0, 80, 56)
+        arrow_rect.center = directional_indicator_position()
+        frame_renderer.region(screen, "direction", arrow_rect, snake.direction,
+                              lambda: draw_directional_indicator(snake))
+        frame_renderer.region(screen, "stats", player_stats_panel_rect().inflate(16, 16),
+                              (elapsed_tenths, snake.score, snake.length, len(snake.snake)),
+                              lambda: draw_player_stats_panel(snake))
     
-    pygame.display.flip()
+        frame_renderer.sprites(screen, player_snake_sprite_ops(snake), draw_sprite_ops)
+        frame_renderer.present()
 
 
-def show_futuristic_game_over_screen(snake):
-    """Display enhanced game over screen with sci-fi terminal aesthetics."""
-    elapsed_time = round(time.time() - snake.start_time, 2)
-    
+def game_over_buttons():
+    """Return the (menu, replay) button rects of the game over screen."""
     # Updated button dimensions to match main menu
     button_width, button_height = 180, 55
     button_spacing = 25
@@ -251,65 +271,84 @@ def show_futuristic_game_over_screen(snake):
     total_height = HEIGHT + TOP_BAR_HEIGHT
     menu_button = pygame.Rect(WIDTH // 2 - button_width - button_spacing // 2, total_height // 2 + 80, button_width, button_height)
     replay_button = pygame.Rect(WIDTH // 2 + button_spacing // 2, total_height // 2 + 80, button_width, button_height)
+    return menu_button, replay_button
+
+
+def draw_futuristic_game_over(snake, elapsed_time):
+    """Draw one frame of the game over screen."""
+    menu_button, replay_button = game_over_buttons()
+    
+    # Enhanced fonts
+    font_status = load_retro_font(16)
+    font_large = load_retro_font(32)
+    
+    # Draw background with circuit pattern
+    draw_static_background(screen, DARK_BG,
+                           circuit=dict(grid_size=60, line_color=UI_DANGER, line_alpha=30))
+    draw_circuit_pulses(screen)
+    
+    # Mission failed title with reduced glow for cleaner look - centered on total screen
+    total_height = HEIGHT + TOP_BAR_HEIGHT
+    draw_glow_text(screen, "MISSION TERMINATED", font_large, UI_DANGER, 
+                   WIDTH // 2, total_height // 2 - 120, glow_radius=2, glow_alpha=40, centered=True)
+    
+    # Mission stats with enhanced styling
+    stats_data = [
+        ("MISSION DURATION", f"{elapsed_time:.1f}s"),
+        ("TARGETS ACQUIRED", f"{float(snake.score):.2f}"),
+        ("FINAL LENGTH", str(snake.length)),
+        ("STATUS", "TERMINATED")
+    ]
+    
+    # Draw stats with cleaner neon styling - centered on total screen
+    stats_y = total_height // 2 - 60
+    for i, (label, value) in enumerate(stats_data):
+        stat_text = f"{label}: {value}"
+        color = NEON_ORANGE if i < 3 else UI_DANGER
+        draw_glow_text(screen, stat_text, font_status, color, 
+                       WIDTH // 2, stats_y + i * 22, glow_radius=1, glow_alpha=25, centered=True)
+    
+    # Enhanced buttons with hover detection
+    mouse_pos = pygame.mouse.get_pos()
+    menu_hovered = menu_button.collidepoint(mouse_pos)
+    replay_hovered = replay_button.collidepoint(mouse_pos)
+    
+    # Draw holographic buttons with smaller text (matching main menu style)
+    button_font = load_retro_font(18)  # Smaller font for buttons
+    draw_holographic_button(screen, menu_button, "COMMAND", button_font, 
+                           UI_BORDER, UI_HIGHLIGHT, WHITE, menu_hovered)
+    draw_holographic_button(screen, replay_button, "RETRY", button_font, 
+                           UI_SUCCESS, NEON_GREEN, WHITE, replay_hovered)
+    
+    # Add scan lines for terminal effect
+    draw_scan_lines(screen, line_spacing=8, line_alpha=15, animate=True)
+    
+    # Add energy nodes in corners with better positioning for total screen
+    total_height = HEIGHT + TOP_BAR_HEIGHT
+    corner_positions = [
+        (50, 50), (WIDTH - 50, 50), 
+        (50, total_height - 50), (WIDTH - 50, total_height - 50)
+    ]
+    draw_energy_nodes(screen, corner_positions, UI_DANGER, pulse=True)
+    
+    # Add grid overlay for consistency with main menu
+    draw_grid_overlay(screen, grid_size=40, line_color=UI_DANGER, line_alpha=10)
+    
+    pygame.display.flip()
+
+
+def show_futuristic_game_over_screen(snake):
+    """Display enhanced game over screen with sci-fi terminal aesthetics."""
+    elapsed_time = round(time.time() - snake.start_time, 2)
+    menu_button, replay_button = game_over_buttons()
     
     # Game over screen loop
+    screen_loop = ScreenLoop()
     while True:
-        # Draw background with circuit pattern
-        screen.fill(DARK_BG)
-        draw_circuit_pattern(screen, grid_size=60, line_color=UI_DANGER, 
-                            line_alpha=30, animate=True)
-        
-        # Mission failed title with reduced glow for cleaner look - centered on total screen
-        total_height = HEIGHT + TOP_BAR_HEIGHT
-        draw_glow_text(screen, "MISSION TERMINATED", font_large, UI_DANGER, 
-                       WIDTH // 2, total_height // 2 - 120, glow_radius=2, glow_alpha=40, centered=True)
-        
-        # Mission stats with enhanced styling
-        stats_data = [
-            ("MISSION DURATION", f"{elapsed_time:.1f}s"),
-            ("TARGETS ACQUIRED", f"{float(snake.score):.2f}"),
-            ("FINAL LENGTH", str(snake.length)),
-            ("STATUS", "TERMINATED")
-        ]
-        
-        # Draw stats with cleaner neon styling - centered on total screen
-        stats_y = total_height // 2 - 60
-        for i, (label, value) in enumerate(stats_data):
-            stat_text = f"{label}: {value}"
-            color = NEON_ORANGE if i < 3 else UI_DANGER
-            draw_glow_text(screen, stat_text, font_status, color, 
-                           WIDTH // 2, stats_y + i * 22, glow_radius=1, glow_alpha=25, centered=True)
-        
-        # Enhanced buttons with hover detection
-        mouse_pos = pygame.mouse.get_pos()
-        menu_hovered = menu_button.collidepoint(mouse_pos)
-        replay_hovered = replay_button.collidepoint(mouse_pos)
-        
-        # Draw holographic buttons with smaller text (matching main menu style)
-        button_font = load_retro_font(18)  # Smaller font for buttons
-        draw_holographic_button(screen, menu_button, "COMMAND", button_font, 
-                               UI_BORDER, UI_HIGHLIGHT, WHITE, menu_hovered)
-        draw_holographic_button(screen, replay_button, "RETRY", button_font, 
-                               UI_SUCCESS, NEON_GREEN, WHITE, replay_hovered)
+        draw_futuristic_game_over(snake, elapsed_time)
         
-        # Add scan lines for terminal effect
-        draw_scan_lines(screen, line_spacing=8, line_alpha=15, animate=True)
-        
-        # Add energy nodes in corners with better positioning for total screen
-        total_height = HEIGHT + TOP_BAR_HEIGHT
-        corner_positions = [
-            (50, 50), (WIDTH - 50, 50), 
-            (50, total_height - 50), (WIDTH - 50, total_height - 50)
-        ]
-        draw_energy_nodes(screen, corner_positions, UI_DANGER, pulse=True)
-        
-        # Add grid overlay for consistency with main menu
-        draw_grid_overlay(screen, grid_size=40, line_color=UI_DANGER, line_alpha=10)
-        
-        pygame.display.flip()
-        
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events (frame-capped, idle while unfocused)
+        for event in screen_loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -326,20 +365,28 @@ def show_game_over_screen(snake):
 
 
 def run_manual_mode():
-    snake = ManualKeysSnake()
+    # The turn queue steers the engine: at most one buffered turn per step,
+    # checked against the direction in effect
+    turns = TurnQueue()
+    snake = ManualKeysSnake(controller=turns)
+    frame_renderer.invalidate()  # The menu was on screen until now
 
-    while snake.alive:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+    # The snake moves MANUAL_FPS times a second on the simulation thread, while
+    # input is read and the latest snapshot drawn at the full frame rate
+    simulation = SimulationThread([snake], snake.move, lambda: not snake.alive,
+                                  SimulationSpeed(1, frame_budget=1.0 / MANUAL_FPS))
+
+    def handle_event(event):
+        # Buffer Key Presses for Direction Changes
+        if event.type == pygame.KEYDOWN:
+            turns.push_key(event.key)
 
-            # Handle Key Press for Direction Change
-            if event.type == pygame.KEYDOWN:
-                snake.direction = get_manual_direction_from_key(event.key, snake.direction)
+    def draw_snapshot(snapshot):
+        draw_game(snapshot.units[0])
+        clock.tick(FPS)
 
-        snake.move()
-        draw_game(snake)
-        clock.tick(MANUAL_FPS)
+    if not render_until_finished(simulation, draw_snapshot, handle_event):
+        pygame.quit()
+        sys.exit()
     action = show_game_over_screen(snake)
     return action
@@ -4,25 +4,12 @@ import time
 import math
 from ..game.config import *
 from .ui_components import *
+from .fonts import load_retro_font
+from .screen_loop import ScreenLoop
+from .assets import assets
 
-# Initialize pygame
-pygame.init()
-
-# Create Pygame Screen
-screen = pygame.display.set_mode((MENU_WIDTH, MENU_HEIGHT))
-pygame.display.set_caption("SNAKE GEN v12.0 - COMMAND CENTER")
-
-# Load Enhanced Fonts
-font_title = load_retro_font(FONT_RETRO_LARGE)
-font_subtitle = load_retro_font(FONT_RETRO_MEDIUM)
-font_button = load_retro_font(FONT_RETRO_SMALL)
-font_system = load_retro_font(16)
-
-# Load background image with fallback
-try:
-    background_image = pygame.image.load(BACKGROUND_IMAGE_PATH)
-except:
-    background_image = None
+# Window surface, handed over by the app bootstrap
+screen = None
 
 # Animation state
 menu_start_time = time.time()
@@ -31,23 +18,18 @@ button_hover_states = {i: 0.0 for i in range(len(MENU_BUTTONS))}
 
 def draw_command_center_background():
     """Draw the futuristic command center background."""
-    # Fill with deep space background
-    screen.fill(DARK_BG)
-    
-    # Draw circuit board pattern background
-    draw_circuit_pattern(screen, grid_size=60, line_color=NEON_CYAN, 
-                        line_alpha=25, animate=True)
-    
-    # Add subtle grid overlay
-    draw_grid_overlay(screen, grid_size=30, line_color=NEON_BLUE, line_alpha=15)
+    # Deep space fill, circuit board pattern and subtle grid overlay (cached layer)
+    draw_static_background(screen, DARK_BG,
+                           circuit=dict(grid_size=60, line_color=NEON_CYAN, line_alpha=25),
+                           grid=dict(grid_size=30, line_color=NEON_BLUE, line_alpha=15))
+    draw_circuit_pulses(screen)
     
     # Draw animated energy lines
     draw_animated_lines(screen, num_lines=2, line_color=ELECTRIC_PURPLE, speed=0.3)
     
-    # Overlay original background if available (with transparency)
-    if background_image:
-        bg_surface = pygame.transform.scale(background_image, (MENU_WIDTH, MENU_HEIGHT))
-        bg_surface.set_alpha(40)  # Make it subtle
+    # Overlay original background if available (pre-scaled, converted and subtle)
+    bg_surface = assets.surface(BACKGROUND_IMAGE_PATH, screen.get_size(), opacity=40)
+    if bg_surface:
         screen.blit(bg_surface, (0, 0))
 
 
@@ -58,6 +40,9 @@ def draw_animated_logo():
     
     # Calculate pulsing effect
     pulse = get_glow_intensity(1.0, 0.03)
+    font_title = load_retro_font(FONT_RETRO_LARGE)
+    font_subtitle = load_retro_font(FONT_RETRO_MEDIUM)
+    font_system = load_retro_font(16)
     
     # Main title with reduced glow for cleaner look
     draw_glow_text(screen, "SNAKE GEN", font_title, NEON_CYAN, 
@@ -77,6 +62,7 @@ def draw_animated_logo():
 def draw_futuristic_buttons():
     """Draw holographic-style command buttons."""
     mouse_x, mouse_y = pygame.mouse.get_pos()
+    font_button = load_retro_font(FONT_RETRO_SMALL)
     
     for i, button in enumerate(MENU_BUTTONS):
         x = MENU_WIDTH // 2 - BUTTON_WIDTH // 2
@@ -120,7 +106,7 @@ def draw_system_status():
         ("MODE", "COMMAND")
     ]
     
-    draw_top_bar(screen, status_sections, font_system, 30, DARK_BG, NEON_CYAN)
+    draw_top_bar(screen, status_sections, load_retro_font(16), 30, DARK_BG, NEON_CYAN, live_labels=("UPTIME",))
     
     # Energy nodes in corners
     corner_positions = [
@@ -146,12 +132,13 @@ def draw_menu():
 
 def menu_screen():
     """Main menu loop with enhanced command center interface."""
-    clock = pygame.time.Clock()
+    screen_loop = ScreenLoop()
     
     while True:
         draw_menu()
 
-        for event in pygame.event.get():
+        # Animations are capped at SCREEN_FPS and pause while unfocused
+        for event in screen_loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -166,6 +153,3 @@ def menu_screen():
 
                     if x <= mouse_x <= x + BUTTON_WIDTH and y <= mouse_y <= y + BUTTON_HEIGHT:
                         return button["action"]  # Return the selected action
-        
-        # Maintain smooth animation at 60 FPS
-        clock.tick(60)
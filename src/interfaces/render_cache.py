@@ -0,0 +1,75 @@
+"""
+Render Cache Module for Snake Gen v12.0
+Bounded LRU caches for pre-rendered surfaces, shared by all screens.
+"""
+
+from collections import OrderedDict
+import pygame
+
+
+def to_display_format(surface, alpha=True):
+    """Convert a surface to the display's pixel format once a window exists."""
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert_alpha() if alpha else surface.convert()
+    return surface
+
+
+def surface_bytes(surface):
+    """Approximate memory held by a surface's pixels."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class SurfaceCache:
+    """LRU cache of rendered surfaces, bounded by entry count and optionally bytes."""
+    
+    def __init__(self, max_entries=128, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, render):
+        """Return the surface cached under key, calling render() to create it on a miss."""
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = render()
+        self._entries[key] = surface
+        self.bytes += surface_bytes(surface)
+        self._evict()
+        return surface
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is within its bounds."""
+        while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or
+                (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            _, surface = self._entries.popitem(last=False)
+            self.bytes -= surface_bytes(surface)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every cached surface (e.g. after the display mode changes)."""
+        self._entries.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return size and hit statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
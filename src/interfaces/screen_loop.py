@@ -0,0 +1,44 @@
+"""
+Screen Loop Module for Snake Gen v12.0
+Shared pacing for menus and result screens so idle screens leave the CPU alone.
+"""
+
+import pygame
+from ..game.config import *
+
+# Window events that pause or resume animation
+FOCUS_LOST_EVENTS = (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN)
+FOCUS_GAINED_EVENTS = (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN)
+
+
+class ScreenLoop:
+    """Paces a screen's draw/event loop.
+
+    While the screen animates and the window has focus, frames are capped at
+    fps. Otherwise the loop blocks in pygame.event.wait until input arrives
+    (or idle_timeout passes), so a screen that is only being read costs
+    nothing.
+    """
+    
+    def __init__(self, fps=SCREEN_FPS, idle_timeout=IDLE_WAIT_MS):
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.focused = True
+
+    def events(self, animating=True):
+        """Wait until the next frame is due and return the pending events."""
+        if animating and self.focused:
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(self.idle_timeout)
+            events = ([] if event.type == pygame.NOEVENT else [event]) + pygame.event.get()
+            self.clock.tick()  # Keep the clock from counting the wait as a slow frame
+        
+        for event in events:
+            if event.type in FOCUS_LOST_EVENTS:
+                self.focused = False
+            elif event.type in FOCUS_GAINED_EVENTS:
+                self.focused = True
+        return events
@@ -8,7 +8,13 @@ import sys
 import time
 import math
 from ..game.config import *
+from ..core.model_registry import list_models, load_model_genome
 from .ui_components import *
+from .fonts import load_retro_font
+from .screen_loop import ScreenLoop
+
+# Number of model cards that fit on one page of the database screen
+MODELS_PER_PAGE = 5
 
 
 def draw_training_recommendations_table(surface, font_small, font_table_small, start_y):
@@ -18,15 +24,15 @@ def draw_training_recommendations_table(surface, font_small, font_table_small, s
     # Column Headers
     headers = ["Training Type", "# Snakes", "# Gens", "Best Use Case"]
     for i, header in enumerate(headers):
-        header_text = font_small.render(header, True, BROWN)
+        header_text = render_text(font_small, header, BROWN)
         surface.blit(header_text, (WIDTH // 2 - 275 + sum(col_widths[:i]), start_y))
     
     # Render Table Rows
     for row, (name, snakes, gens, desc) in enumerate(TRAINING_RECOMMENDATIONS):
-        name_text = font_table_small.render(name, True, BLACK)
-        snakes_text = font_table_small.render(snakes, True, BLACK)
-        gens_text = font_table_small.render(gens, True, BLACK)
-        desc_text = font_table_small.render(desc, True, BLACK)
+        name_text = render_text(font_table_small, name, BLACK)
+        snakes_text = render_text(font_table_small, snakes, BLACK)
+        gens_text = render_text(font_table_small, gens, BLACK)
+        desc_text = render_text(font_table_small, desc, BLACK)
         
         surface.blit(name_text, (WIDTH // 2 - 275, start_y + (row + 1) * 30))
         surface.blit(snakes_text, (WIDTH // 2 - 100, start_y + (row + 1) * 30))
@@ -51,14 +57,12 @@ def validate_training_input(input_values):
 
 def draw_neural_network_background(surface):
     """Draw neural network configuration background."""
-    surface.fill(DARK_BG)
-    
-    # Draw subtle circuit pattern (reduced opacity to minimize distraction)
-    draw_circuit_pattern(surface, grid_size=50, line_color=ELECTRIC_PURPLE, 
-                        line_alpha=12, animate=True)
-    
-    # Add minimal data grid overlay
-    draw_grid_overlay(surface, grid_size=30, line_color=NEON_CYAN, line_alpha=8)
+    # Subtle circuit pattern (reduced opacity to minimize distraction) and
+    # minimal data grid overlay, rendered once and reused
+    draw_static_background(surface, DARK_BG,
+                           circuit=dict(grid_size=50, line_color=ELECTRIC_PURPLE, line_alpha=12),
+                           grid=dict(grid_size=30, line_color=NEON_CYAN, line_alpha=8))
+    draw_circuit_pulses(surface)
     
     # Draw very subtle animated neural connections
     draw_animated_lines(surface, num_lines=2, line_color=MATRIX_GREEN, speed=0.3)
@@ -76,14 +80,11 @@ def draw_futuristic_input_box(surface, rect, value, label, font, is_active=False
     
     # Brighter inner box for better contrast
     inner_rect = pygame.Rect(rect.x + 2, rect.y + 2, rect.width - 4, rect.height - 4)
-    inner_surface = pygame.Surface((inner_rect.width, inner_rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(inner_surface, (*DARK_BG, 240), (0, 0, inner_rect.width, inner_rect.height), 
-                    border_radius=6)
-    surface.blit(inner_surface, inner_rect.topleft)
+    draw_translucent_panel(surface, inner_rect, DARK_BG, 240, border_radius=6)
     
     # Draw label above box with standardized font
     label_font = load_retro_font(12)
-    label_surface = label_font.render(label, True, NEON_ORANGE)
+    label_surface = render_text(label_font, label, NEON_ORANGE)
     label_x = rect.centerx - label_surface.get_width() // 2
     label_y = rect.y - 20
     surface.blit(label_surface, (label_x, label_y))
@@ -91,14 +92,14 @@ def draw_futuristic_input_box(surface, rect, value, label, font, is_active=False
     # Draw input text with clean rendering
     if value:
         text_font = load_retro_font(16)
-        text_surface = text_font.render(value, True, WHITE)
+        text_surface = render_text(text_font, value, WHITE)
         text_x = rect.centerx - text_surface.get_width() // 2
         text_y = rect.centery - text_surface.get_height() // 2
         surface.blit(text_surface, (text_x, text_y))
     else:
         # Improved placeholder text visibility
         placeholder_font = load_retro_font(14)
-        placeholder_surface = placeholder_font.render("ENTER VALUE", True, NEON_BLUE)
+        placeholder_surface = render_text(placeholder_font, "ENTER VALUE", NEON_BLUE)
         placeholder_x = rect.centerx - placeholder_surface.get_width() // 2
         placeholder_y = rect.centery - placeholder_surface.get_height() // 2
         surface.blit(placeholder_surface, (placeholder_x, placeholder_y))
@@ -115,7 +116,7 @@ def draw_enhanced_recommendations_table(surface, start_y):
     
     # Table title with clean rendering - centered on full window
     title_font = load_retro_font(14)
-    title_surface = title_font.render("NEURAL TRAINING PROTOCOLS", True, NEON_CYAN)
+    title_surface = render_text(title_font, "NEURAL TRAINING PROTOCOLS", NEON_CYAN)
     title_x = center_x - title_surface.get_width() // 2
     surface.blit(title_surface, (title_x, start_y - 25))
     
@@ -127,7 +128,7 @@ def draw_enhanced_recommendations_table(surface, start_y):
     
     for i, header in enumerate(headers):
         # Use clean text for headers
-        header_surface = font_header.render(header, True, NEON_ORANGE)
+        header_surface = render_text(font_header, header, NEON_ORANGE)
         surface.blit(header_surface, (col_positions[i], header_y))
     
     # Add subtle column separators aligned with header positions
@@ -142,18 +143,18 @@ def draw_enhanced_recommendations_table(surface, start_y):
         row_y = header_y + 30 + row * 22
         
         # Protocol name in readable green
-        name_surface = font_data.render(name, True, NEON_GREEN)
+        name_surface = render_text(font_data, name, NEON_GREEN)
         surface.blit(name_surface, (col_positions[0], row_y))
         
         # Units and cycles in clean white for high contrast
-        snakes_surface = font_data.render(snakes, True, WHITE)
+        snakes_surface = render_text(font_data, snakes, WHITE)
         surface.blit(snakes_surface, (col_positions[1], row_y))
         
-        gens_surface = font_data.render(gens, True, WHITE)
+        gens_surface = render_text(font_data, gens, WHITE)
         surface.blit(gens_surface, (col_positions[2], row_y))
         
         # Description in lighter blue for better readability
-        desc_surface = font_data.render(desc, True, NEON_CYAN)
+        desc_surface = render_text(font_data, desc, NEON_CYAN)
         surface.blit(desc_surface, (col_positions[3], row_y))
 
 
@@ -169,7 +170,7 @@ def draw_training_setup_screen(surface, input_values, active_box, submit_button)
     
     # Title with readable text - centered on full window
     font_title = load_retro_font(24)
-    title_surface = font_title.render("NETWORK CONFIGURATION", True, NEON_CYAN)
+    title_surface = render_text(font_title, "NETWORK CONFIGURATION", NEON_CYAN)
     title_x = center_x - title_surface.get_width() // 2
     surface.blit(title_surface, (title_x, total_height // 6))
     
@@ -231,13 +232,15 @@ def get_training_parameters():
     # Improved button sizing and positioning - centered on full window
     button_width, button_height = 200, 45  # Made thinner (55 -> 45)
     submit_button = pygame.Rect(center_x - button_width // 2, total_height // 2 + 60, button_width, button_height)
+    screen_loop = ScreenLoop()
     
     while True:
         # Draw the interface
         input_boxes = draw_training_setup_screen(screen, input_values, active_box, submit_button)
+        pygame.display.flip()
         
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events (frame-capped, idle while unfocused)
+        for event in screen_loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -257,26 +260,21 @@ def get_training_parameters():
             
             # Handle keyboard input
             handle_training_input(input_values, active_box, event)
-        
-        pygame.display.flip()
 
 
 def draw_ai_database_background(surface):
     """Draw the AI unit database background with optimized effects."""
-    surface.fill(DARK_BG)
-    
-    # Phase 5: Reduced background pattern intensity for better readability
-    draw_circuit_pattern(surface, grid_size=50, line_color=ELECTRIC_PURPLE, 
-                        line_alpha=15, animate=True)  # Reduced from 25 to 15
-    
-    # Phase 5: Subtle data grid overlay
-    draw_grid_overlay(surface, grid_size=25, line_color=NEON_CYAN, line_alpha=8)  # Reduced from 15 to 8
+    # Phase 5: Reduced background pattern intensity and subtle data grid overlay (cached layer)
+    draw_static_background(surface, DARK_BG,
+                           circuit=dict(grid_size=50, line_color=ELECTRIC_PURPLE, line_alpha=15),
+                           grid=dict(grid_size=25, line_color=NEON_CYAN, line_alpha=8))
+    draw_circuit_pulses(surface)
     
     # Phase 5: Minimal animated data streams
     draw_animated_lines(surface, num_lines=2, line_color=MATRIX_GREEN, speed=0.5)  # Reduced lines and speed
 
 
-def draw_ai_unit_card(surface, rect, model_name, params, description, is_hovered, is_selected=False):
+def draw_ai_unit_card(surface, rect, model_name, weight_magnitude, description, is_hovered, is_selected=False):
     """Draw a futuristic AI unit profile card with optimized typography."""
     # Phase 3: Reduced glow effects for cleaner appearance
     card_color = NEON_MAGENTA if is_selected else (NEON_CYAN if is_hovered else ELECTRIC_PURPLE)
@@ -288,13 +286,8 @@ def draw_ai_unit_card(surface, rect, model_name, params, description, is_hovered
     
     # Clean card interior without scan lines
     inner_rect = pygame.Rect(rect.x + 5, rect.y + 5, rect.width - 10, rect.height - 10)  # More padding
-    card_surface = pygame.Surface((inner_rect.width, inner_rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(card_surface, (*DARK_BG, 220), (0, 0, inner_rect.width, inner_rect.height), 
-                    border_radius=7)
-    
     # Removed scan lines from cards for cleaner appearance
-    
-    surface.blit(card_surface, inner_rect.topleft)
+    draw_translucent_panel(surface, inner_rect, DARK_BG, 220, border_radius=7)
     
     # Updated model name with different color and moved down to fit better in card
     font_name = load_retro_font(18)  # Smaller font for shorter cards
@@ -341,7 +334,7 @@ def draw_ai_unit_card(surface, rect, model_name, params, description, is_hovered
                        rect.centerx, desc_start_y, glow_radius=0, glow_alpha=15, centered=True)
     
     # Add performance indicators to the right side of each card
-    performance_score = sum(abs(p) for p in params) / len(params)
+    performance_score = weight_magnitude
     perf_bars = int(performance_score * 2)  # Scale to 0-10 bars
     
     # Position performance indicators on the right side of the card
@@ -362,7 +355,15 @@ def draw_ai_unit_card(surface, rect, model_name, params, description, is_hovered
         draw_glow_rect(surface, bar_rect, bar_color, glow_radius=1, glow_alpha=60)
 
 
-def draw_database_header(surface):
+def describe_model_entry(entry):
+    """Build the card description for a model index entry."""
+    if entry["source"] == "builtin":
+        return entry["description"]
+    return (f"{entry['param_count']} params fitness {entry['fitness']:.0f} "
+            f"board {entry['board']} {entry['date'][:16]}")
+
+
+def draw_database_header(surface, total_models=0, first_visible=0, last_visible=0):
     """Draw the AI database header with optimized typography and positioning."""
     # Get total screen dimensions including sidebar
     total_width = WIDTH + SIDE_BAR_WIDTH
@@ -384,48 +385,42 @@ def draw_database_header(surface):
     # System status centered on full screen
     font_status = load_retro_font(12)
     current_time = time.time()
-    units_online = len(PRETRAINED_MODELS)
-    status_text = f"UNITS ONLINE: {units_online} | STATUS: OPERATIONAL"
+    status_text = f"UNITS {first_visible}-{last_visible} OF {total_models} | SCROLL FOR MORE"
     draw_glow_text(surface, status_text, font_status, MATRIX_GREEN, 
                    center_x, 135, glow_radius=0, glow_alpha=15, centered=True)
 
 
-def draw_pretrained_model_screen(surface, model_buttons, hovered_button):
-    """Draw the enhanced AI unit database selection screen."""
+def draw_pretrained_model_screen(surface, visible_entries, hovered_id, first_index=0, total_models=0):
+    """Draw the enhanced AI unit database selection screen and return the card rects."""
     # Draw background
     draw_ai_database_background(surface)
     
     # Draw header
-    draw_database_header(surface)
+    draw_database_header(surface, total_models, first_index + 1 if visible_entries else 0,
+                         first_index + len(visible_entries))
     
     # Get total screen dimensions for proper centering
     total_width = WIDTH + SIDE_BAR_WIDTH
     total_height = HEIGHT + TOP_BAR_HEIGHT
     
-    # Updated card layout to fit all 5 units on screen - centered on full screen
-    cards_per_row = 1  # Single column layout
+    # Card layout fits one page of units on screen - centered on full screen
     card_width = 320   # Keep good width for content
-    card_height = 85   # Reduced height to fit all 5 units
-    card_spacing_x = 0  # Not needed for single column
+    card_height = 85   # Reduced height to fit a full page of units
     card_spacing_y = 15  # Minimal spacing between cards
     
     start_x = (total_width - card_width) // 2  # Center relative to full screen width
     start_y = 170
     
-    for i, (button_rect, model_name, params) in enumerate(model_buttons):
-        # Phase 2: Updated positioning for single-column centered layout
-        card_x = start_x  # All cards centered horizontally
+    model_buttons = []
+    for i, entry in enumerate(visible_entries):
         card_y = start_y + i * (card_height + card_spacing_y)  # Vertical stacking
+        card_rect = pygame.Rect(start_x, card_y, card_width, card_height)
+        is_hovered = (hovered_id == entry["id"])
         
-        card_rect = pygame.Rect(card_x, card_y, card_width, card_height)
-        is_hovered = (hovered_button == model_name)
-        
-        # Update button rect for click detection
-        model_buttons[i] = (card_rect, model_name, params)
-        
-        # Draw AI unit card
-        description = MODEL_DESCRIPTIONS[model_name]
-        draw_ai_unit_card(surface, card_rect, model_name, params, description, is_hovered)
+        # Draw AI unit card from index metadata only (genomes load on selection)
+        draw_ai_unit_card(surface, card_rect, entry["name"], entry["mean_abs_weight"],
+                          describe_model_entry(entry), is_hovered)
+        model_buttons.append((card_rect, entry))
     
     # Phase 5: Optimized energy nodes for single-column layout
     node_positions = [
@@ -436,43 +431,55 @@ def draw_pretrained_model_screen(surface, model_buttons, hovered_button):
     
     # Phase 5: Consistent scan lines overlay with reduced intensity
     draw_scan_lines(surface, line_spacing=12, line_alpha=10, animate=True)  # Reduced intensity
+    
+    return model_buttons
 
 
 def show_pretrained_models():
     """Show enhanced AI unit database selection interface."""
-    # Initialize model cards (positions will be calculated in draw function)
-    model_buttons = []
-    for model_name, params in PRETRAINED_MODELS.items():
-        # Updated placeholder rect with new smaller dimensions
-        button_rect = pygame.Rect(0, 0, 320, 85)  # Updated to match new smaller card size
-        model_buttons.append((button_rect, model_name, params))
+    # Only metadata is read here; a genome is loaded when its card is picked
+    entries = list_models()
+    max_scroll = max(0, len(entries) - MODELS_PER_PAGE)
+    scroll = 0
     
-    hovered_button = None
-    clock = pygame.time.Clock()
+    hovered_id = None
+    screen_loop = ScreenLoop()
     
     while True:
         # Draw the enhanced interface
-        draw_pretrained_model_screen(screen, model_buttons, hovered_button)
+        visible_entries = entries[scroll:scroll + MODELS_PER_PAGE]
+        model_buttons = draw_pretrained_model_screen(screen, visible_entries, hovered_id,
+                                                     scroll, len(entries))
+        
+        pygame.display.flip()
         
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events (frame-capped, idle while unfocused)
+        for event in screen_loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+            elif event.type == pygame.MOUSEWHEEL:
+                scroll = min(max(scroll - event.y, 0), max_scroll)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP:
+                    scroll = max(scroll - 1, 0)
+                elif event.key == pygame.K_DOWN:
+                    scroll = min(scroll + 1, max_scroll)
+                elif event.key == pygame.K_PAGEUP:
+                    scroll = max(scroll - MODELS_PER_PAGE, 0)
+                elif event.key == pygame.K_PAGEDOWN:
+                    scroll = min(scroll + MODELS_PER_PAGE, max_scroll)
             elif event.type == pygame.MOUSEMOTION:
-                hovered_button = None
-                for button_rect, model_name, params in model_buttons:
+                hovered_id = None
+                for button_rect, entry in model_buttons:
                     if button_rect.collidepoint(event.pos):
-                        hovered_button = model_name
+                        hovered_id = entry["id"]
                         break
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                for button_rect, model_name, params in model_buttons:
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                for button_rect, entry in model_buttons:
                     if button_rect.collidepoint(event.pos):
-                        return model_name, params
-        
-        pygame.display.flip()
-        clock.tick(60)  # Smooth animations
+                        return entry["name"], load_model_genome(entry)
 
 
-# Import screen reference (will be set when this module is imported)
+# Window surface, handed over by the app bootstrap
 screen = None
\ No newline at end of file
@@ -7,13 +7,19 @@ import pygame
 import math
 import time
 from ..game.config import *
+from .render_cache import SurfaceCache, to_display_format
+from .fonts import render_text, render_glow_text
+from .level_of_detail import effect_quality
 
 
 # ===== CORE GLOW EFFECT FUNCTIONS =====
 
-def draw_glow_rect(surface, rect, color, glow_radius=GLOW_RADIUS_OUTER, glow_alpha=GLOW_ALPHA_MAX, border_radius=0):
-    """Draw a rectangle with multi-layer glow effect."""
-    # Create a temporary surface for alpha blending
+# Glow sprites depend only on their size and style, so each is rendered once
+glow_cache = SurfaceCache(max_entries=GLOW_CACHE_SIZE, max_bytes=GLOW_CACHE_MAX_BYTES)
+
+
+def _render_glow_rect(rect, color, glow_radius, glow_alpha, border_radius):
+    """Render a glowing rectangle sprite (rect position is ignored)."""
     temp_surface = pygame.Surface((rect.width + glow_radius * 4, rect.height + glow_radius * 4), pygame.SRCALPHA)
     
     # Draw multiple glow layers from outer to inner
@@ -29,12 +35,20 @@ def draw_glow_rect(surface, rect, color, glow_radius=GLOW_RADIUS_OUTER, glow_alp
     main_rect = pygame.Rect(glow_radius * 2, glow_radius * 2, rect.width, rect.height)
     pygame.draw.rect(temp_surface, color, main_rect, border_radius=border_radius)
     
-    # Blit to main surface
-    surface.blit(temp_surface, (rect.x - glow_radius * 2, rect.y - glow_radius * 2))
+    return to_display_format(temp_surface)
 
 
-def draw_glow_circle(surface, center, radius, color, glow_radius=GLOW_RADIUS_OUTER, glow_alpha=GLOW_ALPHA_MAX):
-    """Draw a circle with radial glow effect."""
+def draw_glow_rect(surface, rect, color, glow_radius=GLOW_RADIUS_OUTER, glow_alpha=GLOW_ALPHA_MAX, border_radius=0):
+    """Draw a rectangle with multi-layer glow effect."""
+    rect = pygame.Rect(rect)
+    glow_radius = effect_quality.glow(glow_radius)
+    key = ("rect", rect.size, tuple(color), glow_radius, glow_alpha, border_radius)
+    sprite = glow_cache.get(key, lambda: _render_glow_rect(rect, color, glow_radius, glow_alpha, border_radius))
+    surface.blit(sprite, (rect.x - glow_radius * 2, rect.y - glow_radius * 2))
+
+
+def _render_glow_circle(radius, color, glow_radius, glow_alpha):
+    """Render a glowing circle sprite centred in its surface."""
     total_radius = radius + glow_radius
     temp_surface = pygame.Surface((total_radius * 2, total_radius * 2), pygame.SRCALPHA)
     temp_center = (total_radius, total_radius)
@@ -48,60 +62,138 @@ def draw_glow_circle(surface, center, radius, color, glow_radius=GLOW_RADIUS_OUT
     # Draw main circle
     pygame.draw.circle(temp_surface, color, temp_center, radius)
     
-    # Blit to main surface
-    surface.blit(temp_surface, (center[0] - total_radius, center[1] - total_radius))
+    return to_display_format(temp_surface)
+
+
+def draw_glow_circle(surface, center, radius, color, glow_radius=GLOW_RADIUS_OUTER, glow_alpha=GLOW_ALPHA_MAX):
+    """Draw a circle with radial glow effect."""
+    glow_radius = effect_quality.glow(glow_radius)
+    total_radius = radius + glow_radius
+    key = ("circle", radius, tuple(color), glow_radius, glow_alpha)
+    sprite = glow_cache.get(key, lambda: _render_glow_circle(radius, color, glow_radius, glow_alpha))
+    surface.blit(sprite, (center[0] - total_radius, center[1] - total_radius))
+
+
+def draw_sprite_op(surface, op):
+    """Draw one hashable sprite op (see sprite_op_bounds for the formats)."""
+    kind = op[0]
+    if kind == "glow_rect":
+        _, rect, color, glow_radius, glow_alpha, border_radius = op
+        draw_glow_rect(surface, pygame.Rect(rect), color, glow_radius, glow_alpha, border_radius)
+    elif kind == "glow_circle":
+        _, center, radius, color, glow_radius, glow_alpha = op
+        draw_glow_circle(surface, center, radius, color, glow_radius, glow_alpha)
+    elif kind == "dot":
+        _, center, radius, color = op
+        pygame.draw.circle(surface, color, center, radius)
+    elif kind == "cell":
+        _, rect, color = op
+        surface.fill(color, rect)
+
+
+def _cell_sprite(size, color):
+    """Render a flat opaque cell used for low-detail units."""
+    sprite = pygame.Surface(size)
+    sprite.fill(color)
+    return to_display_format(sprite, alpha=False)
+
+
+def draw_sprite_ops(surface, ops):
+    """Draw a list of sprite ops, batching flat cells into one blits call."""
+    cells = []
+    for op in ops:
+        if op[0] == "cell":
+            _, (x, y, width, height), color = op
+            sprite = glow_cache.get(("cell", width, height, color), lambda: _cell_sprite((width, height), color))
+            cells.append((sprite, (x, y)))
+            continue
+        if cells:
+            surface.blits(cells, doreturn=False)
+            cells = []
+        draw_sprite_op(surface, op)
+    if cells:
+        surface.blits(cells, doreturn=False)
+
+
+def sprite_op_bounds(op):
+    """Return the screen rect a sprite op can touch.
+
+    ("glow_rect", rect, color, glow_radius, glow_alpha, border_radius)
+    ("glow_circle", center, radius, color, glow_radius, glow_alpha)
+    ("dot", center, radius, color)
+    ("cell", rect, color)
+    """
+    kind = op[0]
+    if kind == "glow_rect":
+        x, y, width, height = op[1]
+        glow_radius = op[3]
+        return pygame.Rect(x - glow_radius * 2, y - glow_radius * 2,
+                           width + glow_radius * 4, height + glow_radius * 4)
+    if kind == "glow_circle":
+        (x, y), total_radius = op[1], op[2] + op[4]
+        return pygame.Rect(x - total_radius, y - total_radius, total_radius * 2, total_radius * 2)
+    if kind == "cell":
+        return pygame.Rect(op[1])
+    (x, y), radius = op[1], op[2]
+    return pygame.Rect(x - radius, y - radius, radius * 2 + 1, radius * 2 + 1)
 
 
 def draw_glow_text(surface, text, font, color, x, y, glow_radius=TEXT_GLOW_OFFSET, glow_alpha=TEXT_SHADOW_ALPHA, centered=True, antialias=True):
     """Draw text with outer glow effect."""
-    # Render the main text with antialiasing for smoother appearance
-    text_surface = font.render(text, antialias, color)
+    # Text and its glow passes come pre-composited from the text cache
+    glow_radius = max(glow_radius, 0)
+    sprite = render_glow_text(font, text, color, glow_radius, glow_alpha, antialias)
+    text_width = sprite.get_width() - glow_radius * 2
+    text_height = sprite.get_height() - glow_radius * 2
     
     # Calculate position
     if centered:
-        text_x = x - text_surface.get_width() // 2
-        text_y = y - text_surface.get_height() // 2
+        text_x = x - text_width // 2
+        text_y = y - text_height // 2
     else:
         text_x, text_y = x, y
     
-    # Draw subtle glow by rendering text with reduced opacity
-    if glow_radius > 0:
-        glow_color = (*color[:3], glow_alpha // 2)  # Reduced glow intensity
-        for offset_x in range(-glow_radius, glow_radius + 1, 2):  # Skip every other pixel for lighter effect
-            for offset_y in range(-glow_radius, glow_radius + 1, 2):
-                if offset_x != 0 or offset_y != 0:  # Skip center position
-                    glow_surface = font.render(text, antialias, glow_color)
-                    surface.blit(glow_surface, (text_x + offset_x, text_y + offset_y))
-    
-    # Draw main text on top
-    surface.blit(text_surface, (text_x, text_y))
+    surface.blit(sprite, (text_x - glow_radius, text_y - glow_radius))
     
-    return text_surface.get_rect(topleft=(text_x, text_y))
+    return pygame.Rect(text_x, text_y, text_width, text_height)
+
+
+def _render_scan_texture(width, height, line_spacing, line_alpha):
+    """Render scan lines every 2 * line_spacing rows on a texture one period taller than needed."""
+    period = line_spacing * 2
+    texture = pygame.Surface((width, height + period), pygame.SRCALPHA)
+    for y in range(0, height + period, period):
+        pygame.draw.line(texture, (255, 255, 255, line_alpha), (0, y), (width, y), 1)
+    return to_display_format(texture)
 
 
 def draw_scan_lines(surface, line_spacing=4, line_alpha=30, animate=True):
     """Draw animated horizontal scan lines across the surface."""
     width, height = surface.get_size()
+    period = line_spacing * 2
     
-    if animate:
+    if animate and effect_quality.animated:
         # Animate scan lines moving down
-        offset = int((time.time() * SCAN_LINE_SPEED * 10) % (line_spacing * 2))
+        offset = int((time.time() * SCAN_LINE_SPEED * 10) % period)
     else:
         offset = 0
     
-    scan_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    
-    for y in range(-line_spacing + offset, height + line_spacing, line_spacing * 2):
-        pygame.draw.line(scan_surface, (255, 255, 255, line_alpha), (0, y), (width, y), 1)
-    
-    surface.blit(scan_surface, (0, 0))
+    # Scroll a pre-rendered texture (one period taller than the surface) by offset
+    texture = layer_cache.get(("scan", width, height, line_spacing, line_alpha),
+                              lambda: _render_scan_texture(width, height, line_spacing, line_alpha))
+    surface.blit(texture, (0, 0), (0, (line_spacing - offset) % period, width, height))
 
 
 # ===== ANIMATION FRAMEWORK =====
 
 def get_pulse_alpha(base_alpha=GLOW_ALPHA_MAX, speed=PULSE_SPEED):
-    """Calculate pulsing alpha value based on time."""
+    """Calculate pulsing alpha value based on time, in PULSE_ALPHA_STEPS levels.
+
+    The alpha ends up in glow sprite cache keys, so a continuous value would
+    render a new sprite nearly every frame.
+    """
     pulse = (math.sin(time.time() * speed * math.pi * 2) + 1) / 2  # 0 to 1
+    pulse = round(pulse * PULSE_ALPHA_STEPS) / PULSE_ALPHA_STEPS
     return int(base_alpha * (0.5 + 0.5 * pulse))
 
 
@@ -178,20 +270,15 @@ def draw_holographic_button(surface, rect, text, font, base_color=ELECTRIC_PURPL
     button_color = hover_color if is_hovered else base_color
     alpha = 200 if is_hovered else 150
     
-    # Create button surface with alpha
-    button_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(button_surface, (*button_color[:3], alpha), 
-                    (0, 0, rect.width, rect.height), border_radius=border_radius)
-    
-    # Add scan lines effect
-    draw_scan_lines(button_surface, line_spacing=6, line_alpha=40, animate=is_hovered)
-    
     # Draw border glow
     if is_hovered:
         draw_glow_rect(surface, rect, button_color, GLOW_RADIUS_INNER, GLOW_ALPHA_MAX, border_radius)
     
-    # Blit button to main surface
-    surface.blit(button_surface, rect.topleft)
+    # Button body with alpha, then scan lines effect on top
+    draw_translucent_panel(surface, rect, button_color, alpha, border_radius)
+    button_area = rect.clip(surface.get_rect())
+    if button_area.width and button_area.height:
+        draw_scan_lines(surface.subsurface(button_area), line_spacing=6, line_alpha=40, animate=is_hovered)
     
     # Draw text with minimal glow for cleaner appearance
     text_x = rect.centerx
@@ -202,18 +289,15 @@ def draw_holographic_button(surface, rect, text, font, base_color=ELECTRIC_PURPL
 
 # ===== CIRCUIT BOARD BACKGROUND SYSTEM =====
 
-def draw_circuit_pattern(surface, grid_size=CIRCUIT_GRID_SIZE, line_color=NEON_CYAN, 
-                        line_alpha=CIRCUIT_ALPHA, animate=True):
-    """Draw a procedural circuit board pattern background."""
-    width, height = surface.get_size()
+# Static layers are rendered once per surface size and palette, then blitted
+layer_cache = SurfaceCache(max_entries=LAYER_CACHE_SIZE, max_bytes=LAYER_CACHE_MAX_BYTES)
+
+
+def _render_circuit_layer(size, grid_size, line_color, line_alpha):
+    """Render the static traces and nodes of the circuit pattern."""
+    width, height = size
     circuit_surface = pygame.Surface((width, height), pygame.SRCALPHA)
     
-    # Animated offset for energy pulses
-    if animate:
-        pulse_offset = int((time.time() * ENERGY_PULSE_SPEED * 10) % 20)
-    else:
-        pulse_offset = 0
-    
     # Draw horizontal lines
     for y in range(0, height, grid_size):
         # Main circuit trace
@@ -233,21 +317,12 @@ def draw_circuit_pattern(surface, grid_size=CIRCUIT_GRID_SIZE, line_color=NEON_C
         pygame.draw.line(circuit_surface, (*line_color[:3], alpha), 
                         (x, 0), (x, height), CIRCUIT_LINE_WIDTH)
     
-    # Add energy pulse lines
-    if animate:
-        pulse_color = (*NEON_MAGENTA[:3], 80)
-        for i in range(0, width + height, 200):
-            pulse_x = (i + pulse_offset) % (width + 100) - 50
-            if 0 <= pulse_x <= width:
-                pygame.draw.line(circuit_surface, pulse_color, 
-                               (pulse_x, 0), (pulse_x, height), 2)
-    
-    surface.blit(circuit_surface, (0, 0))
+    return to_display_format(circuit_surface)
 
 
-def draw_grid_overlay(surface, grid_size=20, line_color=NEON_CYAN, line_alpha=20):
-    """Draw a subtle technical grid overlay."""
-    width, height = surface.get_size()
+def _render_grid_layer(size, grid_size, line_color, line_alpha):
+    """Render the static lines of the grid overlay."""
+    width, height = size
     grid_surface = pygame.Surface((width, height), pygame.SRCALPHA)
     
     # Draw grid lines
@@ -259,41 +334,122 @@ def draw_grid_overlay(surface, grid_size=20, line_color=NEON_CYAN, line_alpha=20
         pygame.draw.line(grid_surface, (*line_color[:3], line_alpha), 
                         (0, y), (width, y), 1)
     
-    surface.blit(grid_surface, (0, 0))
+    return to_display_format(grid_surface)
+
+
+def _line_sprite(length, thickness, color, vertical=True):
+    """Return a cached solid line sprite; callers set its alpha before blitting."""
+    size = (thickness, length) if vertical else (length, thickness)
+    
+    def render():
+        sprite = pygame.Surface(size)
+        sprite.fill(color[:3])
+        return to_display_format(sprite, alpha=False)
+    return layer_cache.get(("line", size, tuple(color[:3])), render)
+
+
+def draw_circuit_pulses(surface, line_color=NEON_MAGENTA, line_alpha=80):
+    """Draw the moving energy pulses of the circuit pattern."""
+    if not effect_quality.background_motion:
+        return
+    width, height = surface.get_size()
+    pulse_offset = int((time.time() * ENERGY_PULSE_SPEED * 10) % 20)
+    pulse_sprite = _line_sprite(height, 2, line_color)
+    pulse_sprite.set_alpha(line_alpha)
+    for i in range(0, width + height, 200):
+        pulse_x = (i + pulse_offset) % (width + 100) - 50
+        if 0 <= pulse_x <= width:
+            surface.blit(pulse_sprite, (pulse_x, 0))
+
+
+def draw_circuit_pattern(surface, grid_size=CIRCUIT_GRID_SIZE, line_color=NEON_CYAN, 
+                        line_alpha=CIRCUIT_ALPHA, animate=True):
+    """Draw a procedural circuit board pattern background."""
+    size = surface.get_size()
+    key = ("circuit", size, grid_size, tuple(line_color[:3]), line_alpha)
+    surface.blit(layer_cache.get(key, lambda: _render_circuit_layer(size, grid_size, line_color, line_alpha)),
+                 (0, 0))
+    
+    # Add energy pulse lines
+    if animate:
+        draw_circuit_pulses(surface)
+
+
+def draw_grid_overlay(surface, grid_size=20, line_color=NEON_CYAN, line_alpha=20):
+    """Draw a subtle technical grid overlay."""
+    size = surface.get_size()
+    key = ("grid", size, grid_size, tuple(line_color[:3]), line_alpha)
+    surface.blit(layer_cache.get(key, lambda: _render_grid_layer(size, grid_size, line_color, line_alpha)),
+                 (0, 0))
+
+
+def draw_static_background(surface, fill_color=DARK_BG, circuit=None, grid=None):
+    """Blit a cached opaque background: fill colour plus static circuit and grid layers.
+
+    circuit and grid are keyword dicts for draw_circuit_pattern / draw_grid_overlay
+    (grid_size, line_color, line_alpha). Animated parts are drawn by the caller.
+    """
+    size = surface.get_size()
+    circuit = circuit or {}
+    grid = grid or {}
+    key = ("background", size, tuple(fill_color[:3]),
+           tuple(sorted(circuit.items())), tuple(sorted(grid.items())))
+    
+    def render():
+        background = pygame.Surface(size)
+        background.fill(fill_color)
+        if circuit:
+            draw_circuit_pattern(background, animate=False, **circuit)
+        if grid:
+            draw_grid_overlay(background, **grid)
+        return to_display_format(background, alpha=False)
+    surface.blit(layer_cache.get(key, render), (0, 0))
+
+
+def draw_translucent_panel(surface, rect, color=DARK_BG, alpha=200, border_radius=0):
+    """Blit a cached semi-transparent panel fill (rounded rect) at rect."""
+    rect = pygame.Rect(rect)
+    key = ("panel", rect.size, tuple(color[:3]), alpha, border_radius)
+    
+    def render():
+        panel_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(panel_surface, (*color[:3], alpha), (0, 0, *rect.size),
+                        border_radius=border_radius)
+        return to_display_format(panel_surface)
+    surface.blit(layer_cache.get(key, render), rect.topleft)
 
 
 def draw_animated_lines(surface, num_lines=3, line_color=ELECTRIC_PURPLE, speed=1.0):
     """Draw moving energy lines across the surface."""
+    if not effect_quality.background_motion:
+        return
     width, height = surface.get_size()
     
     for i in range(num_lines):
         # Calculate animated position
         progress = ((time.time() * speed + i * 0.3) % 2.0)  # 0 to 2
         
+        # Draw line with fade effect
+        alpha = int(120 * math.sin(progress * math.pi))  # Fade in/out
+        if alpha <= 0:
+            continue
+        
         if progress <= 1.0:
             # Line moving from left to right
-            x = int(progress * width)
-            start_pos = (x, 0)
-            end_pos = (x, height)
+            line_sprite = _line_sprite(height, 2, line_color, vertical=True)
+            position = (int(progress * width), 0)
         else:
             # Line moving from top to bottom
-            y = int((progress - 1.0) * height)
-            start_pos = (0, y)
-            end_pos = (width, y)
-        
-        # Draw line with fade effect
-        alpha = int(120 * math.sin(progress * math.pi))  # Fade in/out
-        if alpha > 0:
-            line_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-            pygame.draw.line(line_surface, (*line_color[:3], alpha), 
-                           start_pos, end_pos, 2)
-            surface.blit(line_surface, (0, 0))
+            line_sprite = _line_sprite(width, 2, line_color, vertical=False)
+            position = (0, int((progress - 1.0) * height))
+        line_sprite.set_alpha(alpha)
+        surface.blit(line_sprite, position)
 
 
 def draw_energy_nodes(surface, positions, node_color=NEON_GREEN, pulse=True):
     """Draw pulsing energy nodes at specified positions."""
     for pos in positions:
-        if pulse:
+        if pulse and effect_quality.animated:
             radius = int(4 + 2 * math.sin(time.time() * 3 + pos[0] * 0.01))
             alpha = get_pulse_alpha(150, 0.05)
         else:
@@ -313,7 +469,7 @@ def draw_button(surface, rect, text, font, base_color=GRAY, hover_color=HOVER_CO
     pygame.draw.rect(surface, color, rect, border_radius=border_radius)
     
     # Render text centered on button
-    text_surface = font.render(text, True, text_color)
+    text_surface = render_text(font, text, text_color)
     text_x = rect.x + rect.width // 2 - text_surface.get_width() // 2
     text_y = rect.y + rect.height // 2 - text_surface.get_height() // 2
     surface.blit(text_surface, (text_x, text_y))
@@ -321,7 +477,7 @@ def draw_button(surface, rect, text, font, base_color=GRAY, hover_color=HOVER_CO
 
 def draw_text_centered(surface, text, font, color, x, y):
     """Draw text centered at the given position."""
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(font, text, color)
     text_x = x - text_surface.get_width() // 2
     text_y = y - text_surface.get_height() // 2
     surface.blit(text_surface, (text_x, text_y))
@@ -330,7 +486,7 @@ def draw_text_centered(surface, text, font, color, x, y):
 def draw_hud_section(surface, text, value, font, x, y, text_color=WHITE):
     """Draw a HUD information section with label and value."""
     display_text = f"{text}: {value}"
-    text_surface = font.render(display_text, True, text_color)
+    text_surface = render_text(font, display_text, text_color)
     surface.blit(text_surface, (x, y))
 
 
@@ -371,13 +527,23 @@ def draw_food(surface, food_position, color=FOOD_COLOR, cell_size=CELL_SIZE, gap
                     border_radius=5)
 
 
-def draw_top_bar(surface, sections, font, bar_height=TOP_BAR_HEIGHT, bg_color=BLACK, text_color=WHITE):
-    """Draw a top information bar with multiple sections."""
+def draw_top_bar(surface, sections, font, bar_height=TOP_BAR_HEIGHT, bg_color=BLACK, text_color=WHITE,
+                 live_labels=()):
+    """Draw a top information bar with multiple sections.
+
+    Values of sections named in live_labels change every frame and are
+    rendered without the text cache.
+    """
     # Fill background
     pygame.draw.rect(surface, bg_color, (0, 0, surface.get_width(), bar_height))
     
     # Draw vertical dividers and text
     section_width = surface.get_width() // len(sections)
+    texts = [render_text(font, f"{label}: {value}", text_color, cached=label not in live_labels)
+             for label, value in sections]
+    
+    # Stack label above value when a single line does not fit its section
+    stacked = any(text.get_width() > section_width - 8 for text in texts)
     for i, (label, value) in enumerate(sections):
         # Draw divider (except for first section)
         if i > 0:
@@ -386,11 +552,13 @@ def draw_top_bar(surface, sections, font, bar_height=TOP_BAR_HEIGHT, bg_color=BL
                            (i * section_width, bar_height), 2)
         
         # Draw text centered in each section
-        text = f"{label}: {value}"
-        text_surface = font.render(text, True, text_color)
-        x = i * section_width + (section_width - text_surface.get_width()) // 2
-        y = (bar_height - text_surface.get_height()) // 2
-        surface.blit(text_surface, (x, y))
+        lines = [render_text(font, label, text_color),
+                 render_text(font, value, text_color, cached=label not in live_labels)] if stacked else [texts[i]]
+        y = (bar_height - sum(line.get_height() for line in lines) - 4 * (len(lines) - 1)) // 2
+        for text_surface in lines:
+            x = i * section_width + (section_width - text_surface.get_width()) // 2
+            surface.blit(text_surface, (x, y))
+            y += text_surface.get_height() + 4
 
 
 def draw_game_over_dialog(surface, snake, font_large, font_small, 
@@ -461,12 +629,12 @@ def draw_sidebar_info(surface, title, info_list, font, x, y,
                      title_color=BLACK, text_color=GREEN, line_spacing=25):
     """Draw sidebar information with a title and list of items."""
     # Draw title
-    title_surface = font.render(title, True, title_color)
+    title_surface = render_text(font, title, title_color)
     surface.blit(title_surface, (x, y))
     
     # Draw information items
     for i, info in enumerate(info_list):
-        info_surface = font.render(info, True, text_color)
+        info_surface = render_text(font, info, text_color)
         surface.blit(info_surface, (x, y + (i + 1) * line_spacing))
 
 
@@ -498,7 +666,7 @@ def draw_input_box(surface, input_box):
     
     # Draw text
     if input_box['text']:
-        text_surface = input_box['font'].render(input_box['text'], True, input_box['text_color'])
+        text_surface = render_text(input_box['font'], input_box['text'], input_box['text_color'])
         surface.blit(text_surface, (rect.x + 10, rect.y + 10))
 
 
@@ -1,4 +1,14 @@
 """
 Utility Functions
-Reserved for future utility functions and helpers.
-"""
\ No newline at end of file
+Shared helpers used across the core, game and interface packages.
+"""
+
+from .seeding import create_root_sequence, spawn_generators, ensure_generator
+from .online_stats import RunningStats, RollingWindow, PopulationStats
+from .phase_timer import PhaseTimer, phase_timer, disable_phase_timing
+
+__all__ = [
+    'create_root_sequence', 'spawn_generators', 'ensure_generator',
+    'RunningStats', 'RollingWindow', 'PopulationStats',
+    'PhaseTimer', 'phase_timer', 'disable_phase_timing'
+]
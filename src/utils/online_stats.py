@@ -0,0 +1,141 @@
+"""
+Online Statistics Module for Snake Gen v12.0
+Single-pass accumulators for population metrics and rolling convergence windows.
+"""
+
+import math
+from collections import deque
+
+
+class RunningStats:
+    """Welford accumulator for count, mean, population std, min and max."""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Fold one observation into the running moments."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def variance(self):
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+class RollingWindow:
+    """Fixed-size window keeping a running sum and sum of squares."""
+    
+    def __init__(self, size):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def push(self, value):
+        """Add a value, dropping the oldest one once the window is full."""
+        value = float(value)
+        if len(self.values) == self.size:
+            oldest = self.values[0]
+            self.total -= oldest
+            self.total_sq -= oldest * oldest
+        self.values.append(value)
+        self.total += value
+        self.total_sq += value * value
+
+    def clear(self):
+        """Empty the window."""
+        self.values.clear()
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def full(self):
+        return len(self.values) == self.size
+
+    @property
+    def mean(self):
+        return self.total / len(self.values) if self.values else 0.0
+
+    @property
+    def variance(self):
+        """Population variance of the window (same as np.var)."""
+        if not self.values:
+            return 0.0
+        return max(self.total_sq / len(self.values) - self.mean ** 2, 0.0)
+
+    @property
+    def first(self):
+        return self.values[0]
+
+    @property
+    def last(self):
+        return self.values[-1]
+
+
+class PopulationStats:
+    """Per-generation metrics, fed once per snake as its episode ends."""
+    
+    def __init__(self):
+        self.fitness = RunningStats()
+        self.length = RunningStats()
+        self.score = RunningStats()
+        self.successful = 0
+        self.length_distribution = {}
+        self.termination_reasons = {}
+        self.best_snake = None
+
+    def add(self, snake):
+        """Record a finished snake (fitness is evaluated exactly once)."""
+        fitness = snake.fitness_function()
+        if self.best_snake is None or fitness > self.fitness.max:
+            self.best_snake = snake
+        self.fitness.add(fitness)
+        self.length.add(snake.length)
+        self.score.add(snake.score)
+        if snake.length > 0:
+            self.successful += 1
+        self.length_distribution[snake.length] = self.length_distribution.get(snake.length, 0) + 1
+        reason = snake.termination_reason or "running"
+        self.termination_reasons[reason] = self.termination_reasons.get(reason, 0) + 1
+
+    def extend(self, snakes):
+        """Record several finished snakes."""
+        for snake in snakes:
+            self.add(snake)
+
+    def __len__(self):
+        return self.fitness.count
+
+    def summary(self):
+        """Return the generation metrics dict (without diversity)."""
+        count = self.fitness.count
+        return {
+            'best_fitness': self.fitness.max if count else 0,
+            'avg_fitness': self.fitness.mean,
+            'std_fitness': self.fitness.std,
+            'best_length': self.length.max if count else 0,
+            'avg_length': self.length.mean,
+            'best_score': self.score.max if count else 0,
+            'avg_score': self.score.mean,
+            'success_rate': self.successful / count if count else 0,
+            'length_distribution': dict(sorted(self.length_distribution.items())),
+            'termination_reasons': dict(self.termination_reasons),
+        }
@@ -0,0 +1,148 @@
+"""
+Phase Timing Module for Snake Gen v12.0
+Named timers for the phases of a training generation, close to free when disabled.
+"""
+
+import functools
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+from ..game.config import *
+
+
+class PhaseStats:
+    """Exact count, total and max of one phase, plus its most recent durations."""
+
+    def __init__(self, max_samples):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=max_samples)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+
+    def summary(self):
+        """Totals in seconds and per-occurrence times in milliseconds."""
+        p50, p95 = np.percentile(self.samples, (50, 95)) if self.samples else (0.0, 0.0)
+        return {
+            "count": self.count,
+            "total_seconds": self.total,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": float(p50) * 1000,
+            "p95_ms": float(p95) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class _Phase:
+    """Context manager adding its elapsed time to one phase."""
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timer.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NoPhase:
+    """Shared do-nothing context manager handed out while timing is disabled."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+class PhaseTimer:
+    """Registry of named phase timings, collected per generation.
+
+    Phases are timed with the phase(name) context manager or the
+    timed(name) decorator. Timing is off until a with-block of active()
+    turns it on, so decisions made outside training cost nothing. Each phase is recorded from a single thread (the
+    simulation thread times moves and decisions, the main thread everything
+    else), so no lock is needed.
+    """
+
+    def __init__(self, enabled=False, max_samples=PHASE_TIMING_SAMPLES):
+        self.enabled = enabled
+        self.max_samples = max_samples
+        self.phases = {}
+
+    @contextmanager
+    def active(self, enabled=PHASE_TIMING):
+        """Time phases for the duration of a with-block, starting from no phases."""
+        previous = self.enabled
+        self.enabled = enabled
+        self.reset()
+        try:
+            yield self
+        finally:
+            self.enabled = previous
+
+    def phase(self, name):
+        """Context manager timing one occurrence of a phase."""
+        return _Phase(self, name) if self.enabled else _NO_PHASE
+
+    def timed(self, name):
+        """Decorator timing every call of a function as one occurrence of a phase."""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.add(name, time.perf_counter() - start)
+            return wrapper
+        return decorate
+
+    def add(self, name, seconds):
+        """Record one occurrence of a phase that took seconds."""
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases.setdefault(name, PhaseStats(self.max_samples))
+        stats.add(seconds)
+
+    def summary(self):
+        """Return {phase: stats} for every phase recorded since the last reset."""
+        return {name: stats.summary() for name, stats in list(self.phases.items())}
+
+    def reset(self):
+        """Forget every recorded phase."""
+        self.phases = {}
+
+    def take(self):
+        """Return the summary and start collecting afresh."""
+        summary = self.summary()
+        self.reset()
+        return summary
+
+
+# Shared by the training loop, the simulation thread and the AI snakes
+phase_timer = PhaseTimer()
+
+
+def disable_phase_timing():
+    """Process pool initializer: worker timings are never collected, so skip them."""
+    phase_timer.enabled = False
@@ -0,0 +1,21 @@
+"""
+Seeding Utilities for Snake Gen v12.0
+Derives independent, reproducible random streams from a single root seed.
+"""
+
+import numpy as np
+
+
+def create_root_sequence(seed=None):
+    """Create the root SeedSequence of a run (fresh OS entropy when seed is None)."""
+    return np.random.SeedSequence(seed)
+
+
+def spawn_generators(seed_sequence, count):
+    """Spawn one independent numpy Generator per child of the given SeedSequence."""
+    return [np.random.default_rng(child) for child in seed_sequence.spawn(count)]
+
+
+def ensure_generator(rng=None):
+    """Return the given Generator, or a freshly seeded one when rng is None."""
+    return rng if rng is not None else np.random.default_rng()
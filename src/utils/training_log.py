@@ -0,0 +1,191 @@
+"""
+Structured Training Log for Snake Gen v12.0
+Writes one JSON record per training event through a buffered background writer.
+"""
+
+import atexit
+import json
+import queue
+import threading
+import time
+import numpy as np
+from ..game.config import *
+
+_STOP = object()
+
+
+def _to_json(value):
+    """Convert numpy scalars and arrays into JSON-serialisable values."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class TrainingLogWriter:
+    """Buffered JSON-lines writer that flushes on a background thread.
+
+    Records are serialised on the caller's thread, so a record that cannot be
+    encoded raises from write() and later changes to the caller's dict do not
+    reach the file. A failed file write stops the writer and is re-raised by
+    the next write() or by close().
+    """
+    
+    def __init__(self, path=TRAINING_LOG_JSONL, flush_bytes=LOG_FLUSH_BYTES,
+                 flush_seconds=LOG_FLUSH_SECONDS, console=LOG_CONSOLE_SUMMARY):
+        self.path = path
+        self.flush_bytes = flush_bytes
+        self.flush_seconds = flush_seconds
+        self.console = console
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="training-log-writer", daemon=True)
+        self._thread.start()
+        # Flush buffered records even if the game exits mid-training
+        atexit.register(self.close)
+
+    def write(self, record):
+        """Queue a record for the log file and optionally echo its summary to the console."""
+        self._raise_error()
+        record = dict(record)
+        record.setdefault("timestamp", time.time())
+        self._queue.put(json.dumps(record, default=_to_json) + "\n")
+        if self.console:
+            for line in format_record(record):
+                print(line)
+
+    def close(self):
+        """Flush every pending record and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        atexit.unregister(self.close)
+        self._raise_error()
+
+    def _raise_error(self):
+        """Re-raise a file error from the writer thread in the caller's thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self):
+        """Write queued lines until stopped, keeping the first file error for the caller."""
+        try:
+            self._drain()
+        except Exception as error:
+            self._error = error
+
+    def _drain(self):
+        """Drain the queue, flushing when the buffer is large or its oldest record is old."""
+        buffer = []
+        buffered_bytes = 0
+        oldest_record_time = None
+        with open(self.path, "a") as log_file:
+            while True:
+                if oldest_record_time is None:
+                    timeout = None  # Nothing buffered: sleep until the next record
+                else:
+                    timeout = max(0.0, self.flush_seconds - (time.monotonic() - oldest_record_time))
+                try:
+                    line = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    line = None
+
+                if line is not None and line is not _STOP:
+                    buffer.append(line)
+                    buffered_bytes += len(line)
+                    if oldest_record_time is None:
+                        oldest_record_time = time.monotonic()
+
+                if buffer and (line is _STOP or buffered_bytes >= self.flush_bytes or
+                               time.monotonic() - oldest_record_time >= self.flush_seconds):
+                    log_file.write("".join(buffer))
+                    log_file.flush()
+                    buffer.clear()
+                    buffered_bytes = 0
+                    oldest_record_time = None
+                if line is _STOP:
+                    return
+
+
+# ===== HUMAN-READABLE FORMATTERS =====
+
+def format_generation_summary(record):
+    """Format a generation record as the classic console summary."""
+    metrics = record["metrics"]
+    best_weights = record["best_weights"]
+    lines = [
+        "=" * 50,
+        f" Generation {record['generation']} Summary ",
+        "=" * 50,
+        f" Best Fitness Score: {metrics['best_fitness']:.2f}",
+        f" Average Fitness Score: {metrics['avg_fitness']:.2f} (±{metrics['std_fitness']:.2f})",
+        f" Best Length Achieved: {metrics['best_length']}",
+        f" Average Length: {metrics['avg_length']:.2f}",
+        f" Population Diversity: {metrics['diversity']:.3f}",
+        f" Success Rate: {metrics['success_rate']*100:.1f}%",
+        f" Truncated Episodes: {metrics['truncated']}/{record['population']}",
+        " Termination Reasons: " + ", ".join(
+            f"{reason}: {count}" for reason, count in sorted(metrics['termination_reasons'].items())),
+        f" Generation Time: {record['timings']['generation_seconds']:.2f}s",
+        "-" * 50,
+    ]
+    
+    phases = record["timings"].get("phases")
+    if phases:
+        lines.append(" Phase Timings (total, per occurrence p50 / p95)")
+        for name, stats in sorted(phases.items(), key=lambda item: -item[1]["total_seconds"]):
+            line = f"  - {name}: {stats['total_seconds']:.2f}s over {stats['count']}"
+            if "p50_ms" in stats:
+                line += f", {stats['p50_ms']:.2f} / {stats['p95_ms']:.2f} ms"
+            lines.append(line)
+        lines.append("-" * 50)
+    
+    # Handle both 9-parameter and 15-parameter brains
+    if len(best_weights) == 15:
+        lines.append(" Enhanced Neural Network (15 parameters)")
+        lines.append(f"  - Hidden Layer Weights: {np.round(best_weights[:8], 3)}")
+        lines.append(f"  - Output Weights: {np.round(best_weights[8:12], 3)}")
+        lines.append(f"  - Biases: {np.round(best_weights[12:15], 3)}")
+    else:
+        lines.append(" Inherited Weights (Brain Parameters)")
+        weight_labels = [
+            "Food Bonus Weight", "Toward Food Weight", "Away Food Penalty", "Loop Penalty",
+            "Survival Bonus", "Wall Penalty", "Exploration Bonus", "Momentum Bonus",
+            "Dead-End Penalty"
+        ]
+        for label, weight in zip(weight_labels, best_weights):
+            lines.append(f"  - {label}: {weight:.3f}")
+    
+    if record.get("converged"):
+        lines.append("-" * 50)
+        lines.append(f" ⚠ Population appears to have converged (improvement rate: {record['improvement_rate']*100:.1f}%)")
+    
+    lines.append("=" * 50)
+    return lines
+
+
+def format_record(record):
+    """Format any training log record as console lines."""
+    event = record.get("event")
+    if event == "generation":
+        return format_generation_summary(record)
+    if event == "generation_start":
+        return [f"Generation {record['generation']} - Best Score: {record['best_score']}, "
+                f"Length: {record['best_length']}, Time: {record['elapsed_time']}s"]
+    if event == "early_stop":
+        return ["=" * 50, f" EARLY STOPPING: {record['reason']}", "=" * 50]
+    if event == "model_saved":
+        return [f" Saved best genome as '{record['name']}' ({record['param_count']} params, "
+                f"fitness {record['fitness']:.2f})"]
+    return [json.dumps(record, default=_to_json)]